@@ -71,6 +71,21 @@ if [[ ! "$SHORT_NAME" =~ ^[a-z][a-z0-9-]*$ ]]; then
     exit 1
 fi
 
+# Prefer the CLI when installed: it allocates numbers under a lock, so
+# parallel sessions never create two outcomes with the same number. Older
+# CLIs lack `outcome new`; probe for it and fall back to the steps below.
+if command -v companyspec >/dev/null 2>&1 \
+    && companyspec --no-banner outcome new --help >/dev/null 2>&1; then
+    CLI_ARGS=()
+    if [[ -n "$OUTCOME_NUMBER" ]]; then
+        CLI_ARGS+=(--number "$OUTCOME_NUMBER")
+    fi
+    if $JSON_OUTPUT; then
+        CLI_ARGS+=(--json)
+    fi
+    exec companyspec --no-banner outcome new ${CLI_ARGS[@]+"${CLI_ARGS[@]}"} "$SHORT_NAME"
+fi
+
 # Find repository root
 REPO_ROOT=$(find_repo_root) || {
     print_error "Not in a Company Context project"
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Synthetic engagement generator for benchmarks.
+
+Creates an engagement with numbered outcomes (outcome.md, strategy.md and a
+multi-phase tasks.md with [P]/[B] markers, KO references, sub-items and
+checkpoints), artifacts spread across the five artifact categories, and a
+deep `docs/` tree plus project manifests for discovery. Output is
+deterministic for a given seed.
+
+Usage:
+    python benchmarks/generate_engagement.py /tmp/bench --size medium
+    python benchmarks/generate_engagement.py /tmp/bench --outcomes 10000 --artifacts 100000
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+ARTIFACT_CATEGORIES = ["glossaries", "processes", "decisions", "authorities", "systems"]
+
+# Written at the root of a generated tree so runs can reuse it
+SPEC_FILE = ".bench.json"
+
+# Bump when the generated content changes, so stale trees are not reused
+GENERATOR_VERSION = 2
+
+WORDS = (
+    "account agent approval archive audit billing brand budget campaign channel "
+    "client compliance contract customer dashboard deadline delivery escalation "
+    "export finance forecast handoff incident invoice launch ledger license "
+    "meeting migration onboarding owner partner payroll pipeline policy pricing "
+    "procurement product quarterly quote record refund release renewal report "
+    "request review risk roadmap sales schedule security signoff support "
+    "supplier system team template ticket training vendor warehouse workflow"
+).split()
+
+VERBS = "Collect Draft Extract Interview Map Review Validate Reconcile Document Publish".split()
+
+
+@dataclass
+class EngagementSpec:
+    """Shape of a synthetic engagement."""
+
+    outcomes: int = 100
+    artifacts: int = 1000
+    docs: int = 200
+    docs_depth: int = 6
+    seed: int = 0
+
+
+PRESETS = {
+    "small": EngagementSpec(outcomes=100, artifacts=1000, docs=200, docs_depth=6),
+    "medium": EngagementSpec(outcomes=1000, artifacts=10000, docs=2000, docs_depth=8),
+    "large": EngagementSpec(outcomes=10000, artifacts=100000, docs=20000, docs_depth=12),
+}
+
+
+def _words(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _paragraph(rng: random.Random, sentences: int = 3) -> str:
+    return " ".join(_words(rng, rng.randint(6, 14)).capitalize() + "." for _ in range(sentences))
+
+
+def _slug(rng: random.Random) -> str:
+    return "-".join(rng.sample(WORDS, 2))
+
+
+def render_outcome(rng: random.Random, number: int, name: str) -> str:
+    # Only earlier outcomes, so the dependency graph stays acyclic
+    deps = sorted({rng.randint(1, number - 1) for _ in range(rng.randint(0, 2))}) if number > 1 else []
+    dependencies = "\n".join(f"- KO-{d:03d}: prerequisite" for d in deps) or "- None"
+    return f"""# Knowledge Outcome: {name}
+
+**ID**: KO-{number:03d} | **Branch**: `{number:03d}-{name}` | **Created**: 2025-01-01
+**Status**: In Progress
+
+---
+
+## Summary
+
+{_paragraph(rng)}
+
+---
+
+## Knowledge Artifact Definition
+
+### What We Need
+
+**Artifact Type**: {rng.choice(["Glossary", "Process Doc", "Decision Record", "Authority Map", "System Inventory"])}
+
+**Description**:
+{_paragraph(rng, 2)}
+
+### Why We Need It
+
+**AI Use Case**:
+{_paragraph(rng, 2)}
+
+**Priority**: {rng.choice(["P1", "P2", "P3"])}
+
+---
+
+## Acceptance Criteria
+
+### AC-1: {_words(rng, 3).title()}
+
+- Given {_words(rng, 4)}
+- When {_words(rng, 4)}
+- Then {_words(rng, 5)}
+
+---
+
+## Dependencies
+
+### Depends On
+
+{dependencies}
+"""
+
+
+def render_strategy(rng: random.Random, number: int, name: str) -> str:
+    sections = "\n\n".join(f"## {title}\n\n{_paragraph(rng)}" for title in ["Approach", "Sources", "Risks"])
+    return f"# Capture Strategy: {name}\n\n**Outcome**: KO-{number:03d} | **Branch**: `{number:03d}-{name}`\n\n{sections}\n"
+
+
+def render_tasks(rng: random.Random, number: int, name: str, total_outcomes: int) -> str:
+    lines = [
+        f"# Capture Tasks: {name}",
+        "",
+        f"**Outcome**: KO-{number:03d} | **Branch**: `{number:03d}-{name}`",
+        "",
+        "---",
+        "",
+    ]
+    task_id = 0
+    phases = rng.randint(3, 6)
+    # Earlier phases are more likely to be finished
+    done_until = rng.randint(0, phases)
+    for phase in range(1, phases + 1):
+        lines += [f"## Phase {phase}: {_words(rng, 2).title()}", "", f"*{_paragraph(rng, 1)}*", ""]
+        for _ in range(rng.randint(4, 15)):
+            task_id += 1
+            done = phase <= done_until or (phase == done_until + 1 and rng.random() < 0.4)
+            markers = []
+            if rng.random() < 0.4:
+                markers.append("[P]")
+            if rng.random() < 0.1:
+                markers.append("[B]")
+            if rng.random() < 0.3:
+                ref = rng.randint(1, total_outcomes) if rng.random() < 0.3 else number
+                markers.append(f"[KO-{ref:03d}]")
+            check = "x" if done else " "
+            lines.append(f"- [{check}] T{task_id:03d} {' '.join(markers + [rng.choice(VERBS), _words(rng, rng.randint(3, 8))])}")
+            if rng.random() < 0.15:
+                lines.append(f"  - Owner: {_words(rng, 1)}")
+                lines.append(f"  - [{check}] {_words(rng, 4)}")
+        lines += ["", f"**Phase {phase} Checkpoint**:", ""]
+        for _ in range(rng.randint(1, 4)):
+            lines.append(f"- [{'x' if phase <= done_until else ' '}] {_words(rng, 5)}")
+        lines += ["", "---", ""]
+    return "\n".join(lines)
+
+
+def render_artifact(rng: random.Random, category: str, title: str, total_outcomes: int) -> str:
+    lines = [f"# {title}", "", f"**Category**: {category} | **Source**: KO-{rng.randint(1, total_outcomes):03d}", ""]
+    if category == "glossaries":
+        lines += ["| Term | Definition |", "|------|------------|"]
+        for _ in range(rng.randint(5, 20)):
+            lines.append(f"| {_words(rng, 2).title()} | {_words(rng, rng.randint(6, 14))} |")
+    else:
+        for _ in range(rng.randint(2, 6)):
+            lines += [f"## {_words(rng, 3).title()}", "", _paragraph(rng, rng.randint(2, 5)), ""]
+    return "\n".join(lines) + "\n"
+
+
+def generate_engagement(root: Path, spec: EngagementSpec) -> None:
+    """Write outcomes and artifacts of an initialized-looking engagement to root."""
+    rng = random.Random(spec.seed)
+    context = root / ".context"
+    (context / "memory").mkdir(parents=True, exist_ok=True)
+    (context / "memory" / "constitution.md").write_text(
+        f"# Bench Engagement Constitution\n\n**Organization**: Bench\n\n## Mission\n\n{_paragraph(rng)}\n"
+    )
+
+    outcomes_dir = context / "outcomes"
+    for number in range(1, spec.outcomes + 1):
+        name = _slug(rng)
+        outcome_dir = outcomes_dir / f"{number:03d}-{name}"
+        (outcome_dir / "checklists").mkdir(parents=True, exist_ok=True)
+        (outcome_dir / "outcome.md").write_text(render_outcome(rng, number, name))
+        # Some outcomes are still at the outcome or strategy stage
+        stage = rng.random()
+        if stage > 0.1:
+            (outcome_dir / "strategy.md").write_text(render_strategy(rng, number, name))
+        if stage > 0.2:
+            (outcome_dir / "tasks.md").write_text(render_tasks(rng, number, name, spec.outcomes))
+
+    artifacts_dir = root / "context-artifacts"
+    for i in range(spec.artifacts):
+        category = ARTIFACT_CATEGORIES[i % len(ARTIFACT_CATEGORIES)]
+        # Spread files over subfolders so directories stay a realistic size
+        directory = artifacts_dir / category / f"area-{(i // len(ARTIFACT_CATEGORIES)) % 50:02d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        title = _words(rng, 3).title()
+        (directory / f"{i:06d}-{_slug(rng)}.md").write_text(render_artifact(rng, category, title, spec.outcomes))
+
+
+def generate_docs_project(root: Path, spec: EngagementSpec) -> None:
+    """Write a pre-existing project (README, manifests, deep docs/ tree) for discovery."""
+    rng = random.Random(spec.seed + 1)
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "README.md").write_text(
+        f"# Bench Project\n\n{_paragraph(rng)}\n\n## Purpose\n\n{_paragraph(rng)}\n\n"
+        f"## Constraints\n\n- {_words(rng, 6)}\n- {_words(rng, 6)}\n"
+    )
+    (root / "CLAUDE.md").write_text(f"# Agent Notes\n\n{_paragraph(rng)}\n")
+    (root / "package.json").write_text(json.dumps({"name": "bench-project", "description": _words(rng, 8)}, indent=2))
+    (root / "pyproject.toml").write_text(f'[project]\nname = "bench-project"\ndescription = "{_words(rng, 8)}"\n')
+
+    for i in range(spec.docs):
+        depth = rng.randint(1, spec.docs_depth)
+        directory = root / "docs"
+        for level in range(depth):
+            directory = directory / f"section-{rng.randint(0, 3)}-{level}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"page-{i:05d}.md").write_text(f"# {_words(rng, 3).title()}\n\n{_paragraph(rng, 4)}\n")
+
+    # Dependency noise that discovery should skip
+    noise = root / "node_modules" / "left-pad"
+    noise.mkdir(parents=True, exist_ok=True)
+    for i in range(min(spec.docs, 500)):
+        (noise / f"README-{i}.md").write_text("# left-pad\n")
+
+
+def ensure_generated(root: Path, spec: EngagementSpec, kind: str) -> bool:
+    """Generate root unless it already holds the same spec; return True if generated."""
+    marker = root / SPEC_FILE
+    wanted = {"kind": kind, "generator": GENERATOR_VERSION, **asdict(spec)}
+    try:
+        if json.loads(marker.read_text()) == wanted:
+            return False
+        # Generated by an older spec or generator version: replace it
+        shutil.rmtree(root)
+    except (OSError, ValueError):
+        pass
+    if root.exists() and any(root.iterdir()):
+        raise SystemExit(f"Refusing to generate into non-empty directory {root}")
+    if kind == "engagement":
+        generate_engagement(root, spec)
+    else:
+        generate_docs_project(root, spec)
+    marker.write_text(json.dumps(wanted))
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("root", type=Path, help="Directory to generate into (must be empty or missing)")
+    parser.add_argument("--size", choices=sorted(PRESETS), default="small", help="Preset size")
+    parser.add_argument("--outcomes", type=int, help="Number of outcomes (overrides preset)")
+    parser.add_argument("--artifacts", type=int, help="Number of artifacts (overrides preset)")
+    parser.add_argument("--docs", type=int, help="Number of docs/ pages (overrides preset)")
+    parser.add_argument("--docs-depth", type=int, help="Maximum docs/ nesting (overrides preset)")
+    parser.add_argument("--kind", choices=["engagement", "docs"], default="engagement", help="What to generate")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    spec = EngagementSpec(**asdict(PRESETS[args.size]))
+    for name in ("outcomes", "artifacts", "docs", "docs_depth"):
+        if getattr(args, name) is not None:
+            setattr(spec, name, getattr(args, name))
+    spec.seed = args.seed
+
+    generated = ensure_generated(args.root, spec, args.kind)
+    print(f"{'Generated' if generated else 'Reused'} {args.kind} at {args.root}: {asdict(spec)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the companyspec CLI.
+
+Generates (or reuses) a synthetic engagement and docs project with
+`generate_engagement.py`, times `init`, `check`, `list`,
+`discover_existing_context`, `search`, `analyze`, `glossary`, `dedupe` and
+`budget` against them, and compares the medians with the stored baselines
+in `benchmarks/baselines.json`. A scenario regresses when its median
+exceeds the baseline by more than the tolerance.
+
+Baselines are machine-specific: record them on the machine you compare on.
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # small preset
+    python benchmarks/run_benchmarks.py --size large --runs 3
+    python benchmarks/run_benchmarks.py --update-baseline    # record new baselines
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from generate_engagement import PRESETS, ensure_generated
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+BASELINES_FILE = BENCH_DIR / "baselines.json"
+
+BASELINES_VERSION = 1
+
+# Allowed slowdown over the baseline median before a scenario fails
+DEFAULT_TOLERANCE = 0.25
+
+CLI = [sys.executable, "-c", "import context_cli; context_cli.main()"]
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH", "")]))
+    env["COMPANYSPEC_NO_BANNER"] = "1"
+    return env
+
+
+def _run_cli(args: list, cwd: Path) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        CLI + args, cwd=cwd, env=_env(), stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def _drop_index(engagement: Path) -> None:
+    try:
+        (engagement / ".context" / "cache" / "index.json").unlink()
+    except FileNotFoundError:
+        pass
+
+
+def scenarios(workdir: Path, size: str) -> dict:
+    """Return {name: callable returning elapsed ms} for the given preset."""
+    spec = PRESETS[size]
+    engagement = workdir / "engagement"
+    docs_project = workdir / "docs-project"
+    init_root = workdir / "init"
+    for root, kind in ((engagement, "engagement"), (docs_project, "docs")):
+        if ensure_generated(root, spec, kind):
+            print(f"Generated {kind} in {root}")
+    init_root.mkdir(exist_ok=True)
+
+    counter = iter(range(1_000_000))
+
+    def init():
+        name = f"bench-{os.getpid()}-{next(counter)}"
+        return _run_cli(["init", name, "--org", "Bench", "--scope", "team", "--no-git"], init_root)
+
+    def cli_cold(*args):
+        def run():
+            _drop_index(engagement)
+            return _run_cli(list(args), engagement)
+        return run
+
+    def cli_warm(*args):
+        def run():
+            return _run_cli(list(args), engagement)
+        return run
+
+    def discover():
+        sys.path.insert(0, str(SRC_DIR))
+        from context_cli import discover_existing_context
+
+        start = time.perf_counter()
+        discover_existing_context(docs_project)
+        return (time.perf_counter() - start) * 1000
+
+    return {
+        "init": init,
+        "check (cold index)": cli_cold("check"),
+        "check (warm index)": cli_warm("check"),
+        "list (cold index)": cli_cold("--plain", "list"),
+        "list (warm index)": cli_warm("--plain", "list"),
+        "discover_existing_context": discover,
+        "search (warm index)": cli_warm("--plain", "search", "refund", "approval"),
+        "analyze (warm cache)": cli_warm("--plain", "analyze"),
+        "glossary (warm cache)": cli_warm("--plain", "glossary"),
+        "dedupe (warm cache)": cli_warm("--plain", "dedupe"),
+        "budget (warm cache)": cli_warm("--plain", "budget"),
+    }
+
+
+def load_baselines() -> dict:
+    try:
+        data = json.loads(BASELINES_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != BASELINES_VERSION:
+        return {}
+    return data.get("sizes", {})
+
+
+def save_baselines(sizes: dict) -> None:
+    data = {"version": BASELINES_VERSION, "sizes": sizes}
+    BASELINES_FILE.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", choices=sorted(PRESETS), default="small", help="Synthetic engagement preset")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per scenario (median is compared)")
+    parser.add_argument("--scenario", action="append", help="Only run scenarios whose name starts with this (repeatable)")
+    parser.add_argument("--workdir", type=Path, help="Where generated trees are kept (reused across runs)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown, e.g. 0.25 for 25%%")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the measured medians as the new baseline")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    workdir = args.workdir or Path(tempfile.gettempdir()) / "company-spec-bench" / args.size
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    selected = {
+        name: fn for name, fn in scenarios(workdir, args.size).items()
+        if not args.scenario or any(name.startswith(prefix) for prefix in args.scenario)
+    }
+
+    baselines = load_baselines()
+    baseline = baselines.get(args.size, {}).get("scenarios", {})
+
+    results = {}
+    regressions = []
+    for name, fn in selected.items():
+        fn()  # warm-up: imports, page cache and (for warm scenarios) the index
+        samples = [fn() for _ in range(max(1, args.runs))]
+        median = statistics.median(samples)
+        results[name] = {"median_ms": round(median, 1), "min_ms": round(min(samples), 1), "baseline_ms": baseline.get(name)}
+        if baseline.get(name) and median > baseline[name] * (1 + args.tolerance):
+            regressions.append(name)
+
+    if args.json:
+        print(json.dumps({"size": args.size, "runs": args.runs, "results": results, "regressions": regressions}, indent=2))
+    else:
+        print(f"{'scenario':<28} {'median':>10} {'min':>10} {'baseline':>10}")
+        for name, r in results.items():
+            base = f"{r['baseline_ms']:.1f}" if r["baseline_ms"] else "-"
+            flag = "  REGRESSION" if name in regressions else ""
+            print(f"{name:<28} {r['median_ms']:>10.1f} {r['min_ms']:>10.1f} {base:>10}{flag}")
+
+    if args.update_baseline:
+        entry = baselines.setdefault(args.size, {"scenarios": {}})
+        entry["scenarios"].update({name: r["median_ms"] for name, r in results.items()})
+        entry["machine"] = f"{platform.system()} {platform.machine()}, Python {platform.python_version()}"
+        save_baselines(baselines)
+        print(f"Baseline for '{args.size}' written to {BASELINES_FILE}")
+        return 0
+
+    if regressions:
+        print(f"FAIL: {len(regressions)} scenario(s) slower than baseline by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
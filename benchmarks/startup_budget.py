@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Startup budget check for the companyspec CLI.
+
+Imports `context_cli` under `python -X importtime` and fails when the
+cumulative import time exceeds the budget, or when a module that only the
+interactive UI needs (Rich, readchar) is loaded at import time.
+
+Usage:
+    python benchmarks/startup_budget.py
+    python benchmarks/startup_budget.py --budget-ms 150 --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Default cumulative import budget for `import context_cli`, in milliseconds
+DEFAULT_BUDGET_MS = 150.0
+
+# Modules that must not be imported on the fast-start path
+FORBIDDEN_MODULES = ["rich", "readchar"]
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH", "")]))
+    return env
+
+
+def measure_import_ms() -> float:
+    """Return the cumulative import time of context_cli in milliseconds."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import context_cli"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == "context_cli":
+            return int(parts[1]) / 1000.0
+    raise RuntimeError("context_cli not found in -X importtime output")
+
+
+def loaded_forbidden_modules() -> list:
+    """Return the forbidden top-level modules loaded by `import context_cli`."""
+    code = (
+        "import json, sys, context_cli; "
+        "print(json.dumps(sorted({m.split('.')[0] for m in sys.modules})))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=_env(), check=True
+    )
+    loaded = set(json.loads(proc.stdout))
+    return [m for m in FORBIDDEN_MODULES if m in loaded]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Import time budget in ms")
+    parser.add_argument("--runs", type=int, default=5, help="Number of measurements (median is compared)")
+    args = parser.parse_args()
+
+    forbidden = loaded_forbidden_modules()
+    samples = [measure_import_ms() for _ in range(max(1, args.runs))]
+    median = statistics.median(samples)
+
+    print(f"import context_cli: median {median:.1f} ms over {len(samples)} runs (budget {args.budget_ms:.0f} ms)")
+
+    ok = True
+    if forbidden:
+        print(f"FAIL: fast-start path imports {', '.join(forbidden)}")
+        ok = False
+    if median > args.budget_ms:
+        print(f"FAIL: startup budget exceeded by {median - args.budget_ms:.1f} ms")
+        ok = False
+
+    if ok:
+        print("OK")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
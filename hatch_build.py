@@ -0,0 +1,37 @@
+"""
+Hatch build hook that packs the templates into a single wheel resource.
+
+Writes `context_cli/templates.bundle.json` (every template, command and
+script with its sha256) into the wheel, so installed CLIs and zipapps load
+all templates with one read instead of probing the filesystem.
+"""
+
+import importlib.util
+import json
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class TemplateBundleHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        if self.target_name != "wheel":
+            return
+
+        root = Path(self.root)
+        # Load templates.py by path: the build environment lacks the CLI's dependencies
+        spec = importlib.util.spec_from_file_location(
+            "_company_spec_templates", root / "src" / "context_cli" / "templates.py"
+        )
+        templates = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(templates)
+
+        bundle = templates.build_bundle(root / ".context" / "templates")
+        out_dir = Path(tempfile.mkdtemp(prefix="company-spec-bundle-"))
+        out_path = out_dir / templates.BUNDLE_RESOURCE
+        out_path.write_text(json.dumps(bundle, separators=(",", ":")), encoding="utf-8")
+
+        build_data["force_include"][str(out_path)] = f"context_cli/{templates.BUNDLE_RESOURCE}"
@@ -13,28 +13,54 @@ Usage:
 Or install globally:
     uv tool install company-spec --from git+https://github.com/T-0-co/company-spec.git
     companyspec init <engagement-name>
+
+Startup:
+    Rich and readchar are imported lazily, so non-interactive invocations such
+    as `companyspec --plain list` (or COMPANYSPEC_PLAIN=1) never load them.
+    `python benchmarks/startup_budget.py` checks the import-time budget.
 """
 
 import os
+import re
 import subprocess
 import sys
 import shutil
 import json
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from datetime import datetime
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
-from rich.table import Table
-from rich.tree import Tree
-from rich.live import Live
 from typer.core import TyperGroup
 
-import readchar
+from .index import EngagementIndex, outcome_status
+from .manifests import EXTRACTORS, extract_manifests
+from .markdown import normalize_title, stream_section_map
+from .scanner import (
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_MAX_FILES,
+    DEFAULT_MAX_READ_BYTES,
+    read_lines,
+    read_many,
+    scan_project_docs,
+)
+from .status import (
+    DEFAULT_SCAN_WORKERS,
+    collect_status,
+    format_status,
+    iter_ndjson_records,
+    scan_engagements,
+    split_outcome_name,
+)
+from .templates import TemplateProvider, get_template_provider, sync_templates
+from .tokenizers import DEFAULT_TOKENIZER, TokenizerError
+from .trace import traced, tracer
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .batch import BatchEntry, BatchResult
 
 # Banner art
 BANNER = """
@@ -54,24 +80,72 @@ BANNER = """
 
 TAGLINE = "Company Spec - Knowledge Capture for AI Deployment (Built on Spec Kit)"
 
-console = Console()
+# Fast-start settings, set from the environment or the global CLI options
+settings = {
+    "banner": os.environ.get("COMPANYSPEC_NO_BANNER", "") in ("", "0"),
+    "plain": os.environ.get("COMPANYSPEC_PLAIN", "") not in ("", "0"),
+    "trace": os.environ.get("COMPANYSPEC_TRACE") or None,
+}
+
+_console = None
+
+
+def get_console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+class _LazyConsole:
+    """Proxy for the Rich console so importing the CLI does not load Rich."""
+
+    def __getattr__(self, name):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
 
 
 class StepTracker:
-    """Track and render hierarchical steps with live updates."""
+    """
+    Track and render hierarchical steps with live updates.
+
+    The tracker is passed to Rich's `Live` as its renderable, so updates only
+    change state and redraws happen at Live's own `refresh_per_second` rate,
+    however many steps are updated in between.
+    Steps added with a `group` are collapsed into a single counter line once
+    the group holds more than `collapse_threshold` steps, so trackers fed by
+    thousands of per-file or per-outcome steps stay cheap to render.
+    Each step records its duration in seconds.
+    """
+
+    SYMBOLS = {
+        "done": "[green]●[/green]",
+        "pending": "[green dim]○[/green dim]",
+        "running": "[cyan]○[/cyan]",
+        "error": "[red]●[/red]",
+        "skipped": "[yellow]○[/yellow]",
+    }
+    PLAIN_SYMBOLS = {"done": "●", "pending": "○", "running": "○", "error": "✗", "skipped": "-"}
+    FINISHED = ("done", "error", "skipped")
 
-    def __init__(self, title: str):
+    def __init__(self, title: str, collapse_threshold: int = 10):
         self.title = title
         self.steps = []
-        self._refresh_cb = None
+        self.groups = {}
+        self.collapse_threshold = collapse_threshold
+        self._by_key = {}
 
-    def attach_refresh(self, cb):
-        self._refresh_cb = cb
+    def add_group(self, group: str, label: str):
+        """Set the label shown for a group of steps."""
+        self.groups[group] = label
 
-    def add(self, key: str, label: str):
-        if key not in [s["key"] for s in self.steps]:
-            self.steps.append({"key": key, "label": label, "status": "pending", "detail": ""})
-            self._maybe_refresh()
+    def add(self, key: str, label: str, group: str = None):
+        if key not in self._by_key:
+            self._append({"key": key, "label": label, "status": "pending", "detail": "", "group": group})
 
     def start(self, key: str, detail: str = ""):
         self._update(key, status="running", detail=detail)
@@ -85,43 +159,100 @@ class StepTracker:
     def skip(self, key: str, detail: str = ""):
         self._update(key, status="skipped", detail=detail)
 
+    def durations(self) -> dict:
+        """Return {key: seconds} for every finished step that was started."""
+        return {s["key"]: s["duration"] for s in self.steps if s.get("duration") is not None}
+
+    def _append(self, step: dict):
+        step.setdefault("group", None)
+        step["started"] = time.perf_counter() if step["status"] == "running" else None
+        step["duration"] = None
+        self.steps.append(step)
+        self._by_key[step["key"]] = step
+        if step["group"] is not None:
+            self.groups.setdefault(step["group"], step["group"])
+
     def _update(self, key: str, status: str, detail: str):
-        for s in self.steps:
-            if s["key"] == key:
-                s["status"] = status
-                if detail:
-                    s["detail"] = detail
-                self._maybe_refresh()
-                return
-        self.steps.append({"key": key, "label": key, "status": status, "detail": detail})
-        self._maybe_refresh()
-
-    def _maybe_refresh(self):
-        if self._refresh_cb:
-            try:
-                self._refresh_cb()
-            except Exception:
-                pass
+        if tracer.enabled:
+            self._trace(key, status, detail)
+        step = self._by_key.get(key)
+        if step is None:
+            self._append({"key": key, "label": key, "status": status, "detail": detail})
+            return
+        now = time.perf_counter()
+        if status == "running":
+            step["started"] = now
+        elif status in self.FINISHED and step["started"] is not None:
+            step["duration"] = now - step["started"]
+        step["status"] = status
+        if detail:
+            step["detail"] = detail
+
+    def _trace(self, key: str, status: str, detail: str):
+        trace_key = (id(self), key)
+        step = self._by_key.get(key)
+        label = step["label"] if step else key
+        if status == "running":
+            tracer.begin(trace_key, f"{self.title}: {label}", cat="step")
+        else:
+            tracer.end(trace_key, f"{self.title}: {label}", cat="step", status=status, detail=detail)
+
+    def _rows(self) -> list:
+        """Return (status, label, detail) rows, collapsing large groups into counters."""
+        members = {}
+        for step in self.steps:
+            if step["group"] is not None:
+                members.setdefault(step["group"], []).append(step)
+
+        rows = []
+        emitted = set()
+        for step in self.steps:
+            group = step["group"]
+            if group is None or len(members[group]) <= self.collapse_threshold:
+                rows.append((step["status"], step["label"], step["detail"].strip() if step["detail"] else "", None))
+                continue
+            if group in emitted:
+                continue
+            emitted.add(group)
+            rows.append(self._group_row(self.groups[group], members[group]))
+        return rows
+
+    def _group_row(self, label: str, steps: list) -> tuple:
+        counts = {}
+        for step in steps:
+            counts[step["status"]] = counts.get(step["status"], 0) + 1
+        finished = sum(counts.get(status, 0) for status in self.FINISHED)
+        total = len(steps)
+
+        if finished == total:
+            status = "error" if counts.get("error") else "done"
+        elif finished or counts.get("running"):
+            status = "running"
+        else:
+            status = "pending"
+
+        parts = [f"{finished}/{total}"]
+        if counts.get("error"):
+            parts.append(f"{counts['error']} failed")
+        if counts.get("skipped"):
+            parts.append(f"{counts['skipped']} skipped")
+        running = next((s for s in reversed(steps) if s["status"] == "running"), None)
+        if running is not None:
+            parts.append(running["label"])
+        return status, label, ", ".join(parts), finished / total
+
+    def __rich__(self):
+        return self.render()
 
     def render(self):
+        from rich.tree import Tree
+
         tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
-        for step in self.steps:
-            label = step["label"]
-            detail_text = step["detail"].strip() if step["detail"] else ""
-            status = step["status"]
-
-            if status == "done":
-                symbol = "[green]●[/green]"
-            elif status == "pending":
-                symbol = "[green dim]○[/green dim]"
-            elif status == "running":
-                symbol = "[cyan]○[/cyan]"
-            elif status == "error":
-                symbol = "[red]●[/red]"
-            elif status == "skipped":
-                symbol = "[yellow]○[/yellow]"
-            else:
-                symbol = " "
+        for status, label, detail_text, progress in self._rows():
+            symbol = self.SYMBOLS.get(status, " ")
+            if progress is not None:
+                filled = int(progress * 20)
+                label = f"{label} [cyan]{'━' * filled}[/cyan][grey50]{'━' * (20 - filled)}[/grey50]"
 
             if status == "pending":
                 if detail_text:
@@ -137,9 +268,21 @@ class StepTracker:
             tree.add(line)
         return tree
 
+    def render_plain(self) -> str:
+        """Render the steps as plain text without loading Rich."""
+        lines = [self.title]
+        for status, label, detail_text, _progress in self._rows():
+            line = f"  {self.PLAIN_SYMBOLS.get(status, ' ')} {label}"
+            if detail_text:
+                line += f" ({detail_text})"
+            lines.append(line)
+        return "\n".join(lines)
+
 
 def get_key():
     """Get a single keypress in a cross-platform way."""
+    import readchar
+
     key = readchar.readkey()
 
     if key == readchar.key.UP or key == readchar.key.CTRL_P:
@@ -158,6 +301,10 @@ def get_key():
 
 def select_with_arrows(options: dict, prompt_text: str = "Select an option", default_key: str = None) -> str:
     """Interactive selection using arrow keys."""
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.table import Table
+
     option_keys = list(options.keys())
     if default_key and default_key in option_keys:
         selected_index = option_keys.index(default_key)
@@ -222,7 +369,13 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
 
 
 def show_banner():
-    """Display the ASCII art banner."""
+    """Display the ASCII art banner (unless disabled by --no-banner or --plain)."""
+    if not settings["banner"] or settings["plain"]:
+        return
+
+    from rich.align import Align
+    from rich.text import Text
+
     banner_lines = BANNER.strip().split('\n')
     colors = ["bright_blue", "blue", "cyan", "bright_cyan", "white", "bright_white"]
 
@@ -253,12 +406,50 @@ app = typer.Typer(
 
 
 @app.callback()
-def callback(ctx: typer.Context):
+def callback(
+    ctx: typer.Context,
+    no_banner: bool = typer.Option(False, "--no-banner", help="Skip the ASCII banner (or set COMPANYSPEC_NO_BANNER=1)"),
+    plain: bool = typer.Option(False, "--plain", help="Plain-text output without Rich, for hooks and scripts (or set COMPANYSPEC_PLAIN=1)"),
+    trace: Optional[Path] = typer.Option(None, "--trace", help="Write a Chrome trace of this run to a file (or set COMPANYSPEC_TRACE=file)"),
+):
     """Show banner when no subcommand is provided."""
+    if no_banner:
+        settings["banner"] = False
+    if plain:
+        settings["plain"] = True
+    if trace:
+        settings["trace"] = str(trace)
+    if settings["trace"]:
+        start_trace(ctx)
+
     if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
         show_banner()
-        console.print(Align.center("[dim]Run 'companyspec --help' for usage information[/dim]"))
-        console.print()
+        if settings["plain"]:
+            print("Run 'companyspec --help' for usage information")
+        elif settings["banner"]:
+            from rich.align import Align
+            console.print(Align.center("[dim]Run 'companyspec --help' for usage information[/dim]"))
+            console.print()
+
+
+def start_trace(ctx: typer.Context):
+    """Trace the invoked command; write the trace and print a summary when it ends."""
+    tracer.enable()
+    command = f"companyspec {ctx.invoked_subcommand or ''}".strip()
+    tracer.begin("command", command, cat="command")
+
+    def finish():
+        tracer.end("command")
+        path = Path(settings["trace"])
+        try:
+            tracer.write(path)
+        except OSError as e:
+            print(f"Could not write trace to {path}: {e}", file=sys.stderr)
+            return
+        print(f"\nTrace written to {path}", file=sys.stderr)
+        print(tracer.format_summary(), file=sys.stderr)
+
+    ctx.call_on_close(finish)
 
 
 def is_git_repo(path: Path = None) -> bool:
@@ -281,67 +472,88 @@ def is_git_repo(path: Path = None) -> bool:
         return False
 
 
-def init_git_repo(project_path: Path, quiet: bool = False):
-    """Initialize a git repository in the specified path."""
-    try:
-        original_cwd = Path.cwd()
-        os.chdir(project_path)
-        if not quiet:
-            console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit from Context Framework"], check=True, capture_output=True, text=True)
-        if not quiet:
-            console.print("[green]✓[/green] Git repository initialized")
-        return True, None
-
-    except subprocess.CalledProcessError as e:
-        error_msg = f"Command: {' '.join(e.cmd)}\nExit code: {e.returncode}"
-        if e.stderr:
-            error_msg += f"\nError: {e.stderr.strip()}"
-        if not quiet:
-            console.print(f"[red]Error initializing git repository:[/red] {e}")
-        return False, error_msg
-    finally:
-        os.chdir(original_cwd)
+GIT_COMMIT_MESSAGE = "Initial commit from Context Framework"
 
+GIT_STAGE_MODES = ("all", "created")
 
-def get_templates_dir() -> Path:
-    """Get the path to the templates directory."""
-    # First check if running from source (development)
-    source_templates = Path(__file__).parent.parent.parent / ".context" / "templates"
-    if source_templates.exists():
-        return source_templates
 
-    # Check shared-data location (wheel install via uv tool or pip)
-    # pyproject.toml installs templates to share/company-spec/templates
-    import sysconfig
-    shared_data = Path(sysconfig.get_path('data')) / 'share' / 'company-spec' / 'templates'
-    if shared_data.exists():
-        return shared_data
+def _git_error(e: subprocess.CalledProcessError) -> str:
+    error_msg = f"Command: {' '.join(e.cmd)}\nExit code: {e.returncode}"
+    if e.stderr:
+        error_msg += f"\nError: {e.stderr.strip()}"
+    return error_msg
 
-    # Check installed package location
-    import importlib.resources
-    try:
-        with importlib.resources.files("context_cli").joinpath("templates") as p:
-            if p.exists():
-                return Path(p)
-    except Exception:
-        pass
 
-    # Fallback to current directory's .context/templates
-    local_templates = Path.cwd() / ".context" / "templates"
-    if local_templates.exists():
-        return local_templates
+class GitSetup:
+    """
+    Initialize a repository in project_path without touching the process cwd.
+
+    `git init` is started in the background on construction, so it runs
+    while templates are copied and the constitution is written; `finish()`
+    then stages and commits. Every git call runs with `cwd=project_path`,
+    which makes setups in different directories safe to run from threads.
+    """
 
-    return None
+    def __init__(self, project_path: Path):
+        self.project_path = project_path
+        self._result = None
+        tracer.begin((id(self), "git init"), "git init", cat="git")
+        self._init = subprocess.Popen(
+            ["git", "init"], cwd=project_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+
+    def wait(self):
+        """Wait for `git init`; return its exit code and error output."""
+        if self._result is None:
+            _stdout, stderr = self._init.communicate()
+            tracer.end((id(self), "git init"), "git init", cat="git")
+            self._result = (self._init.returncode, stderr)
+        return self._result
 
+    def _run(self, args: list, name: str):
+        with tracer.span(name, cat="git"):
+            subprocess.run(args, cwd=self.project_path, check=True, capture_output=True, text=True)
 
-def copy_templates(dest_path: Path, tracker: StepTracker = None):
+    def finish(self, paths: Optional[list] = None):
+        """Stage paths (everything when None) and commit; return (success, error message)."""
+        try:
+            returncode, stderr = self.wait()
+            if returncode:
+                raise subprocess.CalledProcessError(returncode, self._init.args, stderr=stderr)
+            self._run(["git", "add", "--", *(paths if paths is not None else ["."])], "git add")
+            self._run(["git", "commit", "-m", GIT_COMMIT_MESSAGE], "git commit")
+            return True, None
+        except subprocess.CalledProcessError as e:
+            return False, _git_error(e)
+
+
+@traced()
+def init_git_repo(project_path: Path, quiet: bool = False, paths: Optional[list] = None):
+    """Initialize a git repository in the specified path (staging only paths, if given)."""
+    if not quiet:
+        console.print("[cyan]Initializing git repository...[/cyan]")
+    success, error_msg = GitSetup(project_path).finish(paths)
+    if not quiet:
+        if success:
+            console.print("[green]✓[/green] Git repository initialized")
+        else:
+            console.print(f"[red]Error initializing git repository:[/red] {error_msg}")
+    return success, error_msg
+
+
+def created_paths(provider: TemplateProvider) -> list:
+    """Return the files init writes, relative to the engagement root."""
+    paths = [f".context/{rel}" for rel in provider.sources]
+    paths += [".context/manifest.json", ".context/memory/constitution.md"]
+    return sorted(paths)
+
+
+@traced()
+def copy_templates(dest_path: Path, tracker: StepTracker = None, provider: TemplateProvider = None):
     """Copy template files to the destination directory."""
-    templates_dir = get_templates_dir()
+    provider = provider or get_template_provider()
 
-    if templates_dir is None or not templates_dir.exists():
+    if provider is None:
         if tracker:
             tracker.error("templates", "templates directory not found")
         return False
@@ -359,31 +571,9 @@ def copy_templates(dest_path: Path, tracker: StepTracker = None):
     for d in dirs_to_create:
         d.mkdir(parents=True, exist_ok=True)
 
-    # Copy templates
-    if (templates_dir / "constitution-template.md").exists():
-        shutil.copy(templates_dir / "constitution-template.md", context_dir / "templates")
-    if (templates_dir / "outcome-template.md").exists():
-        shutil.copy(templates_dir / "outcome-template.md", context_dir / "templates")
-    if (templates_dir / "strategy-template.md").exists():
-        shutil.copy(templates_dir / "strategy-template.md", context_dir / "templates")
-    if (templates_dir / "tasks-template.md").exists():
-        shutil.copy(templates_dir / "tasks-template.md", context_dir / "templates")
-
-    # Copy commands
-    commands_dir = templates_dir / "commands"
-    if commands_dir.exists():
-        for cmd_file in commands_dir.glob("*.md"):
-            shutil.copy(cmd_file, context_dir / "templates" / "commands")
-
-    # Copy scripts
-    scripts_src = templates_dir.parent / "scripts" / "bash"
-    if scripts_src.exists():
-        for script in scripts_src.glob("*.sh"):
-            dest_script = context_dir / "scripts" / "bash" / script.name
-            shutil.copy(script, dest_script)
-            # Make executable on Unix
-            if os.name != "nt":
-                os.chmod(dest_script, 0o755)
+    # Copy templates, commands and scripts (only files whose content changed)
+    with tracer.span("sync_templates"):
+        sync_templates(provider, context_dir, force=True)
 
     # Create context-artifacts directory
     artifacts_dir = dest_path / "context-artifacts"
@@ -396,16 +586,18 @@ def copy_templates(dest_path: Path, tracker: StepTracker = None):
     return True
 
 
-def create_initial_constitution(dest_path: Path, org: str, scope: str, goal: str, tracker: StepTracker = None):
+@traced()
+def create_initial_constitution(
+    dest_path: Path, org: str, scope: str, goal: str, tracker: StepTracker = None, provider: TemplateProvider = None
+):
     """Create an initial constitution file with provided values."""
-    templates_dir = get_templates_dir()
-    if templates_dir is None:
+    provider = provider or get_template_provider()
+    if provider is None:
         if tracker:
             tracker.error("constitution", "templates not found")
         return False
 
-    template_path = templates_dir / "constitution-template.md"
-    if not template_path.exists():
+    if not provider.has("templates/constitution-template.md"):
         if tracker:
             tracker.error("constitution", "template not found")
         return False
@@ -413,7 +605,7 @@ def create_initial_constitution(dest_path: Path, org: str, scope: str, goal: str
     constitution_path = dest_path / ".context" / "memory" / "constitution.md"
 
     # Read template
-    content = template_path.read_text()
+    content = provider.read_text("templates/constitution-template.md")
 
     # Replace placeholders
     today = datetime.now().strftime("%Y-%m-%d")
@@ -450,14 +642,33 @@ def create_initial_constitution(dest_path: Path, org: str, scope: str, goal: str
     return True
 
 
-def discover_existing_context(project_path: Path) -> dict:
+# Longest intent paragraph kept from an existing document (characters)
+DISCOVERY_MAX_PARAGRAPH = 2000
+
+
+@traced()
+def discover_existing_context(
+    project_path: Path,
+    excludes: Optional[list] = None,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    max_files: int = DEFAULT_MAX_FILES,
+    max_read_bytes: int = DEFAULT_MAX_READ_BYTES,
+) -> dict:
     """
     Scan the project directory for existing documentation and context.
 
+    The project is walked once (see context_cli.scanner); vendored and build
+    directories plus any `excludes` patterns are pruned, and the walk stops
+    at `max_depth` / `max_files`. Files are streamed rather than loaded: at
+    most `max_read_bytes` are read from each, binary files are skipped, and
+    a document is no longer read once it has a constraints section and no
+    later heading could change the intent picked from it.
+
     Returns a dict with:
     - docs_found: list of documentation files found
     - frameworks_found: list of existing frameworks detected
-    - extracted_context: dict with any extracted project info (scope, goals, etc.)
+    - extracted_context: dict with any extracted project info (name,
+      description, workspace members, intent, constraints, ...)
     - warnings: list of potential conflicts or considerations
     """
     result = {
@@ -475,74 +686,35 @@ def discover_existing_context(project_path: Path) -> dict:
         "specs/": "Specs directory",
     }
 
-    # Common documentation locations to check
-    doc_locations = [
-        project_path,
-        project_path / "docs",
-        project_path / ".claude",
-        project_path / ".github",
-    ]
-
     # Patterns that indicate project documentation (case-insensitive matching)
     project_doc_patterns = [
         "readme", "claude", "project", "mission", "about", "overview",
         "contributing", "architecture", "structure", "goals",
     ]
 
-    # Package/config files that may contain project info
-    package_files = [
-        "package.json", "pyproject.toml", "Cargo.toml", "go.mod",
-        "composer.json", "Gemfile", "pom.xml", "build.gradle",
-    ]
-
-    # Scan for documentation files
-    seen_paths = set()
-
-    for location in doc_locations:
-        if not location.exists():
-            continue
-
-        # Find markdown and text files
-        for ext in ["*.md", "*.txt", "*.rst"]:
-            for doc_file in location.glob(ext):
-                rel_path = doc_file.relative_to(project_path)
-                if str(rel_path) not in seen_paths:
-                    seen_paths.add(str(rel_path))
-                    result["docs_found"].append(str(rel_path))
-
-        # Also check subdirectories for docs/ folder
-        if location == project_path:
-            docs_dir = location / "docs"
-            if docs_dir.exists():
-                for md_file in docs_dir.rglob("*.md"):
-                    rel_path = md_file.relative_to(project_path)
-                    if str(rel_path) not in seen_paths:
-                        seen_paths.add(str(rel_path))
-                        result["docs_found"].append(str(rel_path))
-
-    # Check for package files
-    for pkg_file in package_files:
-        pkg_path = project_path / pkg_file
-        if pkg_path.exists():
-            result["docs_found"].append(pkg_file)
-            # Try to extract project name/description from package files
-            try:
-                content = pkg_path.read_text()
-                if pkg_file == "package.json":
-                    import json
-                    data = json.loads(content)
-                    if "description" in data:
-                        result["extracted_context"]["project_description"] = data["description"]
-                elif pkg_file == "pyproject.toml":
-                    # Simple extraction without toml library
-                    for line in content.split("\n"):
-                        if line.strip().startswith("description"):
-                            desc = line.split("=", 1)[-1].strip().strip('"\'')
-                            if desc:
-                                result["extracted_context"]["project_description"] = desc
-                            break
-            except Exception:
-                pass
+    # Scan for documentation files in a single pruned walk
+    scan = scan_project_docs(project_path, excludes=excludes, max_depth=max_depth, max_files=max_files)
+    result["docs_found"].extend(scan.docs)
+
+    # Extract name, description and workspace members from the root package
+    # manifests, parsing the ones present concurrently
+    present_packages = [f for f in EXTRACTORS if f in scan.root_entries]
+    packages = extract_manifests(project_path, present_packages, max_read_bytes)
+    result["docs_found"].extend(f for f in present_packages if (project_path / f).is_file())
+    extracted = result["extracted_context"]
+    members = {}
+    for info in packages:
+        if info.name and "project_name" not in extracted:
+            extracted["project_name"] = info.name
+        if info.description and "project_description" not in extracted:
+            extracted["project_description"] = info.description
+            extracted["description_source"] = info.manifest
+        members.update(dict.fromkeys(info.members))
+    if members:
+        extracted["workspace_members"] = list(members)
+    described = [info.to_dict() for info in packages if info.name or info.description or info.members]
+    if described:
+        extracted["packages"] = described
 
     # Check for existing frameworks
     for pattern, name in framework_patterns.items():
@@ -577,60 +749,72 @@ def discover_existing_context(project_path: Path) -> dict:
 
     sorted_docs = sorted(result["docs_found"], key=doc_priority)
 
-    # Headers that typically contain project intent/purpose
+    # Headers that typically contain project intent/purpose, as (level, title)
     intent_headers = [
-        "## intent", "## purpose", "## overview", "## about", "## summary",
-        "## description", "## what is", "## goal", "## goals", "## objective",
-        "# intent", "# purpose", "# overview", "# about",
+        (2, "intent"), (2, "purpose"), (2, "overview"), (2, "about"), (2, "summary"),
+        (2, "description"), (2, "what is"), (2, "goal"), (2, "goals"), (2, "objective"),
+        (1, "intent"), (1, "purpose"), (1, "overview"), (1, "about"),
     ]
 
-    # Headers that indicate constraints/scope
+    # Headers that indicate constraints/scope (matched at level 2 and deeper)
     constraint_headers = [
-        "## must not", "## non-goals", "## non goals", "## out of scope",
-        "## constraints", "## limitations", "## boundaries", "### must not",
+        "must not", "non-goals", "non goals", "out of scope",
+        "constraints", "limitations", "boundaries",
     ]
 
-    # Extract context from high-priority docs
-    for doc_path in sorted_docs[:5]:  # Check top 5 priority docs
-        full_path = project_path / doc_path
-        if not full_path.exists() or not full_path.is_file():
+    constraint_keys = tuple(normalize_title(h) for h in constraint_headers)
+
+    def intent_settled(sections) -> bool:
+        # True once reading further cannot change the intent a full read picks:
+        # every header ranked above the chosen one is known to be missing its
+        # paragraph. A header not seen yet, or still waiting for body text,
+        # may yet win.
+        for level, title in intent_headers:
+            section = sections.find(title, level)
+            if section is None or (not section.first_paragraph and section.end == -1):
+                return False
+            if section.first_paragraph:
+                return True
+        return True
+
+    def read_doc_sections(path: Path):
+        has_constraints = False
+
+        def found_both(sections) -> bool:
+            # Called as the map grows: only the newest heading can be a new constraints section
+            nonlocal has_constraints
+            newest = sections.sections[-1]
+            if newest.level >= 2 and newest.key.startswith(constraint_keys):
+                has_constraints = True
+            return has_constraints and intent_settled(sections)
+
+        return stream_section_map(read_lines(path, max_read_bytes), stop=found_both, max_paragraph=DISCOVERY_MAX_PARAGRAPH)
+
+    # Extract context from high-priority docs, streaming the top 5 concurrently
+    top_docs = [d for d in sorted_docs[:5] if (project_path / d).is_file()]
+    section_maps = read_many([project_path / d for d in top_docs], read_doc_sections)
+
+    for doc_path, sections in zip(top_docs, section_maps):
+        if isinstance(sections, Exception):
             continue
 
-        try:
-            content = full_path.read_text(errors="ignore")
-            lower_content = content.lower()
-
-            # Track which file we extracted from
-            source_file = doc_path
-
-            # Look for intent/purpose
-            if "intent" not in result["extracted_context"]:
-                for header in intent_headers:
-                    if header in lower_content:
-                        lines = content.split("\n")
-                        for i, line in enumerate(lines):
-                            if line.strip().lower() == header.strip():
-                                # Get the next non-empty, non-header line
-                                for j in range(i + 1, min(i + 5, len(lines))):
-                                    next_line = lines[j].strip()
-                                    if next_line and not next_line.startswith("#"):
-                                        result["extracted_context"]["intent"] = next_line
-                                        result["extracted_context"]["intent_source"] = source_file
-                                        break
-                                break
-                        if "intent" in result["extracted_context"]:
-                            break
-
-            # Look for constraints/non-goals
-            if "has_constraints" not in result["extracted_context"]:
-                for header in constraint_headers:
-                    if header in lower_content:
-                        result["extracted_context"]["has_constraints"] = True
-                        result["extracted_context"]["constraints_source"] = source_file
-                        break
+        # Track which file we extracted from
+        source_file = doc_path
+
+        # Look for intent/purpose
+        if "intent" not in result["extracted_context"]:
+            for level, title in intent_headers:
+                section = sections.find(title, level)
+                if section is not None and section.first_paragraph:
+                    result["extracted_context"]["intent"] = section.first_paragraph
+                    result["extracted_context"]["intent_source"] = source_file
+                    break
 
-        except Exception:
-            pass
+        # Look for constraints/non-goals
+        if "has_constraints" not in result["extracted_context"]:
+            if sections.find_prefix(constraint_headers, min_level=2) is not None:
+                result["extracted_context"]["has_constraints"] = True
+                result["extracted_context"]["constraints_source"] = source_file
 
     # Check CLAUDE.md for project context
     claude_paths = [project_path / "CLAUDE.md", project_path / ".claude" / "CLAUDE.md"]
@@ -649,10 +833,13 @@ def discover_existing_context(project_path: Path) -> dict:
     if len(result["docs_found"]) > 5:
         result["warnings"].append(f"Found {len(result['docs_found'])} existing docs - consider reviewing before capture")
 
+    if scan.truncated:
+        result["warnings"].append(f"Stopped scanning after {max_files} docs - use --exclude to skip large directories")
+
     return result
 
 
-def display_discovery_results(discovery: dict, console: Console) -> bool:
+def display_discovery_results(discovery: dict, console: "Console") -> bool:
     """
     Display discovery results and ask user how to proceed.
     Returns True if user wants to continue, False to abort.
@@ -684,11 +871,19 @@ def display_discovery_results(discovery: dict, console: Console) -> bool:
     # Show extracted context
     if discovery["extracted_context"]:
         console.print("[yellow]Extracted project context:[/yellow]")
+        if discovery["extracted_context"].get("project_name"):
+            console.print(f"  Name: [green]{discovery['extracted_context']['project_name']}[/green]")
         if discovery["extracted_context"].get("project_description"):
             desc = discovery["extracted_context"]["project_description"]
+            source = discovery["extracted_context"].get("description_source", "")
             if len(desc) > 100:
                 desc = desc[:100] + "..."
-            console.print(f"  Description: [green]{desc}[/green]")
+            source_hint = f" [dim](from {source})[/dim]" if source else ""
+            console.print(f"  Description: [green]{desc}[/green]{source_hint}")
+        if discovery["extracted_context"].get("workspace_members"):
+            members = discovery["extracted_context"]["workspace_members"]
+            shown = ", ".join(members[:5]) + (f", ... ({len(members) - 5} more)" if len(members) > 5 else "")
+            console.print(f"  Workspace members: [green]{len(members)}[/green] [dim]({shown})[/dim]")
         if discovery["extracted_context"].get("intent"):
             intent = discovery["extracted_context"]["intent"]
             source = discovery["extracted_context"].get("intent_source", "")
@@ -735,6 +930,117 @@ SCOPE_OPTIONS = {
 }
 
 
+def init_engagement(
+    entry: "BatchEntry", provider: TemplateProvider, git: bool = True, force: bool = False, stage: str = "all"
+) -> "BatchResult":
+    """Create one engagement of a batch, without discovery or prompts."""
+    from .batch import BatchResult
+
+    target = entry.target
+    if target.exists() and not force and any(target.iterdir()):
+        return BatchResult(entry, "skipped", "directory not empty (use --force)")
+
+    target.mkdir(parents=True, exist_ok=True)
+    git_setup = None
+    if git and not is_git_repo(target):
+        git_setup = GitSetup(target)
+
+    try:
+        if not copy_templates(target, provider=provider):
+            return BatchResult(entry, "failed", "templates not found")
+        if not create_initial_constitution(target, entry.org, entry.scope, entry.goal, provider=provider):
+            return BatchResult(entry, "failed", "constitution template not found")
+    finally:
+        if git_setup is not None:
+            git_setup.wait()
+
+    if not git:
+        return BatchResult(entry, "created", "no git")
+    if git_setup is None:
+        return BatchResult(entry, "created", "existing git repo")
+    success, error_msg = git_setup.finish(created_paths(provider) if stage == "created" else None)
+    if not success:
+        # As with a single init, the engagement is usable without its repository
+        return BatchResult(entry, "created", "git failed: " + (error_msg.splitlines()[-1] if error_msg else "unknown error"))
+    return BatchResult(entry, "created", "git initialized")
+
+
+def init_batch(manifest: Path, force: bool = False, no_git: bool = False, jobs: int = 0, stage: str = "all") -> list:
+    """Create every engagement listed in manifest on a thread pool and print a summary."""
+    from .batch import BatchEntry, BatchError, BatchResult, load_batch_manifest, run_batch
+
+    try:
+        entries = load_batch_manifest(manifest, scopes=SCOPE_OPTIONS)
+    except BatchError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        raise typer.Exit(1)
+
+    provider = get_template_provider()
+    if provider is None:
+        print("Error: templates directory not found", file=sys.stderr)
+        raise typer.Exit(1)
+    # Read the template set once; every worker writes from the same bytes
+    provider = provider.preload()
+
+    git = not no_git and shutil.which("git") is not None
+    if not no_git and not git:
+        print("Git not found - skipping repository initialization", file=sys.stderr)
+
+    def worker(entry: BatchEntry) -> BatchResult:
+        return init_engagement(entry, provider, git=git, force=force, stage=stage)
+
+    cwd = Path.cwd()
+
+    def display(path: Path) -> str:
+        try:
+            return path.relative_to(cwd).as_posix()
+        except ValueError:
+            return str(path)
+
+    if settings["plain"]:
+        results = run_batch(entries, worker, jobs=jobs or None)
+        for r in results:
+            print(f"{r.status}\t{display(r.entry.target)}\t{r.entry.org}\t{r.detail}\t{r.seconds:.2f}")
+    else:
+        from rich.live import Live
+        from rich.table import Table
+
+        tracker = StepTracker(f"Initialize {len(entries)} engagements")
+        tracker.add_group("engagements", "Create engagements")
+        for entry in entries:
+            tracker.add(str(entry.row), display(entry.target), group="engagements")
+
+        def on_result(r: BatchResult):
+            {"created": tracker.complete, "skipped": tracker.skip}.get(r.status, tracker.error)(str(r.entry.row), r.detail)
+
+        with Live(tracker, console=get_console(), refresh_per_second=8, transient=True):
+            results = run_batch(entries, worker, jobs=jobs or None, on_result=on_result)
+
+        styles = {"created": "green", "skipped": "yellow", "failed": "red"}
+        table = Table(title="Batch Initialization", border_style="cyan")
+        table.add_column("Engagement", style="cyan")
+        table.add_column("Organization")
+        table.add_column("Scope", style="dim")
+        table.add_column("Status")
+        table.add_column("Detail", style="dim")
+        table.add_column("Time", justify="right", style="dim")
+        for r in results:
+            style = styles.get(r.status, "white")
+            table.add_row(
+                display(r.entry.target), r.entry.org, r.entry.scope,
+                f"[{style}]{r.status}[/{style}]", r.detail, f"{r.seconds:.2f}s",
+            )
+        console.print(table)
+
+    counts = {status: sum(r.status == status for r in results) for status in ("created", "skipped", "failed")}
+    summary = f"{counts['created']} created, {counts['skipped']} skipped, {counts['failed']} failed"
+    if settings["plain"]:
+        print(summary, file=sys.stderr)
+    else:
+        console.print(f"[bold]{summary}[/bold]")
+    return results
+
+
 @app.command()
 def init(
     engagement_name: str = typer.Argument(None, help="Name for your engagement (or '.' for current directory)"),
@@ -744,6 +1050,11 @@ def init(
     here: bool = typer.Option(False, "--here", help="Initialize in the current directory"),
     force: bool = typer.Option(False, "--force", help="Force initialization even if directory not empty"),
     no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization"),
+    exclude: Optional[list[str]] = typer.Option(None, "--exclude", help="Glob pattern of directories to skip during discovery (repeatable)"),
+    max_read_bytes: int = typer.Option(DEFAULT_MAX_READ_BYTES, "--max-read-bytes", help="Bytes read at most from each file during discovery"),
+    batch: Optional[Path] = typer.Option(None, "--batch", help="Create every engagement listed in a JSON or CSV manifest"),
+    jobs: int = typer.Option(0, "--jobs", "-j", help="Parallel workers for --batch (default: based on CPU count)"),
+    git_stage: str = typer.Option("all", "--git-stage", help="What the initial commit stages: all, or only the files init created"),
 ):
     """
     Initialize a new Company Context Framework engagement.
@@ -760,13 +1071,39 @@ def init(
     and other documentation to help you understand what context already
     exists before setting up the framework.
 
+    With --batch, every engagement in a manifest (columns org, target,
+    scope, goal) is created in parallel without discovery or prompts, and
+    a per-engagement summary is printed. Exits with status 1 if any fails.
+
     Examples:
         companyspec init acme-marketing --org "Acme Corp" --scope team
         companyspec init . --org "Startup Inc"
         companyspec init --here --org "BigCo" --scope department --goal "AI customer support"
+        companyspec init --batch teams.csv --jobs 8
     """
     show_banner()
 
+    if git_stage not in GIT_STAGE_MODES:
+        message = f"Invalid --git-stage '{git_stage}'. Choose from: {', '.join(GIT_STAGE_MODES)}"
+        if settings["plain"]:
+            print(f"Error: {message}", file=sys.stderr)
+        else:
+            console.print(f"[red]Error:[/red] {message}")
+        raise typer.Exit(1)
+
+    if batch is not None:
+        # Batch mode prints its own plain or Rich output; keep Rich unloaded with --plain
+        if engagement_name or here or org or scope or goal:
+            print("Error: --batch takes org, scope, goal and target from the manifest", file=sys.stderr)
+            raise typer.Exit(1)
+        results = init_batch(batch, force=force, no_git=no_git, jobs=jobs, stage=git_stage)
+        if any(not r.ok for r in results):
+            raise typer.Exit(1)
+        return
+
+    from rich.live import Live
+    from rich.panel import Panel
+
     # Handle "." as current directory
     if engagement_name == ".":
         here = True
@@ -793,7 +1130,7 @@ def init(
 
     # Discovery phase: scan for existing documentation and context
     if project_path.exists():
-        discovery = discover_existing_context(project_path)
+        discovery = discover_existing_context(project_path, excludes=exclude, max_read_bytes=max(1, max_read_bytes))
         if not display_discovery_results(discovery, console):
             raise typer.Exit(0)  # User chose to abort
 
@@ -852,9 +1189,10 @@ def init(
     tracker.add("final", "Finalize")
 
     git_error_message = None
+    git_setup = None
 
-    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
-        tracker.attach_refresh(lambda: live.update(tracker.render()))
+    # Live renders the tracker itself at a bounded frame rate
+    with Live(tracker, console=get_console(), refresh_per_second=8, transient=True):
 
         try:
             # Create directory
@@ -863,6 +1201,18 @@ def init(
                 project_path.mkdir(parents=True, exist_ok=True)
             tracker.complete("directory", str(project_path))
 
+            # Start git init now so it runs while the files are written
+            if not no_git:
+                tracker.start("git")
+                if is_git_repo(project_path):
+                    tracker.complete("git", "existing repo detected")
+                elif should_init_git:
+                    git_setup = GitSetup(project_path)
+                else:
+                    tracker.skip("git", "git not available")
+            else:
+                tracker.skip("git", "--no-git flag")
+
             # Copy templates
             tracker.start("templates")
             if not copy_templates(project_path, tracker):
@@ -875,26 +1225,21 @@ def init(
             # Artifacts directory already created by copy_templates
             tracker.complete("artifacts", "created")
 
-            # Git initialization
-            if not no_git:
-                tracker.start("git")
-                if is_git_repo(project_path):
-                    tracker.complete("git", "existing repo detected")
-                elif should_init_git:
-                    success, error_msg = init_git_repo(project_path, quiet=True)
-                    if success:
-                        tracker.complete("git", "initialized")
-                    else:
-                        tracker.error("git", "init failed")
-                        git_error_message = error_msg
+            # Stage and commit once git init and the files are done
+            if git_setup is not None:
+                paths = created_paths(get_template_provider()) if git_stage == "created" else None
+                success, error_msg = git_setup.finish(paths)
+                if success:
+                    tracker.complete("git", "initialized" if paths is None else f"initialized, {len(paths)} files staged")
                 else:
-                    tracker.skip("git", "git not available")
-            else:
-                tracker.skip("git", "--no-git flag")
+                    tracker.error("git", "init failed")
+                    git_error_message = error_msg
 
             tracker.complete("final", "engagement ready")
 
         except Exception as e:
+            if git_setup is not None:
+                git_setup.wait()
             tracker.error("final", str(e))
             console.print(Panel(f"Initialization failed: {e}", title="Failure", border_style="red"))
             raise typer.Exit(1)
@@ -933,6 +1278,59 @@ def init(
     console.print(Panel("\n".join(steps_lines), title="Next Steps", border_style="cyan", padding=(1, 2)))
 
 
+OUTCOME_STATUS_STYLES = {
+    "missing outcome.md": "red",
+    "needs strategy": "yellow",
+    "needs tasks": "yellow",
+    "complete": "green",
+    "in progress": "blue",
+}
+
+
+def outcome_rows(outcome_records: list, phases: bool = False) -> list:
+    """Build (id, name, status, tasks, current phase) rows for outcome records."""
+    rows = []
+    for record in outcome_records:
+        outcome_id, outcome_name = split_outcome_name(record["name"])
+        status = outcome_status(record)
+
+        # Task count and current phase
+        tasks = record["tasks"]
+        if tasks is not None:
+            task_info = f"{tasks['done']}/{tasks['total']}"
+            current = tasks["current_phase"]
+            phase_info = f"{current['label']} ({current['done']}/{current['total']})" if current else "-"
+        else:
+            task_info = "-"
+            phase_info = "-"
+
+        rows.append((outcome_id, outcome_name, status, task_info, phase_info))
+        if phases and tasks is not None:
+            for phase in tasks["phases"]:
+                rows.append(("", f"  {phase['label']}", "", f"{phase['done']}/{phase['total']}", ""))
+    return rows
+
+
+def outcome_table(rows: list, title: str = "Knowledge Outcomes", caption: str = None):
+    """Render outcome rows as a Rich table."""
+    from rich.table import Table
+
+    table = Table(title=title, caption=caption, border_style="cyan")
+    table.add_column("ID", style="cyan")
+    table.add_column("Name", style="white")
+    table.add_column("Status", style="green")
+    table.add_column("Tasks", style="dim")
+    table.add_column("Current Phase", style="dim")
+
+    for outcome_id, outcome_name, status, task_info, phase_info in rows:
+        if not status:
+            table.add_row("", f"[dim]{outcome_name}[/dim]", "", task_info, "")
+            continue
+        style = OUTCOME_STATUS_STYLES[status]
+        table.add_row(outcome_id, outcome_name, f"[{style}]{status}[/{style}]", task_info, phase_info)
+    return table
+
+
 @app.command()
 def check():
     """Check the current engagement status and prerequisites."""
@@ -942,6 +1340,9 @@ def check():
     context_dir = cwd / ".context"
 
     if not context_dir.exists():
+        if settings["plain"]:
+            print("Not in a Context Framework engagement", file=sys.stderr)
+            raise typer.Exit(1)
         console.print("[red]Not in a Context Framework engagement[/red]")
         console.print("[dim]Run 'companyspec init' to create one[/dim]")
         raise typer.Exit(1)
@@ -974,13 +1375,20 @@ def check():
     else:
         tracker.skip("scripts", "none found")
 
+    index = EngagementIndex(cwd)
+
     # Check outcomes
     outcomes = context_dir / "outcomes"
     tracker.add("outcomes", "Knowledge Outcomes")
     if outcomes.exists():
-        outcome_dirs = [d for d in outcomes.iterdir() if d.is_dir()]
-        if outcome_dirs:
-            tracker.complete("outcomes", f"{len(outcome_dirs)} outcomes")
+        outcome_records = index.outcomes()
+        if outcome_records:
+            total = sum(r["tasks"]["total"] for r in outcome_records if r["tasks"])
+            done = sum(r["tasks"]["done"] for r in outcome_records if r["tasks"])
+            detail = f"{len(outcome_records)} outcomes"
+            if total:
+                detail += f", {done}/{total} tasks done"
+            tracker.complete("outcomes", detail)
         else:
             tracker.skip("outcomes", "none defined yet")
     else:
@@ -990,21 +1398,204 @@ def check():
     artifacts = cwd / "context-artifacts"
     tracker.add("artifacts", "Context Artifacts")
     if artifacts.exists():
-        artifact_files = list(artifacts.rglob("*.md"))
-        if artifact_files:
-            tracker.complete("artifacts", f"{len(artifact_files)} artifacts")
+        artifact_records = index.artifacts()
+        if artifact_records:
+            tracker.complete("artifacts", f"{len(artifact_records)} artifacts")
         else:
             tracker.skip("artifacts", "none created yet")
     else:
         tracker.skip("artifacts", "directory missing")
 
+    index.save()
+
+    if settings["plain"]:
+        print(tracker.render_plain())
+        return
+
     console.print(tracker.render())
     console.print()
     console.print("[bold green]Context Framework check complete.[/bold green]")
 
 
+@app.command()
+def status(
+    path: Path = typer.Argument(None, help="Engagement directory (defaults to the current directory)"),
+    as_json: bool = typer.Option(False, "--json", help="Shorthand for --format json"),
+    fmt: str = typer.Option("text", "--format", "-f", help="Output format: text, json, ndjson"),
+):
+    """
+    Print the engagement state in a machine-readable form.
+
+    Reports constitution presence, template and script counts, each
+    outcome's status and task progress, and artifact counts per category.
+    Never renders Rich output, so it is cheap to poll from dashboards and CI.
+
+    Examples:
+        companyspec status --json
+        companyspec status --format ndjson
+    """
+    if as_json:
+        fmt = "json"
+    if fmt not in ("text", "json", "ndjson"):
+        print(f"Error: Invalid format '{fmt}'. Choose from: text, json, ndjson", file=sys.stderr)
+        raise typer.Exit(1)
+
+    project_path = (path or Path.cwd()).resolve()
+    engagement = collect_status(project_path)
+    print(format_status(engagement, fmt))
+
+    if not engagement["initialized"]:
+        raise typer.Exit(1)
+
+
+@app.command()
+def scan(
+    root: Path = typer.Argument(None, help="Directory to search for engagements (defaults to the current directory)"),
+    as_json: bool = typer.Option(False, "--json", help="Shorthand for --format json"),
+    fmt: str = typer.Option("table", "--format", "-f", help="Output format: table, json, ndjson"),
+    exclude: Optional[list[str]] = typer.Option(None, "--exclude", help="Glob pattern of directories to skip (repeatable)"),
+    max_depth: int = typer.Option(DEFAULT_MAX_DEPTH, "--max-depth", help="Maximum directory depth to search"),
+    workers: int = typer.Option(DEFAULT_SCAN_WORKERS, "--workers", "-j", help="Number of engagements evaluated concurrently"),
+):
+    """
+    Find every engagement under a directory and summarize them together.
+
+    Walks the tree once (pruning .git, node_modules and other vendored
+    directories), evaluates each .context/ engagement on a worker pool and
+    prints outcome and task completion across all of them.
+
+    Examples:
+        companyspec scan .
+        companyspec scan teams/ --json
+    """
+    if as_json:
+        fmt = "json"
+    if fmt not in ("table", "json", "ndjson"):
+        print(f"Error: Invalid format '{fmt}'. Choose from: table, json, ndjson", file=sys.stderr)
+        raise typer.Exit(1)
+
+    root = (root or Path.cwd()).resolve()
+    report = scan_engagements(root, excludes=exclude, max_depth=max_depth, workers=max(1, workers))
+
+    if fmt == "json":
+        print(json.dumps(report, indent=2))
+        return
+    if fmt == "ndjson":
+        for engagement in report["engagements"]:
+            for record in iter_ndjson_records(engagement) if "error" not in engagement else [engagement]:
+                print(json.dumps(record, separators=(",", ":")))
+        return
+
+    totals = report["totals"]
+    rows = []
+    for engagement in report["engagements"]:
+        if "error" in engagement:
+            rows.append((engagement["relative_path"], "error", "-", "-", "-"))
+            continue
+        outcomes = engagement["outcomes"]
+        complete = sum(1 for o in outcomes if o["status"] == "complete")
+        tasks = engagement["tasks"]
+        rows.append((
+            engagement["relative_path"],
+            "yes" if engagement["constitution"] else "no",
+            f"{complete}/{len(outcomes)}",
+            f"{tasks['done']}/{tasks['total']}",
+            str(engagement["artifacts"]["total"]),
+        ))
+
+    summary = (
+        f"{totals['engagements']} engagements, "
+        f"{totals['outcomes_complete']}/{totals['outcomes']} outcomes complete, "
+        f"{totals['tasks_done']}/{totals['tasks_total']} tasks done, "
+        f"{totals['artifacts']} artifacts"
+    )
+
+    if settings["plain"]:
+        for row in rows:
+            print("\t".join(row))
+        print(summary)
+        return
+
+    from rich.table import Table
+
+    show_banner()
+    table = Table(title=f"Engagements under {root}", border_style="cyan")
+    table.add_column("Engagement", style="cyan")
+    table.add_column("Constitution", style="white")
+    table.add_column("Outcomes Complete", style="green")
+    table.add_column("Tasks", style="dim")
+    table.add_column("Artifacts", style="dim")
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+    console.print(f"[bold]{summary}[/bold]")
+
+
+@app.command()
+def analyze(
+    as_json: bool = typer.Option(False, "--json", help="Print the outcome graph and issues as JSON"),
+):
+    """
+    Check outcome, strategy and task files for broken references and cycles.
+
+    Builds a graph of outcomes from their Depends On / Blocks sections and
+    the KO-### references in strategies and tasks, validates every reference,
+    detects circular dependencies and flags missing acceptance criteria,
+    priorities and headers. Only outcomes whose files changed are re-parsed.
+    Exits with status 1 when critical issues are found.
+
+    Examples:
+        companyspec analyze
+        companyspec analyze --json
+    """
+    from .analyze import SEVERITIES, analyze_engagement
+
+    cwd = Path.cwd()
+    if not (cwd / ".context").is_dir():
+        print("Not in a Context Framework engagement", file=sys.stderr)
+        raise typer.Exit(1)
+
+    analysis = analyze_engagement(cwd)
+    counts = analysis.counts()
+
+    if as_json:
+        print(json.dumps(analysis.to_dict(), indent=2))
+    elif settings["plain"]:
+        for issue in analysis.issues:
+            print("\t".join([issue.severity, issue.check, issue.location, issue.message]))
+        print(
+            f"{len(analysis.outcomes)} outcomes, {len(analysis.edges)} links: "
+            f"{counts['critical']} critical, {counts['warning']} warnings, {counts['info']} info"
+        )
+    else:
+        from rich.table import Table
+
+        show_banner()
+        styles = {"critical": "red", "warning": "yellow", "info": "dim"}
+        table = Table(title="Consistency Analysis", border_style="cyan")
+        table.add_column("Severity")
+        table.add_column("Check", style="cyan")
+        table.add_column("Location", style="dim")
+        table.add_column("Issue", style="white")
+        for issue in analysis.issues:
+            style = styles[issue.severity]
+            table.add_row(f"[{style}]{issue.severity}[/{style}]", issue.check, issue.location, issue.message)
+        if analysis.issues:
+            console.print(table)
+        summary = ", ".join(f"[{styles[s]}]{counts[s]} {s}[/{styles[s]}]" for s in SEVERITIES)
+        console.print(
+            f"[bold]{len(analysis.outcomes)} outcomes, {len(analysis.edges)} links[/bold] ({summary}) "
+            f"[dim]{analysis.reanalyzed} files re-parsed[/dim]"
+        )
+
+    if counts["critical"]:
+        raise typer.Exit(1)
+
+
 @app.command(name="list")
-def list_outcomes():
+def list_outcomes(
+    phases: bool = typer.Option(False, "--phases", help="Show per-phase task progress for each outcome"),
+):
     """List all knowledge outcomes in the current engagement."""
     show_banner()
 
@@ -1012,61 +1603,643 @@ def list_outcomes():
     outcomes_dir = cwd / ".context" / "outcomes"
 
     if not outcomes_dir.exists():
+        if settings["plain"]:
+            print("No outcomes directory found", file=sys.stderr)
+            raise typer.Exit(1)
         console.print("[yellow]No outcomes directory found[/yellow]")
         console.print("[dim]Run 'companyspec init' first, then define outcomes with /context.outcome[/dim]")
         raise typer.Exit(1)
 
-    outcome_dirs = sorted([d for d in outcomes_dir.iterdir() if d.is_dir()])
+    with EngagementIndex(cwd) as index:
+        outcome_records = index.outcomes()
 
-    if not outcome_dirs:
+    if not outcome_records:
+        if settings["plain"]:
+            return
         console.print("[yellow]No outcomes defined yet[/yellow]")
         console.print("[dim]Use /context.outcome to define your first knowledge outcome[/dim]")
         return
 
-    table = Table(title="Knowledge Outcomes", border_style="cyan")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name", style="white")
-    table.add_column("Status", style="green")
-    table.add_column("Tasks", style="dim")
+    rows = outcome_rows(outcome_records, phases=phases)
+
+    if settings["plain"]:
+        for row in rows:
+            print("\t".join(row))
+        return
+
+    console.print(outcome_table(rows))
+
+
+@app.command()
+def plan(
+    outcome: str = typer.Argument(..., help="Outcome number (001, KO-001) or name"),
+    as_json: bool = typer.Option(False, "--json", help="Print the full plan as JSON"),
+    next_batch: bool = typer.Option(False, "--next", help="Print only the tasks that can start now, as JSON"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", help="With --next, return at most this many tasks"),
+):
+    """
+    Schedule an outcome's open tasks from their [P] and [B] markers.
+
+    Builds a dependency graph from tasks.md (unmarked tasks run in order,
+    [P] tasks run in parallel, [B] tasks gate the next phase), groups open
+    tasks into waves that can run concurrently and shows the critical path.
+    Use --next to hand the runnable batch to several agents at once.
+
+    Examples:
+        companyspec plan 001
+        companyspec plan brand-voice --next --limit 4
+    """
+    from .plan import PlanError, plan_outcome, task_title
+
+    cwd = Path.cwd()
+    try:
+        schedule = plan_outcome(cwd, outcome)
+    except PlanError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        raise typer.Exit(1)
+
+    if next_batch:
+        batch = schedule.next_batch[:limit] if limit else schedule.next_batch
+        print(json.dumps({
+            "outcome": schedule.outcome,
+            "open_tasks": sum(len(w) for w in schedule.waves),
+            "batch": [schedule.task_dict(key) for key in batch],
+        }, indent=2))
+        return
+    if as_json:
+        print(json.dumps(schedule.to_dict(), indent=2))
+        return
+
+    critical = " -> ".join(schedule.critical_path) or "-"
+    if settings["plain"]:
+        for number, wave in enumerate(schedule.waves, 1):
+            for key in wave:
+                print(f"{number}\t{key}\t{task_title(schedule.tasks[key])}")
+        print(f"Critical path: {critical}")
+        return
+
+    from rich.markup import escape
+    from rich.table import Table
+
+    show_banner()
+    if not schedule.waves:
+        console.print(f"[green]All tasks of {schedule.outcome} are done[/green]")
+        return
+    table = Table(title=f"Plan: {schedule.outcome}", border_style="cyan")
+    table.add_column("Wave", style="cyan", justify="right")
+    table.add_column("Task", style="white")
+    table.add_column("Phase", style="dim")
+    table.add_column("Depends On", style="dim")
+    on_path = set(schedule.critical_path)
+    for number, wave in enumerate(schedule.waves, 1):
+        for i, key in enumerate(wave):
+            task = schedule.tasks[key]
+            title = escape(task_title(task))
+            label = f"[bold]{key}[/bold] {title}" if key in on_path else f"{key} {title}"
+            open_deps = [d for d in sorted(schedule.deps[key]) if not schedule.tasks[d].done]
+            table.add_row(str(number) if i == 0 else "", label, str(task.phase or "-"), ", ".join(open_deps))
+    console.print(table)
+    console.print(
+        f"[bold]{sum(len(w) for w in schedule.waves)} open tasks in {len(schedule.waves)} waves[/bold]; "
+        f"critical path ({len(schedule.critical_path)} tasks, bold): {critical}"
+    )
+
+
+@app.command()
+def search(
+    query: list[str] = typer.Argument(..., help="Words to search for"),
+    limit: int = typer.Option(10, "--limit", "-n", help="Maximum number of results"),
+    as_json: bool = typer.Option(False, "--json", help="Print results as JSON"),
+    no_update: bool = typer.Option(False, "--no-update", help="Query the index as is, without checking for changed files"),
+):
+    """
+    Search the context artifacts of the current engagement.
+
+    Results are ranked with BM25 from an inverted index kept in
+    .context/cache/search.db. Before each query only added or changed
+    artifacts are re-indexed, so searches stay fast on large engagements.
+
+    Examples:
+        companyspec search refund approval
+        companyspec search "escalation policy" --json
+    """
+    from .search import SearchIndex, tokenize
+
+    cwd = Path.cwd()
+    if not (cwd / ".context").is_dir():
+        print("Not in a Context Framework engagement", file=sys.stderr)
+        raise typer.Exit(1)
+
+    text = " ".join(query)
+    with SearchIndex(cwd) as index:
+        if not no_update:
+            index.update()
+        results = index.search(text, limit=max(1, limit))
+
+    if as_json:
+        print(json.dumps({"query": text, "results": [r.to_dict(cwd) for r in results]}, indent=2))
+        return
+
+    if settings["plain"]:
+        for r in results:
+            print(f"{r.path.relative_to(cwd).as_posix()}\t{r.score:.2f}\t{r.heading}\t{r.snippet}")
+        return
+
+    show_banner()
+    if not results:
+        console.print(f"[yellow]No artifacts match[/yellow] '{text}'")
+        return
+
+    from rich.markup import escape
+
+    pattern = re.compile(r"\b(" + "|".join(re.escape(t) for t in tokenize(text)) + r")\b", re.IGNORECASE)
+    for r in results:
+        console.print(f"[cyan]{r.path.relative_to(cwd).as_posix()}[/cyan] [dim]{r.score:.2f}[/dim]")
+        if r.heading:
+            console.print(f"  [white]{escape(r.heading)}[/white]")
+        if r.snippet:
+            console.print("  " + pattern.sub(r"[bold yellow]\1[/bold yellow]", escape(r.snippet)))
+        console.print()
+
+
+@app.command()
+def pack(
+    budget: Optional[int] = typer.Option(None, "--budget", "-b", help="Maximum number of tokens in the pack"),
+    fmt: str = typer.Option("markdown", "--format", "-f", help="Output format: markdown, jsonl"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write the pack to a file instead of stdout"),
+    no_outcomes: bool = typer.Option(False, "--no-outcomes", help="Leave outcome definitions out (constitution and artifacts only)"),
+):
+    """
+    Assemble the engagement into a token-counted context pack for an AI.
+
+    Streams the constitution, outcome definitions and context artifacts as
+    deduplicated chunks with stable content-hash IDs, ordered by outcome
+    priority and cut off at the token budget. Only sources that changed
+    since the last pack are re-chunked.
+
+    Examples:
+        companyspec pack -o context.md
+        companyspec pack --budget 50000 --format jsonl -o context.jsonl
+    """
+    from .pack import PackStats, format_chunk_markdown, iter_pack
+
+    if fmt not in ("markdown", "jsonl"):
+        print(f"Error: Invalid format '{fmt}'. Choose from: markdown, jsonl", file=sys.stderr)
+        raise typer.Exit(1)
+
+    cwd = Path.cwd()
+    if not (cwd / ".context").is_dir():
+        print("Not in a Context Framework engagement", file=sys.stderr)
+        raise typer.Exit(1)
+
+    stats = PackStats()
+    try:
+        out = open(output, "w", encoding="utf-8") if output else sys.stdout
+    except OSError as e:
+        print(f"Error: Cannot write {output}: {e.strerror or e}", file=sys.stderr)
+        raise typer.Exit(1)
+    try:
+        for chunk in iter_pack(cwd, budget=budget, include_outcomes=not no_outcomes, stats=stats):
+            if fmt == "jsonl":
+                out.write(json.dumps(chunk.to_dict(), ensure_ascii=False) + "\n")
+            else:
+                out.write(format_chunk_markdown(chunk) + "\n")
+    finally:
+        if output:
+            out.close()
+
+    summary = (
+        f"Packed {stats.chunks} chunks ({stats.tokens} tokens) from {stats.sources} sources; "
+        f"{stats.regenerated} re-chunked, {stats.duplicates} duplicates dropped"
+    )
+    if stats.over_budget:
+        summary += f", {len(stats.over_budget)} chunks over budget"
+    print(summary, file=sys.stderr)
+    if stats.stale:
+        print(f"Skipped {len(stats.stale)} sources that changed while packing; run pack again: {', '.join(stats.stale)}", file=sys.stderr)
+
+
+@app.command()
+def budget(
+    by: str = typer.Option("category", "--by", help="Group costs by: category, outcome, file"),
+    tokenizer: str = typer.Option(DEFAULT_TOKENIZER, "--tokenizer", help="Token counter: approx, chars, tiktoken, or module:function"),
+    limit: int = typer.Option(20, "--limit", "-n", help="Rows shown, largest first (0 for all)"),
+    as_json: bool = typer.Option(False, "--json", help="Print per-file, per-outcome and per-category costs as JSON"),
+):
+    """
+    Report the token and byte cost of the engagement's context.
+
+    Counts every file of the constitution, the outcomes and
+    context-artifacts/, and rolls them up per artifact category or per
+    outcome. Counts are cached by content hash, so only changed files are
+    re-tokenized. The default tokenizer is a fast approximation; use
+    --tokenizer tiktoken (needs the tiktoken package) or your own
+    module:function for exact counts.
+
+    Examples:
+        companyspec budget
+        companyspec budget --by outcome -n 10
+        companyspec budget --by file --tokenizer tiktoken --json
+    """
+    from .budget import measure_engagement
+
+    groupings = ("category", "outcome", "file")
+    if by not in groupings:
+        print(f"Error: Invalid grouping '{by}'. Choose from: {', '.join(groupings)}", file=sys.stderr)
+        raise typer.Exit(1)
+
+    cwd = Path.cwd()
+    if not (cwd / ".context").is_dir():
+        print("Not in a Context Framework engagement", file=sys.stderr)
+        raise typer.Exit(1)
+
+    try:
+        report = measure_engagement(cwd, tokenizer=tokenizer)
+    except TokenizerError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        raise typer.Exit(1)
+
+    if as_json:
+        print(json.dumps(report.to_dict(), indent=2))
+        return
+
+    if by == "file":
+        rows = [(f.path, 1, f.tokens, f.bytes) for f in report.files]
+    else:
+        groups = report.categories if by == "category" else report.outcomes
+        rows = [(g.name, g.files, g.tokens, g.bytes) for g in groups.values()]
+    rows.sort(key=lambda r: (-r[2], r[0]))
+    if by == "category":
+        # Keep the rows adding up to the total
+        outcomes = sum(g.tokens for g in report.outcomes.values()), sum(g.bytes for g in report.outcomes.values())
+        constitution = [f for f in report.files if f.kind == "constitution"]
+        if report.outcomes:
+            rows.append(("(outcomes)", sum(g.files for g in report.outcomes.values()), *outcomes))
+        if constitution:
+            rows.append(("(constitution)", 1, constitution[0].tokens, constitution[0].bytes))
+
+    if settings["plain"]:
+        for name, files, tokens, size in rows:
+            print(f"{name}\t{files}\t{tokens}\t{size}")
+        print(f"total\t{report.total.files}\t{report.total.tokens}\t{report.total.bytes}")
+        return
+
+    from rich.table import Table
+
+    show_banner()
+    total = report.total.tokens or 1
+    table = Table(title=f"Context Budget by {by.capitalize()} ({tokenizer} tokens)", border_style="cyan")
+    table.add_column(by.capitalize(), style="cyan")
+    if by != "file":
+        table.add_column("Files", justify="right")
+    table.add_column("Tokens", justify="right")
+    table.add_column("Share", justify="right", style="dim")
+    table.add_column("Bytes", justify="right", style="dim")
+    for name, files, tokens, size in rows[:limit if limit > 0 else None]:
+        cells = [name] + ([str(files)] if by != "file" else []) + [f"{tokens:,}", f"{tokens / total:.1%}", f"{size:,}"]
+        table.add_row(*cells)
+    console.print(table)
+    if limit > 0 and len(rows) > limit:
+        console.print(f"[dim]{len(rows) - limit} more (use -n 0 to show all)[/dim]")
+    console.print(
+        f"[bold]{report.total.tokens:,} tokens, {report.total.bytes:,} bytes in {report.total.files} files[/bold] "
+        f"[dim]({report.retokenized} re-tokenized)[/dim]"
+    )
 
-    for outcome_dir in outcome_dirs:
-        name = outcome_dir.name
-        outcome_id = name.split("-")[0] if "-" in name else name
-        outcome_name = "-".join(name.split("-")[1:]) if "-" in name else name
-
-        # Determine status
-        has_outcome = (outcome_dir / "outcome.md").exists()
-        has_strategy = (outcome_dir / "strategy.md").exists()
-        has_tasks = (outcome_dir / "tasks.md").exists()
-
-        if not has_outcome:
-            status = "[red]missing outcome.md[/red]"
-        elif not has_strategy:
-            status = "[yellow]needs strategy[/yellow]"
-        elif not has_tasks:
-            status = "[yellow]needs tasks[/yellow]"
+
+@app.command()
+def dedupe(
+    threshold: Optional[float] = typer.Option(None, "--threshold", "-t", help="Minimum estimated similarity (0-1) to report [default: 0.8]"),
+    category: Optional[str] = typer.Option(None, "--category", "-c", help="Only compare artifacts of one category"),
+    as_json: bool = typer.Option(False, "--json", help="Print clusters as JSON"),
+):
+    """
+    Find near-duplicate context artifacts.
+
+    Artifacts are reduced to MinHash signatures of their five-word shingles
+    and grouped with locality-sensitive hashing, so only likely duplicates
+    are compared. Signatures are cached; repeated runs only hash artifacts
+    that are new or changed. Each cluster lists its members with their
+    estimated similarity to the first one.
+
+    Examples:
+        companyspec dedupe
+        companyspec dedupe --category processes --threshold 0.6
+        companyspec dedupe --json
+    """
+    from .dedupe import DEFAULT_THRESHOLD, find_duplicates
+
+    if threshold is None:
+        threshold = DEFAULT_THRESHOLD
+    if not 0 < threshold <= 1:
+        print("Error: --threshold must be between 0 and 1", file=sys.stderr)
+        raise typer.Exit(1)
+
+    cwd = Path.cwd()
+    if not (cwd / ".context").is_dir():
+        print("Not in a Context Framework engagement", file=sys.stderr)
+        raise typer.Exit(1)
+
+    try:
+        report = find_duplicates(cwd, threshold=threshold, category=category)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        raise typer.Exit(1)
+
+    if as_json:
+        print(json.dumps(report.to_dict(), indent=2))
+        return
+
+    if settings["plain"]:
+        for number, cluster in enumerate(report.clusters, 1):
+            for path, similarity in cluster.members:
+                print(f"{number}\t{path}\t{similarity:.2f}")
+        return
+
+    from rich.table import Table
+
+    show_banner()
+    if report.clusters:
+        table = Table(title="Near-Duplicate Artifacts", border_style="cyan")
+        table.add_column("#", justify="right", style="dim")
+        table.add_column("Artifact", style="cyan")
+        table.add_column("Similarity", justify="right")
+        for number, cluster in enumerate(report.clusters, 1):
+            for i, (path, similarity) in enumerate(cluster.members):
+                table.add_row(str(number) if i == 0 else "", path, "-" if i == 0 else f"{similarity:.0%}", end_section=i == len(cluster.members) - 1)
+        console.print(table)
+    else:
+        console.print(f"[green]No near-duplicates at {threshold:.0%} similarity[/green]")
+    console.print(
+        f"[bold]{len(report.clusters)} clusters, {report.duplicates} duplicates[/bold] "
+        f"[dim]({report.scanned} artifacts, {report.rehashed} re-hashed, {report.candidates} pairs compared)[/dim]"
+    )
+
+
+@app.command()
+def glossary(
+    term: Optional[str] = typer.Option(None, "--term", "-t", help="Show where a single term is used"),
+    min_docs: int = typer.Option(2, "--min-docs", help="Documents an undefined phrase must appear in to be reported"),
+    limit: int = typer.Option(20, "--limit", "-n", help="Rows shown per table (0 for all)"),
+    as_json: bool = typer.Option(False, "--json", help="Print the term index as JSON"),
+):
+    """
+    Cross-reference glossary terms with the artifacts and outcomes using them.
+
+    Collects the terms defined in context-artifacts/glossaries/ (table rows
+    and **Term**: list items) and counts their uses in all other artifacts
+    and outcome files in a single pass per file. Reports terms nobody uses
+    and bold phrases or acronyms that recur without a definition. Only files
+    that changed since the last run are re-scanned.
+
+    Examples:
+        companyspec glossary
+        companyspec glossary --term "Net Revenue"
+        companyspec glossary --json
+    """
+    from .glossary import build_glossary_report
+
+    cwd = Path.cwd()
+    if not (cwd / ".context").is_dir():
+        print("Not in a Context Framework engagement", file=sys.stderr)
+        raise typer.Exit(1)
+
+    report = build_glossary_report(cwd, min_documents=max(1, min_docs))
+
+    if term is not None:
+        found = report.find(term)
+        if found is None:
+            print(f"Term not defined in any glossary: {term}", file=sys.stderr)
+            raise typer.Exit(1)
+        if as_json:
+            print(json.dumps(found.to_dict(), indent=2))
+        elif settings["plain"]:
+            for path, uses in sorted(found.used_in.items()):
+                print(f"{path}\t{uses}")
         else:
-            # Count tasks
-            tasks_content = (outcome_dir / "tasks.md").read_text()
-            total = tasks_content.count("- [ ]") + tasks_content.count("- [x]") + tasks_content.count("- [X]")
-            done = tasks_content.count("- [x]") + tasks_content.count("- [X]")
-            if done == total and total > 0:
-                status = "[green]complete[/green]"
+            from rich.table import Table
+
+            show_banner()
+            table = Table(title=f"Uses of {found.name}", border_style="cyan")
+            table.add_column("Document", style="cyan")
+            table.add_column("Uses", justify="right")
+            for path, uses in sorted(found.used_in.items(), key=lambda item: (-item[1], item[0])):
+                table.add_row(path, str(uses))
+            console.print(f"[bold]{found.name}[/bold] [dim]{', '.join(found.defined_in)}[/dim]")
+            if found.definition:
+                console.print(f"  {found.definition}")
+            if found.used_in:
+                console.print(table)
             else:
-                status = f"[blue]in progress[/blue]"
-
-        # Task count
-        if has_tasks:
-            tasks_content = (outcome_dir / "tasks.md").read_text()
-            total = tasks_content.count("- [ ]") + tasks_content.count("- [x]") + tasks_content.count("- [X]")
-            done = tasks_content.count("- [x]") + tasks_content.count("- [X]")
-            task_info = f"{done}/{total}"
+                console.print("[yellow]Not used outside the glossaries[/yellow]")
+        return
+
+    orphaned = report.orphaned
+    if as_json:
+        print(json.dumps(report.to_dict(), indent=2))
+        return
+
+    if settings["plain"]:
+        for t in report.terms.values():
+            print(f"term\t{t.name}\t{t.uses}\t{len(t.used_in)}")
+        for t in orphaned:
+            print(f"orphaned\t{t.name}\t{t.defined_in[0]}")
+        for c in report.undefined:
+            print(f"undefined\t{c['phrase']}\t{c['uses']}\t{c['documents']}")
+        return
+
+    from rich.table import Table
+
+    show_banner()
+    rows = limit if limit > 0 else None
+
+    if report.terms:
+        table = Table(title="Glossary Terms (most used)", border_style="cyan")
+        table.add_column("Term", style="cyan")
+        table.add_column("Uses", justify="right")
+        table.add_column("Documents", justify="right")
+        table.add_column("Defined In", style="dim")
+        ranked = sorted(report.terms.values(), key=lambda t: (-t.uses, t.name.lower()))
+        for t in ranked[:rows]:
+            table.add_row(t.name, str(t.uses), str(len(t.used_in)), t.defined_in[0])
+        console.print(table)
+
+    if orphaned:
+        table = Table(title="Orphaned Terms (never used)", border_style="yellow")
+        table.add_column("Term", style="yellow")
+        table.add_column("Defined In", style="dim")
+        for t in orphaned[:rows]:
+            table.add_row(t.name, t.defined_in[0])
+        console.print(table)
+
+    if report.undefined:
+        table = Table(title="Undefined Term Candidates", border_style="magenta")
+        table.add_column("Phrase", style="magenta")
+        table.add_column("Uses", justify="right")
+        table.add_column("Documents", justify="right")
+        for c in report.undefined[:rows]:
+            table.add_row(c["phrase"], str(c["uses"]), str(c["documents"]))
+        console.print(table)
+
+    console.print(
+        f"[bold]{len(report.terms)} terms from {report.glossaries} glossaries[/bold], "
+        f"{len(orphaned)} orphaned, {len(report.undefined)} undefined candidates "
+        f"[dim]({report.scanned} files, {report.rescanned} re-scanned)[/dim]"
+    )
+
+
+@app.command()
+def watch(
+    poll: bool = typer.Option(False, "--poll", help="Use mtime polling instead of inotify"),
+    interval: float = typer.Option(1.0, "--interval", help="Polling interval in seconds"),
+):
+    """
+    Show a live view of outcomes and artifacts that updates as files change.
+
+    Uses inotify on Linux and mtime polling elsewhere (or with --poll).
+    Only the outcome or artifact that changed is re-read, so many agents
+    writing files at once do not trigger full rescans. Stop with Ctrl+C.
+    """
+    from .watch import EngagementWatch, EngagementWatcher
+
+    cwd = Path.cwd()
+    if not (cwd / ".context").is_dir():
+        print("Not in a Context Framework engagement", file=sys.stderr)
+        raise typer.Exit(1)
+
+    state = EngagementWatch(cwd)
+    watcher = EngagementWatcher(state, poll=poll, interval=interval)
+    events = []
+
+    def caption() -> str:
+        counts = state.artifact_counts()
+        artifacts = ", ".join(f"{k} {v}" for k, v in sorted(counts.items())) or "none"
+        lines = [f"Artifacts: {sum(counts.values())} ({artifacts})"]
+        lines.extend(events[-5:])
+        return "\n".join(lines)
+
+    def render():
+        return outcome_table(outcome_rows(list(state.outcomes.values())), title="Knowledge Outcomes (watching)", caption=caption())
+
+    try:
+        if settings["plain"]:
+            print(f"Watching {cwd} ({watcher.kind})")
+            while True:
+                for message in state.apply(watcher.wait()):
+                    print(f"{datetime.now():%H:%M:%S} {message}", flush=True)
         else:
-            task_info = "-"
+            from rich.live import Live
+
+            show_banner()
+            with Live(render(), console=get_console(), auto_refresh=False) as live:
+                while True:
+                    messages = state.apply(watcher.wait())
+                    if messages:
+                        events.extend(f"{datetime.now():%H:%M:%S} {m}" for m in messages)
+                        del events[:-5]
+                        live.update(render(), refresh=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
 
-        table.add_row(f"KO-{outcome_id}", outcome_name, status, task_info)
 
-    console.print(table)
+outcome_app = typer.Typer(name="outcome", help="Create and manage knowledge outcomes.", add_completion=False)
+app.add_typer(outcome_app, name="outcome")
+
+
+@outcome_app.command("new")
+def outcome_new(
+    short_name: str = typer.Argument(..., help="2-4 word identifier, e.g. authority-map or product-glossary"),
+    number: str = typer.Option(None, "--number", help="Use a specific number instead of auto-increment"),
+    as_json: bool = typer.Option(False, "--json", help="Output result as JSON"),
+):
+    """
+    Create a new knowledge outcome directory with outcome.md.
+
+    Numbers are allocated atomically under a lock in .context/cache/, so
+    several agents can create outcomes in parallel without collisions.
+
+    Examples:
+        companyspec outcome new authority-map
+        companyspec outcome new --number 005 product-glossary --json
+    """
+    from .outcomes import OutcomeError, create_outcome, find_repo_root
+
+    repo_root = find_repo_root(Path.cwd())
+    if repo_root is None:
+        print("Error: Not in a Company Context project", file=sys.stderr)
+        raise typer.Exit(1)
+
+    try:
+        created = create_outcome(repo_root, short_name, number)
+    except OutcomeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        raise typer.Exit(1)
+
+    if as_json:
+        print(json.dumps(created, indent=4))
+    elif settings["plain"]:
+        print(f"Created outcome: {created['outcome_id']}")
+        print(f"  Directory: {created['outcome_dir']}")
+    else:
+        console.print(f"[green]✓[/green] Created outcome: [cyan]{created['outcome_id']}[/cyan]")
+        console.print(f"  Directory: {created['outcome_dir']}")
+        console.print("  Next: Edit outcome.md, then run [cyan]/context.strategy[/cyan]")
+
+
+@app.command()
+def upgrade(
+    force: bool = typer.Option(False, "--force", help="Overwrite templates and scripts that were edited locally"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what would change without writing anything"),
+):
+    """
+    Update the engagement's templates and scripts to the installed version.
+
+    Only files whose packaged content changed are copied. Files you edited
+    locally are reported as conflicts and kept unless --force is given.
+    A manifest in .context/manifest.json makes an upgrade with nothing to
+    do a stat-only pass.
+    """
+    context_dir = Path.cwd() / ".context"
+    if not context_dir.is_dir():
+        print("Not in a Context Framework engagement", file=sys.stderr)
+        raise typer.Exit(1)
+
+    provider = get_template_provider()
+    if provider is None:
+        print("Packaged templates not found", file=sys.stderr)
+        raise typer.Exit(1)
+
+    result = sync_templates(provider, context_dir, force=force, dry_run=dry_run)
+
+    groups = [
+        ("added", "Would add" if dry_run else "Added", "green"),
+        ("updated", "Would update" if dry_run else "Updated", "green"),
+        ("overwritten", "Would overwrite" if dry_run else "Overwritten", "yellow"),
+        ("conflicts", "Conflict (locally modified, kept)", "red"),
+    ]
+    for attr, label, style in groups:
+        for rel in getattr(result, attr):
+            if settings["plain"]:
+                print(f"{label}: .context/{rel}")
+            else:
+                console.print(f"[{style}]{label}:[/{style}] .context/{rel}")
+
+    summary = (
+        f"{len(result.added)} added, {len(result.updated) + len(result.overwritten)} updated, "
+        f"{len(result.unchanged)} unchanged, {len(result.modified)} locally modified, "
+        f"{len(result.conflicts)} conflicts"
+    )
+    if settings["plain"]:
+        print(summary)
+    else:
+        console.print(f"[bold]{summary}[/bold]")
+        if result.conflicts:
+            console.print("[dim]Review the conflicting files, then re-run with --force to replace them[/dim]")
+
+    if result.conflicts:
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -1084,6 +2257,13 @@ def version():
     except Exception:
         pass
 
+    if settings["plain"]:
+        print(f"companyspec {cli_version} (Python {platform.python_version()}, {platform.system()} {platform.machine()})")
+        return
+
+    from rich.panel import Panel
+    from rich.table import Table
+
     info_table = Table(show_header=False, box=None, padding=(0, 2))
     info_table.add_column("Key", style="cyan", justify="right")
     info_table.add_column("Value", style="white")
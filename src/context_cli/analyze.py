@@ -0,0 +1,301 @@
+"""
+Deterministic consistency analysis.
+
+Parses the outcome, strategy and tasks files of an engagement into a graph
+(outcomes as nodes; `Depends On` / `Blocks` references, strategy and task
+links to outcomes as edges), validates every `KO-###` reference and finds
+dependency cycles with Tarjan's strongly connected components in O(V+E).
+
+Each file is summarized once and cached in `.context/cache/analyze.json`
+(keyed by mtime and size), so only outcomes whose files changed are
+re-parsed. Judgment calls (scope, coverage, realism) are left to the
+`/context.analyze` slash command.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .index import OUTCOMES_DIR, EngagementIndex
+from .markdown import normalize_title
+from .tasks import parse_tasks_lines
+
+ANALYZE_VERSION = 1
+ANALYZE_CACHE = "analyze.json"
+
+HEADER_ID_RE = re.compile(r"\*\*(?:ID|Outcome)\*\*:\s*KO-(\d+)")
+PRIORITY_RE = re.compile(r"\*\*Priority\*\*:\s*(P\d)\b")
+REF_RE = re.compile(r"\bKO-(\d+)\b")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+AC_HEADING_RE = re.compile(r"^AC-\d+", re.IGNORECASE)
+PLACEHOLDER_RE = re.compile(r"\[[A-Z][A-Z0-9_]{2,}\]")
+OUTCOME_DIR_RE = re.compile(r"^(\d+)-")
+
+# Lines searched for the `**ID**:` / `**Outcome**:` header
+HEADER_LINES = 10
+
+OUTCOME_FILES = ("outcome.md", "strategy.md", "tasks.md")
+
+SEVERITIES = ("critical", "warning", "info")
+
+
+def summarize_document(path: Path) -> dict:
+    """Extract the outcome header, priority, acceptance criteria and KO references of a file."""
+    text = path.read_text(encoding="utf-8", errors="replace")
+    lines = text.splitlines()
+    summary = {
+        "header": None,
+        "priority": None,
+        "acceptance_criteria": 0,
+        "refs": [],
+        "placeholders": len(PLACEHOLDER_RE.findall(text)),
+        "empty_phases": [],
+    }
+    section = ""
+    in_fence = False
+    for number, line in enumerate(lines, 1):
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        heading = HEADING_RE.match(line)
+        if heading:
+            title = heading.group(2)
+            if len(heading.group(1)) in (2, 3):
+                section = normalize_title(title)
+            if AC_HEADING_RE.match(title):
+                summary["acceptance_criteria"] += 1
+        if number <= HEADER_LINES and summary["header"] is None:
+            header = HEADER_ID_RE.search(line)
+            if header:
+                summary["header"] = [int(header.group(1)), number]
+                continue
+        if summary["priority"] is None:
+            priority = PRIORITY_RE.search(line)
+            if priority:
+                summary["priority"] = priority.group(1)
+        for ref in REF_RE.findall(line):
+            summary["refs"].append([int(ref), number, section])
+
+    if path.name == "tasks.md":
+        tasks = parse_tasks_lines(lines)
+        summary["empty_phases"] = [phase.label for phase in tasks.phases if not phase.tasks]
+    return summary
+
+
+@dataclass
+class Issue:
+    severity: str
+    check: str
+    message: str
+    location: str = ""
+
+    def to_dict(self) -> dict:
+        return {"severity": self.severity, "check": self.check, "message": self.message, "location": self.location}
+
+
+@dataclass
+class Analysis:
+    """The outcome graph of an engagement and the issues found in it."""
+
+    outcomes: dict = field(default_factory=dict)
+    edges: list = field(default_factory=list)
+    cycles: list = field(default_factory=list)
+    issues: list = field(default_factory=list)
+    reanalyzed: int = 0
+
+    def counts(self) -> dict:
+        counts = {severity: 0 for severity in SEVERITIES}
+        for issue in self.issues:
+            counts[issue.severity] += 1
+        return counts
+
+    def to_dict(self) -> dict:
+        return {
+            "version": ANALYZE_VERSION,
+            "outcomes": [
+                {"id": ko_id(n), "name": o["name"], "files": o["files"], "depends_on": [ko_id(d) for d in o["depends_on"]]}
+                for n, o in sorted(self.outcomes.items())
+            ],
+            "edges": [{"from": src, "to": ko_id(dst), "kind": kind} for src, dst, kind in self.edges],
+            "cycles": [[ko_id(n) for n in cycle] for cycle in self.cycles],
+            "issues": [issue.to_dict() for issue in self.issues],
+            "summary": {**self.counts(), "outcomes": len(self.outcomes), "edges": len(self.edges), "reanalyzed": self.reanalyzed},
+        }
+
+
+def ko_id(number: int) -> str:
+    return f"KO-{number:03d}"
+
+
+def find_cycles(graph: dict) -> list:
+    """Return the dependency cycles of graph ({node: [successors]}) as lists of nodes.
+
+    Iterative Tarjan SCC: every strongly connected component with more than
+    one node, or a node that depends on itself, is a cycle.
+    """
+    index_of, low, on_stack = {}, {}, set()
+    stack, cycles = [], []
+    counter = 0
+
+    for root in sorted(graph):
+        if root in index_of:
+            continue
+        work = [(root, iter(graph.get(root, ())))]
+        index_of[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for succ in successors:
+                if succ not in index_of:
+                    index_of[succ] = low[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph.get(succ, ()))))
+                    advanced = True
+                    break
+                if succ in on_stack:
+                    low[node] = min(low[node], index_of[succ])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in graph.get(node, ()):
+                    cycles.append(sorted(component))
+    return sorted(cycles)
+
+
+def analyze_engagement(project_path: Path) -> Analysis:
+    """Build the outcome graph of project_path and check it for consistency."""
+    analysis = Analysis()
+    outcomes_dir = project_path / OUTCOMES_DIR
+
+    def location(path: Path, line: int = 0) -> str:
+        rel = path.relative_to(project_path).as_posix()
+        return f"{rel}:{line}" if line else rel
+
+    def issue(severity, check, message, path=None, line=0):
+        analysis.issues.append(Issue(severity, check, message, location(path, line) if path else ""))
+
+    if not (project_path / ".context" / "memory" / "constitution.md").is_file():
+        issue("critical", "constitution", "Constitution not found (.context/memory/constitution.md)")
+
+    summaries = {}
+    with EngagementIndex(project_path, name=ANALYZE_CACHE) as index:
+        index.track(OUTCOMES_DIR)
+        try:
+            dirs = sorted(p for p in outcomes_dir.iterdir() if p.is_dir())
+        except FileNotFoundError:
+            dirs = []
+        for outcome_dir in dirs:
+            match = OUTCOME_DIR_RE.match(outcome_dir.name)
+            if not match:
+                issue("warning", "naming", f"Outcome directory '{outcome_dir.name}' does not start with a number", outcome_dir)
+                continue
+            number = int(match.group(1))
+            if number in analysis.outcomes:
+                issue("critical", "naming", f"{ko_id(number)} is used by more than one outcome directory", outcome_dir)
+                continue
+            files = {}
+            for name in OUTCOME_FILES:
+                path = outcome_dir / name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files[name] = index.lookup(path, summarize_document, stat)
+            summaries[number] = (outcome_dir, files)
+            analysis.outcomes[number] = {"name": outcome_dir.name, "files": sorted(files), "depends_on": [], "blocks": []}
+        analysis.reanalyzed = index.stats["misses"]
+
+    for number, (outcome_dir, files) in summaries.items():
+        record = analysis.outcomes[number]
+        outcome = files.get("outcome.md")
+        if outcome is None:
+            issue("critical", "outcome", f"{ko_id(number)} has no outcome.md", outcome_dir)
+        else:
+            path = outcome_dir / "outcome.md"
+            if not outcome["acceptance_criteria"]:
+                issue("warning", "outcome", f"{ko_id(number)} has no acceptance criteria", path)
+            if not outcome["priority"]:
+                issue("warning", "outcome", f"{ko_id(number)} has no priority assigned", path)
+        if "tasks.md" in files and "strategy.md" not in files:
+            issue("warning", "tasks", f"{ko_id(number)} has tasks.md but no strategy.md", outcome_dir)
+
+        for name, summary in files.items():
+            path = outcome_dir / name
+            header = summary["header"]
+            if header is None:
+                issue("warning", "header", f"{name} has no KO-### header", path)
+            elif header[0] != number:
+                issue("critical", "header", f"{name} belongs to {ko_id(number)} but its header says {ko_id(header[0])}", path, header[1])
+            else:
+                kind = {"outcome.md": "outcome", "strategy.md": "strategy", "tasks.md": "task"}[name]
+                if kind != "outcome":
+                    analysis.edges.append((f"{ko_id(number)}/{name}", number, kind))
+            if summary["placeholders"]:
+                issue("info", "placeholders", f"{name} still has {summary['placeholders']} unfilled template placeholders", path)
+            for phase in summary["empty_phases"]:
+                issue("warning", "tasks", f"{phase} has no tasks", path)
+
+            for ref, line, section in summary["refs"]:
+                if ref not in analysis.outcomes:
+                    issue("critical", "reference", f"Reference to unknown outcome {ko_id(ref)}", path, line)
+                    continue
+                if name != "outcome.md":
+                    if ref != number:
+                        kind = "task" if name == "tasks.md" else "strategy"
+                        analysis.edges.append((f"{ko_id(number)}/{name}", ref, kind))
+                    continue
+                if section == "depends on":
+                    record["depends_on"].append(ref)
+                elif section == "blocks":
+                    record["blocks"].append(ref)
+
+    for record in analysis.outcomes.values():
+        record["depends_on"] = list(dict.fromkeys(record["depends_on"]))
+        record["blocks"] = list(dict.fromkeys(record["blocks"]))
+
+    # Dependency graph: A depends on B, or B blocks A
+    graph = {number: set(record["depends_on"]) for number, record in analysis.outcomes.items()}
+    for number, record in analysis.outcomes.items():
+        for blocked in record["blocks"]:
+            graph.setdefault(blocked, set()).add(number)
+    for number in sorted(graph):
+        for dependency in sorted(graph[number]):
+            analysis.edges.append((ko_id(number), dependency, "depends_on"))
+
+    for number, record in sorted(analysis.outcomes.items()):
+        path = summaries[number][0] / "outcome.md"
+        for dependency in record["depends_on"]:
+            if number not in analysis.outcomes[dependency]["blocks"]:
+                issue("warning", "mutual", f"{ko_id(number)} depends on {ko_id(dependency)}, which does not list it under Blocks", path)
+        for blocked in record["blocks"]:
+            if number not in analysis.outcomes[blocked]["depends_on"]:
+                issue("warning", "mutual", f"{ko_id(number)} blocks {ko_id(blocked)}, which does not list it under Depends On", path)
+
+    analysis.cycles = find_cycles({n: sorted(deps) for n, deps in graph.items()})
+    for cycle in analysis.cycles:
+        if len(cycle) == 1:
+            issue("critical", "cycle", f"{ko_id(cycle[0])} depends on itself")
+        else:
+            issue("critical", "cycle", "Circular dependency between " + ", ".join(ko_id(n) for n in cycle))
+
+    order = {severity: i for i, severity in enumerate(SEVERITIES)}
+    analysis.issues.sort(key=lambda i: (order[i.severity], i.location))
+    return analysis
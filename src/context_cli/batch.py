@@ -0,0 +1,151 @@
+"""
+Batch engagement creation.
+
+Reads a manifest of engagements to create (JSON or CSV, one engagement per
+object or row) and runs a worker for each of them on a thread pool. Results
+come back in manifest order regardless of which worker finished first.
+
+Manifest columns / keys:
+
+- `org` (required): organization name,
+- `target` (required, alias `dir`): directory to create, relative to the
+  current directory,
+- `scope` (optional, default `team`) and `goal` (optional).
+
+JSON manifests are a list of objects, or an object with an `engagements`
+list.
+"""
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+DEFAULT_SCOPE = "team"
+
+
+class BatchError(Exception):
+    """Raised when a batch manifest cannot be read or has invalid entries."""
+
+
+@dataclass
+class BatchEntry:
+    org: str
+    target: Path
+    scope: str = DEFAULT_SCOPE
+    goal: str = ""
+    row: int = 0
+
+
+@dataclass
+class BatchResult:
+    entry: BatchEntry
+    status: str
+    detail: str = ""
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+    def to_dict(self) -> dict:
+        return {
+            "target": str(self.entry.target),
+            "org": self.entry.org,
+            "scope": self.entry.scope,
+            "status": self.status,
+            "detail": self.detail,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+def _read_rows(path: Path) -> list:
+    try:
+        text = path.read_text(encoding="utf-8-sig")
+    except OSError as e:
+        raise BatchError(f"Cannot read manifest {path}: {e.strerror or e}")
+
+    if path.suffix.lower() == ".csv":
+        return list(csv.DictReader(text.splitlines()))
+    if path.suffix.lower() != ".json":
+        raise BatchError(f"Unsupported manifest format '{path.suffix}'. Use .json or .csv")
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise BatchError(f"Invalid JSON in {path}: {e}")
+    if isinstance(data, dict):
+        data = data.get("engagements")
+    if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+        raise BatchError(f"{path} must contain a list of engagement objects")
+    return data
+
+
+def load_batch_manifest(path: Path, scopes: Iterable[str] = (), base: Optional[Path] = None) -> list:
+    """Parse a batch manifest into BatchEntry objects, validating every row first."""
+    base = base or Path.cwd()
+    valid_scopes = set(scopes)
+    entries, problems, targets = [], [], {}
+    for number, row in enumerate(_read_rows(path), 1):
+        row = {str(k).strip().lower(): str(v).strip() for k, v in row.items() if k is not None and v is not None}
+        org = row.get("org", "")
+        target = row.get("target") or row.get("dir", "")
+        scope = row.get("scope") or DEFAULT_SCOPE
+        if not org:
+            problems.append(f"row {number}: missing org")
+        if not target:
+            problems.append(f"row {number}: missing target")
+            continue
+        if valid_scopes and scope not in valid_scopes:
+            problems.append(f"row {number}: invalid scope '{scope}'")
+        resolved = (base / target).resolve()
+        if resolved in targets:
+            problems.append(f"row {number}: target '{target}' is also used by row {targets[resolved]}")
+        targets[resolved] = number
+        entries.append(BatchEntry(org=org, target=resolved, scope=scope, goal=row.get("goal", ""), row=number))
+
+    if problems:
+        raise BatchError("Invalid manifest:\n  " + "\n  ".join(problems))
+    if not entries:
+        raise BatchError(f"{path} lists no engagements")
+    return entries
+
+
+def default_jobs() -> int:
+    # Workers mostly wait on file and git I/O, so use more threads than cores
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def run_batch(
+    entries: list,
+    worker: Callable[[BatchEntry], BatchResult],
+    jobs: Optional[int] = None,
+    on_result: Optional[Callable[[BatchResult], None]] = None,
+) -> list:
+    """Run worker for every entry on a thread pool; return results in entry order.
+
+    on_result is called from the calling thread as each entry finishes. A
+    worker that raises is reported as a failed result instead of stopping
+    the batch.
+    """
+    def run(entry: BatchEntry) -> BatchResult:
+        start = time.perf_counter()
+        try:
+            result = worker(entry)
+        except Exception as e:
+            result = BatchResult(entry, "failed", str(e))
+        result.seconds = time.perf_counter() - start
+        return result
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as pool:
+        futures = [pool.submit(run, entry) for entry in entries]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.entry.row] = result
+            if on_result:
+                on_result(result)
+    return [results[entry.row] for entry in entries]
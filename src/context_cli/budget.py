@@ -0,0 +1,153 @@
+"""
+Token accounting.
+
+Measures what deploying an engagement's context costs: tokens and bytes of
+the constitution, of every outcome (all files in its directory) and of every
+artifact, rolled up per outcome and per `context-artifacts/` category.
+
+Counts are cached in `.context/cache/budget.json`. Files whose mtime and
+size are unchanged are not read at all; a changed file is hashed, and its
+token count is only recomputed if no file with the same content hash was
+counted with the same tokenizer before. Counts are kept per tokenizer, so
+switching tokenizers back and forth does not throw earlier counts away.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .index import ARTIFACTS_DIR, OUTCOMES_DIR, EngagementIndex, walk_files
+from .tokenizers import DEFAULT_TOKENIZER, TokenizerError, get_tokenizer
+from .trace import traced
+
+BUDGET_VERSION = 1
+BUDGET_CACHE = "budget.json"
+
+UNCATEGORIZED = "(uncategorized)"
+
+
+@dataclass
+class FileCost:
+    path: str
+    kind: str
+    group: str
+    tokens: int
+    bytes: int
+
+    def to_dict(self) -> dict:
+        return {"path": self.path, "kind": self.kind, "group": self.group, "tokens": self.tokens, "bytes": self.bytes}
+
+
+@dataclass
+class GroupCost:
+    name: str
+    files: int = 0
+    tokens: int = 0
+    bytes: int = 0
+
+    def add(self, cost: FileCost) -> None:
+        self.files += 1
+        self.tokens += cost.tokens
+        self.bytes += cost.bytes
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "files": self.files, "tokens": self.tokens, "bytes": self.bytes}
+
+
+@dataclass
+class BudgetReport:
+    """Per-file costs with their outcome and category roll-ups."""
+
+    tokenizer: str
+    files: list = field(default_factory=list)
+    outcomes: dict = field(default_factory=dict)
+    categories: dict = field(default_factory=dict)
+    total: GroupCost = field(default_factory=lambda: GroupCost("total"))
+    retokenized: int = 0
+
+    def add(self, cost: FileCost) -> None:
+        self.files.append(cost)
+        self.total.add(cost)
+        if cost.kind == "outcome":
+            self.outcomes.setdefault(cost.group, GroupCost(cost.group)).add(cost)
+        elif cost.kind == "artifact":
+            self.categories.setdefault(cost.group, GroupCost(cost.group)).add(cost)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": BUDGET_VERSION,
+            "tokenizer": self.tokenizer,
+            "total": self.total.to_dict(),
+            "categories": [g.to_dict() for g in self.categories.values()],
+            "outcomes": [g.to_dict() for g in self.outcomes.values()],
+            "files": [f.to_dict() for f in self.files],
+            "retokenized": self.retokenized,
+        }
+
+
+def _sources(project_path: Path, index: EngagementIndex):
+    """Yield (kind, group, path, stat) for every file that counts towards the budget."""
+    constitution = project_path / ".context" / "memory" / "constitution.md"
+    try:
+        yield "constitution", "constitution", constitution, constitution.stat()
+    except FileNotFoundError:
+        pass
+
+    index.track(OUTCOMES_DIR)
+    try:
+        with os.scandir(project_path / OUTCOMES_DIR) as it:
+            outcome_dirs = sorted(e.name for e in it if e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        outcome_dirs = []
+    for name in outcome_dirs:
+        for entry in walk_files(project_path / OUTCOMES_DIR / name):
+            yield "outcome", name, Path(entry.path), entry.stat()
+
+    index.track(ARTIFACTS_DIR)
+    prefix_len = len(str(project_path / ARTIFACTS_DIR)) + 1
+    for entry in walk_files(project_path / ARTIFACTS_DIR):
+        category, sep, _ = entry.path[prefix_len:].replace("\\", "/").partition("/")
+        yield "artifact", category if sep else UNCATEGORIZED, Path(entry.path), entry.stat()
+
+
+@traced(cat="budget")
+def measure_engagement(project_path: Path, tokenizer: str = DEFAULT_TOKENIZER) -> BudgetReport:
+    """Count the tokens and bytes of every context file of project_path."""
+    count = get_tokenizer(tokenizer)
+    report = BudgetReport(tokenizer=tokenizer)
+
+    with EngagementIndex(project_path, name=BUDGET_CACHE) as index:
+        # {sha256: {tokenizer: tokens}}, built from the cache on the first change
+        by_hash = None
+
+        def known() -> dict:
+            nonlocal by_hash
+            if by_hash is None:
+                by_hash = {e["summary"]["sha256"]: e["summary"]["tokens"] for e in index.entries.values()}
+            return by_hash
+
+        def measure(path: Path) -> dict:
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            tokens = dict(known().get(digest, {}))
+            if tokenizer not in tokens:
+                try:
+                    tokens[tokenizer] = int(count(data.decode("utf-8", errors="replace")))
+                except Exception as e:
+                    # Plugged-in tokenizers can fail in any way
+                    raise TokenizerError(f"Tokenizer '{tokenizer}' failed on {path.name}: {e}")
+                report.retokenized += 1
+            by_hash[digest] = tokens
+            return {"sha256": digest, "bytes": len(data), "tokens": tokens}
+
+        for kind, group, path, stat in _sources(project_path, index):
+            summary = index.lookup(path, measure, stat)
+            if tokenizer not in summary["tokens"]:
+                # Unchanged file, so far only counted with other tokenizers
+                known()
+                index.forget(path)
+                summary = index.lookup(path, measure, stat)
+            rel = path.relative_to(project_path).as_posix()
+            report.add(FileCost(rel, kind, group, summary["tokens"][tokenizer], summary["bytes"]))
+    return report
@@ -0,0 +1,252 @@
+"""
+Near-duplicate artifact detection.
+
+Agents capturing in parallel tend to write overlapping process and decision
+documents. Each artifact is reduced to a MinHash signature of its word
+shingles (overlapping runs of SHINGLE_SIZE words), and signatures are
+bucketed with locality-sensitive hashing so only artifacts that share a
+band are ever compared: the run is close to linear in the number of
+artifacts instead of quadratic. Within a bucket each artifact is compared
+with one representative of every cluster already in it, and only the first
+MAX_BUCKET members of a bucket are compared at all.
+
+Signatures use one-permutation hashing: every shingle is hashed once and
+the hash picks both the signature slot and the value competing for its
+minimum; empty slots are filled from the next non-empty one (densification).
+That keeps hashing cost at one hash per shingle rather than one per
+permutation, while signatures still estimate Jaccard similarity slot by slot.
+
+Signatures are cached in `.context/cache/dedupe.json` keyed by mtime and
+size, so repeated runs only hash new or changed artifacts.
+"""
+
+import base64
+import re
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .index import ARTIFACT_CATEGORIES, ARTIFACTS_DIR, EngagementIndex, walk_files
+from .trace import traced
+
+DEDUPE_VERSION = 1
+DEDUPE_CACHE = "dedupe.json"
+
+# Words per shingle
+SHINGLE_SIZE = 5
+
+# Signature slots, split into bands of `rows` slots for LSH (see lsh_rows)
+SLOTS = 128
+
+# How far below the threshold the LSH candidate curve is centered
+LSH_MARGIN = 0.1
+
+DEFAULT_THRESHOLD = 0.8
+
+# Members of one LSH bucket that are compared; larger buckets come from
+# boilerplate shared by many artifacts and are cut off
+MAX_BUCKET = 256
+
+WORD_RE = re.compile(r"\w+")
+
+_SLOT_BITS = SLOTS.bit_length() - 1
+_EMPTY = 0xFFFFFFFF
+
+
+def shingles(text: str) -> set:
+    """Return the hashes of the word shingles of text (empty if it is too short)."""
+    words = WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return set()
+    return {
+        zlib.crc32(" ".join(words[i:i + SHINGLE_SIZE]).encode("utf-8"))
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(hashes: set) -> Optional[list]:
+    """Return the densified one-permutation MinHash signature of a shingle set."""
+    if not hashes:
+        return None
+    signature = [_EMPTY] * SLOTS
+    mask = SLOTS - 1
+    for h in hashes:
+        slot = h & mask
+        value = h >> _SLOT_BITS
+        if value < signature[slot]:
+            signature[slot] = value
+    # Fill empty slots from the next non-empty slot to the right, offset by
+    # the distance so that two filled slots only agree if their sources do
+    filled = [i for i, v in enumerate(signature) if v != _EMPTY]
+    if len(filled) < SLOTS:
+        source = filled[0] + SLOTS
+        for i in range(SLOTS - 1, -1, -1):
+            if signature[i] != _EMPTY:
+                source = i
+            else:
+                distance = source - i
+                signature[i] = (signature[source % SLOTS] + distance * 0x9E3779B1) & 0xFFFFFFFF
+    return signature
+
+
+def similarity(a: list, b: list) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / SLOTS
+
+
+def lsh_rows(threshold: float) -> int:
+    """Pick the rows per LSH band for a similarity threshold.
+
+    Two artifacts with Jaccard similarity s share at least one of the
+    SLOTS/rows bands with probability 1 - (1 - s^rows)^(SLOTS/rows), a curve
+    that is steepest around (rows/SLOTS)^(1/rows). The widest bands whose
+    curve sits comfortably below the threshold keep recall high while
+    producing as few candidate pairs as possible.
+    """
+    rows = 1
+    while rows * 2 <= SLOTS and (rows * 2 / SLOTS) ** (1 / (rows * 2)) <= threshold - LSH_MARGIN:
+        rows *= 2
+    return rows
+
+
+def summarize_signature(path: Path) -> dict:
+    """Hash an artifact into its signature (cached by the dedupe index)."""
+    signature = minhash(shingles(path.read_text(encoding="utf-8", errors="replace")))
+    encoded = base64.b64encode(array("I", signature).tobytes()).decode("ascii") if signature else None
+    return {"version": DEDUPE_VERSION, "signature": encoded}
+
+
+def _decode(raw: bytes) -> list:
+    return array("I", raw).tolist()
+
+
+@dataclass
+class Cluster:
+    """Artifacts that are near-duplicates of the first one."""
+
+    members: list = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {"size": len(self.members), "members": [{"path": p, "similarity": round(s, 3)} for p, s in self.members]}
+
+
+@dataclass
+class DedupeReport:
+    clusters: list = field(default_factory=list)
+    threshold: float = DEFAULT_THRESHOLD
+    scanned: int = 0
+    rehashed: int = 0
+    skipped: int = 0
+    candidates: int = 0
+
+    @property
+    def duplicates(self) -> int:
+        return sum(len(c.members) - 1 for c in self.clusters)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": DEDUPE_VERSION,
+            "threshold": self.threshold,
+            "clusters": [cluster.to_dict() for cluster in self.clusters],
+            "summary": {
+                "clusters": len(self.clusters),
+                "duplicates": self.duplicates,
+                "scanned": self.scanned,
+                "rehashed": self.rehashed,
+                "too_short": self.skipped,
+                "candidate_pairs": self.candidates,
+            },
+        }
+
+
+@traced(cat="dedupe")
+def find_duplicates(project_path: Path, threshold: float = DEFAULT_THRESHOLD, category: Optional[str] = None) -> DedupeReport:
+    """Cluster the near-duplicate artifacts of project_path (optionally one category)."""
+    report = DedupeReport(threshold=threshold)
+    root = project_path / ARTIFACTS_DIR
+    if category:
+        if category not in ARTIFACT_CATEGORIES:
+            raise ValueError(f"Unknown artifact category '{category}'. Choose from: {', '.join(ARTIFACT_CATEGORIES)}")
+        root = root / category
+    prefix_len = len(str(project_path)) + 1
+
+    # Signatures stay packed: band keys are byte slices, and only candidate
+    # pairs are decoded for comparison
+    paths, packed = [], []
+    with EngagementIndex(project_path, name=DEDUPE_CACHE) as index:
+        if not category:
+            index.track(ARTIFACTS_DIR)
+        for entry in walk_files(root):
+            report.scanned += 1
+            path = Path(entry.path)
+            stat = entry.stat()
+            summary = index.lookup(path, summarize_signature, stat)
+            if summary.get("version") != DEDUPE_VERSION:
+                index.forget(path)
+                summary = index.lookup(path, summarize_signature, stat)
+            if summary["signature"] is None:
+                report.skipped += 1
+                continue
+            paths.append(entry.path[prefix_len:].replace("\\", "/"))
+            packed.append(base64.b64decode(summary["signature"]))
+        report.rehashed = index.stats["misses"]
+
+    # Union-find over artifacts that share a band and pass the threshold
+    parent = list(range(len(paths)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    decoded = {}
+
+    def signature(i):
+        if i not in decoded:
+            decoded[i] = _decode(packed[i])
+        return decoded[i]
+
+    width = array("I").itemsize
+    rows = lsh_rows(threshold)
+    for start in range(0, SLOTS * width, rows * width):
+        end = start + rows * width
+        buckets = {}
+        for i, raw in enumerate(packed):
+            buckets.setdefault(raw[start:end], []).append(i)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            # Compare each member with one representative per cluster seen in
+            # this bucket, so members that match each other but not the first
+            # member are still joined; oversized buckets are cut off
+            reps = []
+            for i in members[:MAX_BUCKET]:
+                joined = False
+                for rep in reps:
+                    if find(rep) == find(i):
+                        joined = True
+                        continue
+                    report.candidates += 1
+                    if similarity(signature(rep), signature(i)) >= threshold:
+                        parent[find(i)] = find(rep)
+                        joined = True
+                if not joined:
+                    reps.append(i)
+
+    groups = {}
+    for i in range(len(paths)):
+        groups.setdefault(find(i), []).append(i)
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        members.sort(key=lambda i: paths[i])
+        first = members[0]
+        cluster = Cluster([(paths[first], 1.0)])
+        others = sorted(((paths[i], similarity(signature(first), signature(i))) for i in members[1:]), key=lambda m: (-m[1], m[0]))
+        cluster.members.extend(others)
+        report.clusters.append(cluster)
+    report.clusters.sort(key=lambda c: (-len(c.members), c.members[0][0]))
+    return report
@@ -0,0 +1,348 @@
+"""
+Glossary cross-reference index.
+
+Collects the terms defined in `context-artifacts/glossaries/` and counts
+where they are used across the other artifacts and the outcome files:
+
+- terms come from glossary tables (the `Term` column, or the first column)
+  and from `- **Term**: definition` list items; `Term (ABBR)` also defines
+  the abbreviation,
+- every scanned file is matched against all terms in a single pass with an
+  Aho-Corasick automaton over word tokens, so the cost of a scan grows with
+  the text, not with the number of terms. Matching is case-insensitive
+  except for all-caps words, which are treated as acronyms,
+- terms nobody uses are reported as orphaned, and bold phrases or acronyms
+  that recur across documents without a definition as undefined-term
+  candidates.
+
+Per-file results are cached in `.context/cache/glossary.json` keyed by mtime
+and size plus a fingerprint of the term set, so a repeated run only
+re-scans the files that changed (or everything, after a glossary edit).
+"""
+
+import hashlib
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from .index import ARTIFACTS_DIR, OUTCOMES_DIR, EngagementIndex, walk_files
+from .trace import traced
+
+GLOSSARY_VERSION = 1
+GLOSSARY_CACHE = "glossary.json"
+
+GLOSSARIES_DIR = ARTIFACTS_DIR / "glossaries"
+
+WORD_RE = re.compile(r"\w+")
+TABLE_RULE_RE = re.compile(r"^\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$")
+DEFINITION_ITEM_RE = re.compile(r"^\s*[-*+]\s+\*\*(.+?)\*\*\s*[:–—-]\s*(.*)$")
+ALIAS_RE = re.compile(r"^(.*?)\s*\(([^()]+)\)$")
+FENCE_RE = re.compile(r"^(```|~~~).*?^\1", re.MULTILINE | re.DOTALL)
+BOLD_RE = re.compile(r"(?<![*\w])\*\*(?![\s:*])([^*\n]{1,59}?[^\s*])\*\*(?![*\w]|\s*:)")
+ACRONYM_RE = re.compile(r"\b[A-Z][A-Z0-9]{1,7}\b")
+
+# Table headers naming the term and definition columns
+TERM_HEADERS = {"term", "name", "acronym", "abbreviation"}
+DEFINITION_HEADERS = {"definition", "meaning", "description"}
+
+# Acronyms used by the framework itself, never glossary candidates
+FRAMEWORK_ACRONYMS = {"KO", "AC", "ID", "AI", "TODO", "FIXME", "NOTE", "MUST", "SHOULD", "MAY", "NOT", "TBD", "NA"}
+
+# Characters of a definition kept in the index
+DEFINITION_EXCERPT = 120
+
+
+def normalize_word(word: str) -> str:
+    """Lowercase a word unless it is an acronym (all caps, two letters or more)."""
+    return word if len(word) > 1 and word.isupper() else word.lower()
+
+
+def term_key(text: str) -> str:
+    """Return the normalized word sequence a term is matched by."""
+    return " ".join(normalize_word(w) for w in WORD_RE.findall(text))
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over word tokens.
+
+    Patterns are normalized word sequences (see `term_key`); `count()` walks
+    a word list once and reports every occurrence of every pattern, including
+    overlapping ones ("refund" inside "refund policy").
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [()]
+        for key in keys:
+            self._add(key)
+        self._link()
+
+    def _add(self, key: str) -> None:
+        state = 0
+        for word in key.split():
+            nxt = self.goto[state].get(word)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append(())
+                self.goto[state][word] = nxt
+            state = nxt
+        if state and key not in self.out[state]:
+            self.out[state] = self.out[state] + (key,)
+
+    def _link(self) -> None:
+        goto, fail, out = self.goto, self.fail, self.out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and word not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(word, 0)
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+    def count(self, words: Iterable[str]) -> dict:
+        """Return {pattern key: occurrences} for a sequence of normalized words."""
+        goto, fail, out = self.goto, self.fail, self.out
+        counts = {}
+        state = 0
+        for word in words:
+            while True:
+                nxt = goto[state].get(word)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            if out[state]:
+                for key in out[state]:
+                    counts[key] = counts.get(key, 0) + 1
+        return counts
+
+
+def _clean_cell(text: str) -> str:
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    return text.replace("**", "").replace("`", "").strip(" *_")
+
+
+def _split_row(line: str) -> list:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def _term_entry(name: str, definition: str, line: int) -> list:
+    """Return [name, aliases, line, definition] for a defined term."""
+    name = _clean_cell(name)
+    aliases = []
+    alias = ALIAS_RE.match(name)
+    if alias and alias.group(1):
+        name, aliases = alias.group(1), [a.strip() for a in alias.group(2).split(",") if a.strip()]
+    return [name, aliases, line, _clean_cell(definition)[:DEFINITION_EXCERPT]]
+
+
+def extract_terms(path: Path) -> dict:
+    """Parse the terms defined in a glossary file (cached by the glossary index)."""
+    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    terms = []
+    columns = None
+    in_fence = False
+    for number, line in enumerate(lines, 1):
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        if not line.lstrip().startswith("|"):
+            columns = None
+            item = DEFINITION_ITEM_RE.match(line)
+            if item:
+                terms.append(_term_entry(item.group(1), item.group(2), number))
+            continue
+        if columns is None:
+            # A table starts with a header row followed by its rule
+            if number < len(lines) and TABLE_RULE_RE.match(lines[number].strip()):
+                header = [c.lower() for c in _split_row(line)]
+                term_col = next((i for i, c in enumerate(header) if c in TERM_HEADERS), 0)
+                def_col = next((i for i, c in enumerate(header) if c in DEFINITION_HEADERS), term_col + 1)
+                columns = (term_col, def_col)
+            continue
+        if TABLE_RULE_RE.match(line.strip()):
+            continue
+        cells = _split_row(line)
+        term_col, def_col = columns
+        if term_col < len(cells) and _clean_cell(cells[term_col]):
+            definition = cells[def_col] if def_col < len(cells) else ""
+            terms.append(_term_entry(cells[term_col], definition, number))
+    return {"terms": [t for t in terms if term_key(t[0])]}
+
+
+def candidate_phrases(text: str) -> dict:
+    """Return {phrase: occurrences} of bold phrases and acronyms in text."""
+    text = FENCE_RE.sub("", text)
+    phrases = {}
+    for match in BOLD_RE.finditer(text):
+        phrase = _clean_cell(match.group(1))
+        if phrase and not phrase.endswith(":") and term_key(phrase):
+            phrases[phrase] = phrases.get(phrase, 0) + 1
+    for acronym in ACRONYM_RE.findall(text):
+        if sum(c.isalpha() for c in acronym) >= 2 and acronym not in FRAMEWORK_ACRONYMS:
+            phrases[acronym] = phrases.get(acronym, 0) + 1
+    return phrases
+
+
+@dataclass
+class Term:
+    name: str
+    aliases: list = field(default_factory=list)
+    definition: str = ""
+    defined_in: list = field(default_factory=list)
+    uses: int = 0
+    used_in: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "term": self.name,
+            "aliases": self.aliases,
+            "definition": self.definition,
+            "defined_in": self.defined_in,
+            "uses": self.uses,
+            "documents": len(self.used_in),
+            "used_in": [{"path": path, "uses": uses} for path, uses in sorted(self.used_in.items())],
+        }
+
+
+@dataclass
+class GlossaryReport:
+    """Defined terms with their usage, orphaned terms and undefined-term candidates."""
+
+    terms: dict = field(default_factory=dict)
+    undefined: list = field(default_factory=list)
+    glossaries: int = 0
+    scanned: int = 0
+    rescanned: int = 0
+
+    @property
+    def orphaned(self) -> list:
+        return [term for term in self.terms.values() if not term.uses]
+
+    def find(self, name: str):
+        """Return the term defined as name (or one of its aliases), if any."""
+        key = term_key(name).lower()
+        for term in self.terms.values():
+            if key in (term_key(n).lower() for n in (term.name, *term.aliases)):
+                return term
+        return None
+
+    def to_dict(self) -> dict:
+        return {
+            "version": GLOSSARY_VERSION,
+            "terms": [term.to_dict() for term in self.terms.values()],
+            "orphaned": [term.name for term in self.orphaned],
+            "undefined": self.undefined,
+            "summary": {
+                "glossaries": self.glossaries,
+                "terms": len(self.terms),
+                "orphaned": len(self.orphaned),
+                "undefined": len(self.undefined),
+                "scanned": self.scanned,
+                "rescanned": self.rescanned,
+            },
+        }
+
+
+@traced(cat="glossary")
+def build_glossary_report(project_path: Path, min_documents: int = 2) -> GlossaryReport:
+    """Index the glossary terms of project_path and count their uses.
+
+    Bold phrases and acronyms without a definition become undefined-term
+    candidates once they appear in at least min_documents files.
+    """
+    report = GlossaryReport()
+    prefix_len = len(str(project_path)) + 1
+
+    with EngagementIndex(project_path, name=GLOSSARY_CACHE) as index:
+        index.track(ARTIFACTS_DIR)
+        index.track(OUTCOMES_DIR)
+
+        # Terms by key; aliases resolve to the key of their term
+        resolve = {}
+        for entry in walk_files(project_path / GLOSSARIES_DIR):
+            report.glossaries += 1
+            rel = entry.path[prefix_len:].replace("\\", "/")
+            for name, aliases, line, definition in index.lookup(Path(entry.path), extract_terms, entry.stat())["terms"]:
+                key = term_key(name)
+                term = report.terms.get(key)
+                if term is None:
+                    term = report.terms[key] = Term(name=name, definition=definition)
+                term.defined_in.append(f"{rel}:{line}")
+                for alias in aliases:
+                    if alias not in term.aliases:
+                        term.aliases.append(alias)
+                resolve.setdefault(key, key)
+                for alias in aliases:
+                    resolve.setdefault(term_key(alias), key)
+
+        fingerprint = hashlib.sha256("\n".join(sorted(resolve)).encode("utf-8")).hexdigest()[:16]
+        matcher = TermMatcher(resolve)
+
+        def scan(path: Path) -> dict:
+            report.rescanned += 1
+            text = path.read_text(encoding="utf-8", errors="replace")
+            words = [normalize_word(w) for w in WORD_RE.findall(text)]
+            return {"fingerprint": fingerprint, "hits": matcher.count(words), "candidates": candidate_phrases(text)}
+
+        # {pattern key: {document: uses}}, merged into terms below
+        usage = {}
+        candidates = {}
+        glossary_prefix = GLOSSARIES_DIR.as_posix() + "/"
+        for root in (ARTIFACTS_DIR, OUTCOMES_DIR):
+            for entry in walk_files(project_path / root):
+                rel = entry.path[prefix_len:].replace("\\", "/")
+                if rel.startswith(glossary_prefix):
+                    continue
+                report.scanned += 1
+                path = Path(entry.path)
+                stat = entry.stat()
+                summary = index.lookup(path, scan, stat)
+                if summary.get("fingerprint") != fingerprint:
+                    # Scanned against a different term set
+                    index.forget(path)
+                    summary = index.lookup(path, scan, stat)
+                for key, uses in summary["hits"].items():
+                    docs = usage.get(key)
+                    if docs is None:
+                        docs = usage[key] = {}
+                    docs[rel] = uses
+                for phrase, uses in summary["candidates"].items():
+                    record = candidates.setdefault(phrase, [0, 0])
+                    record[0] += uses
+                    record[1] += 1
+
+    for key, docs in usage.items():
+        term = report.terms.get(resolve.get(key))
+        if term is None:
+            continue
+        if term.used_in:
+            # Term and alias both used: add up per document
+            for rel, uses in docs.items():
+                term.used_in[rel] = term.used_in.get(rel, 0) + uses
+        else:
+            term.used_in = docs
+        term.uses += sum(docs.values())
+
+    report.undefined = sorted(
+        (
+            {"phrase": phrase, "uses": uses, "documents": documents}
+            for phrase, (uses, documents) in candidates.items()
+            if documents >= min_documents and term_key(phrase) not in resolve
+        ),
+        key=lambda c: (-c["documents"], -c["uses"], c["phrase"]),
+    )
+    return report
@@ -0,0 +1,212 @@
+"""
+Persistent engagement index.
+
+Records every tracked file of an engagement (outcome files and
+`context-artifacts/`) with its mtime, size and a parsed summary in
+`.context/cache/index.json`. Each run revalidates the index with a single
+`os.scandir` stat pass; files whose mtime and size are unchanged are never
+re-read.
+
+Usage:
+    with EngagementIndex(project_path) as index:
+        outcomes = index.outcomes()
+        artifacts = index.artifacts()
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from .tasks import parse_tasks
+
+INDEX_VERSION = 1
+
+CACHE_DIR = Path(".context") / "cache"
+OUTCOMES_DIR = Path(".context") / "outcomes"
+ARTIFACTS_DIR = Path("context-artifacts")
+
+ARTIFACT_CATEGORIES = ["glossaries", "processes", "decisions", "authorities", "systems"]
+
+
+def cache_dir(project_path: Path) -> Path:
+    """Return `.context/cache`, creating it with a .gitignore on first use."""
+    path = project_path / CACHE_DIR
+    if not path.exists():
+        path.mkdir(parents=True, exist_ok=True)
+        (path / ".gitignore").write_text("*\n")
+    return path
+
+
+def write_json_atomic(path: Path, data) -> None:
+    """Write JSON to path via a temporary file and an atomic rename."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def read_title(path: Path) -> str:
+    """Return the first markdown heading of a file, or an empty string."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("#"):
+                return line.lstrip("#").strip()
+    return ""
+
+
+def summarize_tasks(path: Path) -> dict:
+    return parse_tasks(path).summary()
+
+
+def summarize_artifact(path: Path) -> dict:
+    return {"title": read_title(path)}
+
+
+def walk_files(root: Path, suffix: str = ".md") -> Iterator[os.DirEntry]:
+    """Yield file entries under root (recursively, sorted) ending with suffix."""
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_files(Path(entry.path), suffix)
+        elif entry.name.endswith(suffix) and entry.is_file():
+            yield entry
+
+
+class EngagementIndex:
+    """mtime/size-keyed cache of parsed engagement files."""
+
+    def __init__(self, project_path: Path, persist: bool = True, name: str = "index.json"):
+        self.project_path = project_path
+        self.persist = persist
+        self.path = project_path / CACHE_DIR / name
+        self.entries = {}
+        self.stats = {"hits": 0, "misses": 0}
+        self._seen = set()
+        self._scanned = set()
+        self._dirty = False
+        self._load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.save()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self):
+        """Persist the index if anything changed, dropping vanished files."""
+        for key in list(self.entries):
+            if key not in self._seen and any(key.startswith(prefix) for prefix in self._scanned):
+                del self.entries[key]
+                self._dirty = True
+        if not self._dirty or not self.persist or not (self.project_path / ".context").is_dir():
+            return
+        try:
+            cache_dir(self.project_path)
+            write_json_atomic(self.path, {"version": INDEX_VERSION, "entries": self.entries})
+            self._dirty = False
+        except OSError:
+            # The index is only a cache; a read-only tree still works
+            pass
+
+    def track(self, prefix: Path) -> None:
+        """Drop entries under prefix (relative to the project) that are not looked up before save()."""
+        self._scanned.add(prefix.as_posix() + "/")
+
+    def lookup(self, path: Path, summarize: Callable[[Path], dict], stat: Optional[os.stat_result] = None) -> dict:
+        """Return the summary for path, re-parsing only when mtime or size changed."""
+        if stat is None:
+            stat = path.stat()
+        key = path.relative_to(self.project_path).as_posix()
+        self._seen.add(key)
+        entry = self.entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self.stats["hits"] += 1
+            return entry["summary"]
+        self.stats["misses"] += 1
+        summary = summarize(path)
+        self.entries[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "summary": summary}
+        self._dirty = True
+        return summary
+
+    def forget(self, path: Path) -> None:
+        """Drop a deleted file (or every file under a deleted directory)."""
+        key = path.relative_to(self.project_path).as_posix()
+        for existing in [k for k in self.entries if k == key or k.startswith(key + "/")]:
+            del self.entries[existing]
+            self._seen.discard(existing)
+            self._dirty = True
+
+    def outcomes(self) -> list:
+        """Return one record per outcome directory, sorted by name."""
+        outcomes_dir = self.project_path / OUTCOMES_DIR
+        self.track(OUTCOMES_DIR)
+        try:
+            with os.scandir(outcomes_dir) as it:
+                dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+        return [self.outcome(Path(entry.path)) for entry in dirs]
+
+    def outcome(self, outcome_dir: Path) -> dict:
+        """Return the record for a single outcome directory."""
+        try:
+            with os.scandir(outcome_dir) as it:
+                files = {e.name: e for e in it if e.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            files = {}
+        tasks_entry = files.get("tasks.md")
+        tasks = None
+        if tasks_entry is not None:
+            tasks = self.lookup(Path(tasks_entry.path), summarize_tasks, tasks_entry.stat())
+        return {
+            "name": outcome_dir.name,
+            "path": outcome_dir,
+            "has_outcome": "outcome.md" in files,
+            "has_strategy": "strategy.md" in files,
+            "has_tasks": tasks_entry is not None,
+            "tasks": tasks,
+        }
+
+    def artifacts(self) -> list:
+        """Return one record per markdown file under context-artifacts/."""
+        artifacts_dir = self.project_path / ARTIFACTS_DIR
+        self.track(ARTIFACTS_DIR)
+        return [self.artifact(Path(entry.path), entry.stat()) for entry in walk_files(artifacts_dir)]
+
+    def artifact(self, path: Path, stat: Optional[os.stat_result] = None) -> dict:
+        """Return the record for a single artifact file."""
+        rel = path.relative_to(self.project_path / ARTIFACTS_DIR)
+        category = rel.parts[0] if len(rel.parts) > 1 else ""
+        summary = self.lookup(path, summarize_artifact, stat)
+        return {"path": path, "category": category, **summary}
+
+
+def outcome_status(record: dict) -> str:
+    """Return the lifecycle status of an outcome record."""
+    if not record["has_outcome"]:
+        return "missing outcome.md"
+    if not record["has_strategy"]:
+        return "needs strategy"
+    if not record["has_tasks"]:
+        return "needs tasks"
+    if record["tasks"]["complete"]:
+        return "complete"
+    return "in progress"
@@ -0,0 +1,247 @@
+"""
+Package manifest extractors.
+
+Reads the name, description and workspace members declared by the package
+manifests at a project root (`package.json`, `pyproject.toml`, `Cargo.toml`,
+`go.mod`, `pom.xml`, ...). Each manifest has an extractor registered under
+its file name; extractors only run for manifests that exist, run
+concurrently, and import their parser (`tomllib`, XML) on first use so
+discovery does not pay for parsers it does not need.
+
+Reads are bounded like the rest of discovery: TOML and JSON manifests are
+parsed from at most `max_bytes` (a manifest cut off by the cap simply yields
+nothing), and `pom.xml` is fed to a pull parser line by line.
+
+Workspace members are reported as declared (globs are not expanded), so a
+monorepo with hundreds of sub-packages costs one read of its root manifest.
+
+Further manifests can be supported by registering an extractor:
+
+    @register_extractor("mix.exs")
+    def extract_mix(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+        ...
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from .scanner import DEFAULT_MAX_READ_BYTES, read_lines, read_many, read_text_head
+from .trace import traced
+
+
+@dataclass
+class PackageInfo:
+    """What a package manifest declares about the project."""
+
+    manifest: str
+    ecosystem: str
+    name: str = ""
+    description: str = ""
+    members: list = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "manifest": self.manifest,
+            "ecosystem": self.ecosystem,
+            "name": self.name,
+            "description": self.description,
+            "members": list(self.members),
+        }
+
+
+Extractor = Callable[[Path, int], Optional[PackageInfo]]
+
+# File name -> extractor, in the order manifests are preferred for the project name
+EXTRACTORS: dict = {}
+
+
+def register_extractor(*names: str) -> Callable[[Extractor], Extractor]:
+    """Register an extractor for the manifests called names."""
+    def decorator(extractor: Extractor) -> Extractor:
+        for name in names:
+            EXTRACTORS[name] = extractor
+        return extractor
+    return decorator
+
+
+def _str(value) -> str:
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _strings(values) -> list:
+    return [v for v in (_str(v) for v in values) if v] if isinstance(values, list) else []
+
+
+def _table(data: dict, *keys: str) -> dict:
+    for key in keys:
+        data = data.get(key)
+        if not isinstance(data, dict):
+            return {}
+    return data
+
+
+def _load_json(path: Path, max_bytes: int) -> Optional[dict]:
+    data = json.loads(read_text_head(path, max_bytes) or "null")
+    return data if isinstance(data, dict) else None
+
+
+def _load_toml(path: Path, max_bytes: int) -> dict:
+    import tomllib
+
+    return tomllib.loads(read_text_head(path, max_bytes))
+
+
+@register_extractor("package.json")
+def extract_package_json(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+    data = _load_json(path, max_bytes)
+    if data is None:
+        return None
+    workspaces = data.get("workspaces")
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get("packages")
+    return PackageInfo(path.name, "npm", _str(data.get("name")), _str(data.get("description")), _strings(workspaces))
+
+
+@register_extractor("pyproject.toml")
+def extract_pyproject(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+    data = _load_toml(path, max_bytes)
+    project = _table(data, "project") or _table(data, "tool", "poetry")
+    members = _table(data, "tool", "uv", "workspace").get("members")
+    return PackageInfo(path.name, "python", _str(project.get("name")), _str(project.get("description")), _strings(members))
+
+
+@register_extractor("Cargo.toml")
+def extract_cargo(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+    data = _load_toml(path, max_bytes)
+    package = _table(data, "package")
+    members = _table(data, "workspace").get("members")
+    # `description.workspace = true` inherits from [workspace.package]
+    description = _str(package.get("description")) or _str(_table(data, "workspace", "package").get("description"))
+    return PackageInfo(path.name, "cargo", _str(package.get("name")), description, _strings(members))
+
+
+_GO_MODULE_RE = re.compile(rb"^\s*module\s+\"?([^\s\"]+)")
+
+
+@register_extractor("go.mod")
+def extract_go_mod(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+    # The module directive comes first; stop reading there
+    for line in read_lines(path, max_bytes):
+        match = _GO_MODULE_RE.match(line)
+        if match:
+            return PackageInfo(path.name, "go", match.group(1).decode("utf-8", errors="replace"))
+    return None
+
+
+@register_extractor("go.work")
+def extract_go_work(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+    members, in_block = [], False
+    for line in read_lines(path, max_bytes):
+        words = line.split(b"//", 1)[0].decode("utf-8", errors="replace").split()
+        if not words:
+            continue
+        if in_block:
+            if words[0] == ")":
+                in_block = False
+            else:
+                members.append(words[0])
+        elif words[0] in ("use(", "use") and words[1:2] in ([], ["("]):
+            in_block = True
+        elif words[0] == "use":
+            members.append(words[1])
+    return PackageInfo(path.name, "go", members=members)
+
+
+@register_extractor("composer.json")
+def extract_composer(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+    data = _load_json(path, max_bytes)
+    if data is None:
+        return None
+    repositories = data.get("repositories")
+    members = [
+        _str(repo.get("url"))
+        for repo in (repositories if isinstance(repositories, list) else [])
+        if isinstance(repo, dict) and repo.get("type") == "path" and _str(repo.get("url"))
+    ]
+    return PackageInfo(path.name, "composer", _str(data.get("name")), _str(data.get("description")), members)
+
+
+@register_extractor("Gemfile")
+def extract_gemfile(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+    # Gemfiles list dependencies only; the project itself is described by its gemspec
+    return PackageInfo(path.name, "ruby")
+
+
+@register_extractor("pom.xml")
+def extract_pom(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+    from xml.etree.ElementTree import ParseError, XMLPullParser
+
+    parser = XMLPullParser(events=("start", "end"))
+    fields, members = {}, []
+    depth = 0
+
+    def local(tag: str) -> str:
+        return tag.rpartition("}")[2]
+
+    try:
+        for line in read_lines(path, max_bytes):
+            parser.feed(line)
+            for event, elem in parser.read_events():
+                if event == "start":
+                    depth += 1
+                    continue
+                depth -= 1
+                tag = local(elem.tag)
+                if depth == 1 and tag in ("artifactId", "name", "description"):
+                    fields[tag] = " ".join((elem.text or "").split())
+                elif depth == 2 and tag == "module":
+                    members.append((elem.text or "").strip())
+                if depth <= 2:
+                    # Drop finished subtrees so memory stays flat on large POMs
+                    elem.clear()
+    except ParseError:
+        # Keep what was read before a malformed or cut-off part
+        pass
+    if not fields and not members:
+        return None
+    name = fields.get("name") or fields.get("artifactId", "")
+    return PackageInfo(path.name, "maven", name, fields.get("description", ""), [m for m in members if m])
+
+
+_GRADLE_ASSIGN_RE = re.compile(r"""^\s*(rootProject\.name|description)\s*=\s*["']([^"'\n]*)["']""", re.MULTILINE)
+_GRADLE_INCLUDE_RE = re.compile(r"""^\s*include\b(.*)$""", re.MULTILINE)
+_GRADLE_PROJECT_RE = re.compile(r"""["']:?([^"'\s]+)["']""")
+
+
+@register_extractor("build.gradle", "build.gradle.kts", "settings.gradle", "settings.gradle.kts")
+def extract_gradle(path: Path, max_bytes: int) -> Optional[PackageInfo]:
+    # Gradle scripts are code; only the plain assignments and include lines are read
+    text = read_text_head(path, max_bytes)
+    values = dict(_GRADLE_ASSIGN_RE.findall(text))
+    members = [
+        project.replace(":", "/")
+        for args in _GRADLE_INCLUDE_RE.findall(text)
+        for project in _GRADLE_PROJECT_RE.findall(args)
+    ]
+    return PackageInfo(path.name, "gradle", values.get("rootProject.name", ""), values.get("description", ""), members)
+
+
+@traced(cat="discovery")
+def extract_manifests(
+    project_path: Path,
+    names: Optional[Iterable[str]] = None,
+    max_bytes: int = DEFAULT_MAX_READ_BYTES,
+) -> list:
+    """
+    Run the registered extractor of every manifest in names (default: all
+    registered ones) that exists in project_path, concurrently. Returns
+    PackageInfo objects in registry order; manifests that cannot be read or
+    parsed are left out.
+    """
+    wanted = set(EXTRACTORS if names is None else names)
+    present = [name for name in EXTRACTORS if name in wanted and (project_path / name).is_file()]
+    results = read_many([project_path / name for name in present], lambda p: EXTRACTORS[p.name](p, max_bytes))
+    return [info for info in results if isinstance(info, PackageInfo)]
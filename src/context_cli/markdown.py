@@ -0,0 +1,182 @@
+"""
+One-pass markdown section map.
+
+Tokenizes the ATX headings of a markdown document in a single pass and
+records, per section, the heading level, the normalized title, the byte
+offsets of the heading, body and section end, and the first paragraph of
+body text. Callers then look sections up by title in O(1) instead of
+re-scanning the document for every header they are interested in.
+
+`build_section_map` works on a document in memory and keeps it, so callers
+can slice sections out by offset. `stream_section_map` takes an iterable of
+lines instead and keeps only the headings, so a large file can be mapped
+with bounded memory and abandoned as soon as the caller has what it needs.
+
+Usage:
+    with open("README.md", "rb") as f:
+        sections = stream_section_map(f)
+    intent = sections.find("intent", level=2)
+    if intent:
+        print(intent.first_paragraph)
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional, Union
+
+HEADING_RE = re.compile(rb"^(#{1,6})[ \t]+(.*?)[ \t]*#*[ \t]*$")
+_EDGE_RE = re.compile(r"^[^\w(]+|[^\w)]+$")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase a heading, collapse whitespace and strip edge punctuation/emoji."""
+    return _EDGE_RE.sub("", _SPACE_RE.sub(" ", title.strip().lower()))
+
+
+@dataclass
+class Section:
+    """A heading and the span of the document it introduces."""
+
+    level: int
+    title: str
+    key: str
+    start: int
+    body_start: int
+    end: int = -1
+    first_paragraph: str = ""
+
+
+@dataclass
+class SectionMap:
+    """Headings of a markdown document, indexed by normalized title."""
+
+    data: bytes
+    sections: list = field(default_factory=list)
+    by_key: dict = field(default_factory=dict)
+
+    def find(self, title: str, level: Optional[int] = None) -> Optional[Section]:
+        """Return the first section with the given title (and level, if set)."""
+        for section in self.by_key.get(normalize_title(title), ()):
+            if level is None or section.level == level:
+                return section
+        return None
+
+    def find_prefix(self, prefixes: Iterable[str], min_level: int = 1) -> Optional[Section]:
+        """Return the first section whose normalized title starts with a prefix."""
+        prefixes = tuple(normalize_title(p) for p in prefixes)
+        for section in self.sections:
+            if section.level >= min_level and section.key.startswith(prefixes):
+                return section
+        return None
+
+
+class _SectionMapBuilder:
+    """Incremental state of a single pass over a document's lines."""
+
+    def __init__(self, result: SectionMap, max_paragraph: Optional[int] = None):
+        self.result = result
+        self.max_paragraph = max_paragraph
+        self.offset = 0
+        self.in_fence = False
+        self.open_sections = []
+        # Sections (a heading and its open parents) still waiting for body text
+        self.pending = []
+        self.paragraph = []
+        self.paragraph_len = 0
+
+    def flush_paragraph(self) -> bool:
+        """Assign the collected paragraph to pending sections; True if any got one."""
+        assigned = False
+        if self.pending and self.paragraph:
+            text = " ".join(self.paragraph)
+            for section in self.pending:
+                section.first_paragraph = text
+            self.pending.clear()
+            assigned = True
+        self.paragraph.clear()
+        self.paragraph_len = 0
+        return assigned
+
+    def feed(self, raw: bytes) -> bool:
+        """Consume one line (with its line ending); True if the map gained a heading or paragraph."""
+        line_start = self.offset
+        self.offset += len(raw)
+        line = raw.rstrip(b"\r\n")
+        stripped = line.strip()
+
+        if stripped.startswith(b"```") or stripped.startswith(b"~~~"):
+            self.in_fence = not self.in_fence
+            return self.flush_paragraph()
+        if self.in_fence:
+            return False
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            self.flush_paragraph()
+            level = len(heading.group(1))
+            title = heading.group(2).decode("utf-8", errors="replace")
+            while self.open_sections and self.open_sections[-1].level >= level:
+                closed = self.open_sections.pop()
+                closed.end = line_start
+                if closed in self.pending:
+                    self.pending.remove(closed)
+            section = Section(
+                level=level,
+                title=title,
+                key=normalize_title(title),
+                start=line_start,
+                body_start=self.offset,
+            )
+            self.result.sections.append(section)
+            self.result.by_key.setdefault(section.key, []).append(section)
+            self.open_sections.append(section)
+            self.pending.append(section)
+            return True
+
+        if not self.pending:
+            return False
+        if stripped:
+            if self.max_paragraph is None or self.paragraph_len < self.max_paragraph:
+                text = stripped.decode("utf-8", errors="replace")
+                self.paragraph.append(text)
+                self.paragraph_len += len(text)
+            return False
+        if self.paragraph:
+            return self.flush_paragraph()
+        return False
+
+    def finish(self) -> SectionMap:
+        self.flush_paragraph()
+        for section in self.open_sections:
+            section.end = self.offset
+        return self.result
+
+
+def build_section_map(data: Union[bytes, str]) -> SectionMap:
+    """Build a section map from markdown content in a single pass."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    builder = _SectionMapBuilder(SectionMap(data=data))
+    for raw in data.splitlines(keepends=True):
+        builder.feed(raw)
+    return builder.finish()
+
+
+def stream_section_map(
+    lines: Iterable[bytes],
+    stop: Optional[Callable[[SectionMap], bool]] = None,
+    max_paragraph: Optional[int] = None,
+) -> SectionMap:
+    """
+    Build a section map from an iterable of byte lines without keeping the
+    document (`data` stays empty). `stop` is called whenever a heading or
+    first paragraph is added and ends the read early when it returns True;
+    first paragraphs are cut off after about `max_paragraph` characters.
+    """
+    builder = _SectionMapBuilder(SectionMap(data=b""), max_paragraph=max_paragraph)
+    for raw in lines:
+        if builder.feed(raw) and stop is not None and stop(builder.result):
+            break
+    return builder.finish()
@@ -0,0 +1,163 @@
+"""
+Concurrent-safe outcome creation.
+
+Outcome numbers are allocated under an exclusive lock on
+`.context/cache/outcome.lock` from a counter file that remembers the last
+number handed out. The counter also records the mtime of
+`.context/outcomes/`; the directory is only rescanned when that mtime shows
+an outcome was added or removed by something else (e.g. the bash script or
+a manual `mkdir`), so allocation is O(1) in the common case and two agents
+creating outcomes at the same time never receive the same number.
+"""
+
+import json
+import os
+import re
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .index import cache_dir, write_json_atomic
+
+SHORT_NAME_RE = re.compile(r"^[a-z][a-z0-9-]*$")
+OUTCOME_DIR_RE = re.compile(r"^(\d+)")
+
+COUNTER_FILE = "outcome-counter.json"
+LOCK_FILE = "outcome.lock"
+
+
+class OutcomeError(Exception):
+    """Raised when an outcome cannot be created."""
+
+
+def find_repo_root(start: Path) -> Optional[Path]:
+    """Return the nearest directory at or above start that contains .context/."""
+    for path in [start, *start.parents]:
+        if (path / ".context").is_dir():
+            return path
+    return None
+
+
+@contextmanager
+def exclusive_lock(path: Path):
+    """Hold an exclusive, process-wide lock on path for the duration of the block."""
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def highest_outcome_number(outcomes_dir: Path) -> int:
+    """Scan outcomes_dir for the highest `###-name` number (0 if none)."""
+    highest = 0
+    try:
+        with os.scandir(outcomes_dir) as it:
+            for entry in it:
+                match = OUTCOME_DIR_RE.match(entry.name)
+                if match and entry.is_dir():
+                    highest = max(highest, int(match.group(1)))
+    except FileNotFoundError:
+        pass
+    return highest
+
+
+def _read_counter(path: Path) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def render_outcome_template(template: str, short_name: str, number: str) -> str:
+    """Fill the outcome template placeholders the same way create-new-outcome.sh does."""
+    outcome_name = f"{number}-{short_name}"
+    return (
+        template.replace("[OUTCOME_NAME]", short_name)
+        .replace("KO-[###]", f"KO-{number}")
+        .replace("[###-outcome-name]", outcome_name)
+        .replace("[DATE]", datetime.now().strftime("%Y-%m-%d"))
+    )
+
+
+def create_outcome(repo_root: Path, short_name: str, number: Optional[str] = None) -> dict:
+    """
+    Create `.context/outcomes/###-short-name/` with outcome.md and checklists/.
+
+    Returns the same fields as `create-new-outcome.sh --json`.
+    """
+    if not SHORT_NAME_RE.match(short_name):
+        raise OutcomeError("Invalid short name. Use lowercase letters, numbers, and hyphens only.")
+
+    context_dir = repo_root / ".context"
+    if not (context_dir / "memory" / "constitution.md").is_file():
+        raise OutcomeError("Constitution not found. Run /context.constitution first.")
+
+    outcomes_dir = context_dir / "outcomes"
+    outcomes_dir.mkdir(parents=True, exist_ok=True)
+    cache = cache_dir(repo_root)
+    counter_path = cache / COUNTER_FILE
+
+    with exclusive_lock(cache / LOCK_FILE):
+        counter = _read_counter(counter_path)
+        last = counter.get("last", 0)
+        if counter.get("outcomes_mtime_ns") != _mtime_ns(outcomes_dir):
+            # Outcomes changed outside this allocator since the last run
+            last = max(last, highest_outcome_number(outcomes_dir))
+
+        if number is None:
+            value = last + 1
+            number = f"{value:03d}"
+        else:
+            if not number.isdigit():
+                raise OutcomeError(f"Invalid outcome number: {number}")
+            value = int(number)
+
+        outcome_name = f"{number}-{short_name}"
+        outcome_dir = outcomes_dir / outcome_name
+        try:
+            outcome_dir.mkdir()
+        except FileExistsError:
+            raise OutcomeError(f"Outcome directory already exists: {outcome_dir}")
+
+        write_json_atomic(counter_path, {
+            "last": max(last, value),
+            "outcomes_mtime_ns": _mtime_ns(outcomes_dir),
+        })
+
+    (outcome_dir / "checklists").mkdir(exist_ok=True)
+
+    template_path = context_dir / "templates" / "outcome-template.md"
+    if template_path.is_file():
+        content = render_outcome_template(template_path.read_text(encoding="utf-8"), short_name, number)
+        (outcome_dir / "outcome.md").write_text(content, encoding="utf-8")
+
+    return {
+        "outcome_id": f"KO-{number}",
+        "outcome_name": outcome_name,
+        "outcome_dir": str(outcome_dir),
+        "files_created": ["outcome.md", "checklists/"],
+    }
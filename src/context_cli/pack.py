@@ -0,0 +1,277 @@
+"""
+Token-budgeted context packs.
+
+Assembles the constitution, the outcome definitions and everything under
+`context-artifacts/` into a stream of chunks ready to hand to an AI:
+
+- each source is split at its top-level sections (long sections further at
+  paragraph breaks) into chunks whose ID is a hash of their normalized text,
+  so IDs are stable across runs and identical chunks are emitted only once,
+- chunks are ordered by priority: the constitution first, then outcomes by
+  their `**Priority**` (P1 before P2 ...), then artifacts, which inherit the
+  best priority of the outcomes (`KO-###`) they reference,
+- with a token budget, chunks are taken in that order until the first one
+  that does not fit; it and every later chunk are reported as over budget,
+  so a lower-priority chunk never takes the place of a higher-priority one.
+
+The chunk layout of each source (ID, heading, token count and byte span) is
+cached in `.context/cache/pack.json` keyed by mtime and size, so a repeated
+pack only re-chunks the files that changed. Chunk text is not cached: the
+chunks that are emitted are read back from their source by byte span.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .index import ARTIFACT_CATEGORIES, ARTIFACTS_DIR, OUTCOMES_DIR, EngagementIndex, walk_files
+from .markdown import build_section_map
+from .tokenizers import count_tokens
+
+PACK_VERSION = 2
+PACK_CACHE = "pack.json"
+
+# Chunks longer than this are split at paragraph breaks
+MAX_CHUNK_TOKENS = 512
+
+# Rank of sources without a priority (after P1..P9)
+UNPRIORITIZED = 10
+
+PRIORITY_RE = re.compile(r"\*\*Priority\*\*:\s*P(\d)")
+OUTCOME_REF_RE = re.compile(r"\bKO-(\d+)\b")
+_SPACE_RE = re.compile(r"\s+")
+_PARAGRAPH_BREAK_RE = re.compile(rb"\n\s*\n")
+
+
+def chunk_id(text: str) -> str:
+    """Return a stable ID for a chunk: a hash of its whitespace-normalized text."""
+    normalized = _SPACE_RE.sub(" ", text).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def _strip_span(data: bytes, start: int, end: int) -> tuple:
+    """Narrow a byte span to exclude leading and trailing whitespace."""
+    text = data[start:end]
+    stripped = text.lstrip()
+    start += len(text) - len(stripped)
+    return start, start + len(stripped.rstrip())
+
+
+def _split_long(data: bytes, start: int, end: int) -> list:
+    """Split an oversized span at blank lines into spans of at most MAX_CHUNK_TOKENS."""
+    breaks = [(m.start(), m.end()) for m in _PARAGRAPH_BREAK_RE.finditer(data, start, end)]
+    paragraphs = zip([start] + [b_end for _, b_end in breaks], [b_start for b_start, _ in breaks] + [end])
+    pieces, piece_start, piece_end, piece_tokens = [], None, None, 0
+    for p_start, p_end in paragraphs:
+        tokens = count_tokens(data[p_start:p_end].decode("utf-8", errors="replace"))
+        if piece_start is not None and piece_tokens + tokens > MAX_CHUNK_TOKENS:
+            pieces.append((piece_start, piece_end))
+            piece_start, piece_tokens = None, 0
+        if piece_start is None:
+            piece_start = p_start
+        piece_end = p_end
+        piece_tokens += tokens
+    if piece_start is not None:
+        pieces.append((piece_start, piece_end))
+    return [_strip_span(data, s, e) for s, e in pieces]
+
+
+def chunk_markdown(data: bytes) -> list:
+    """Split a markdown document into (heading, start, end) chunks at level 1-2 headings.
+
+    Spans are byte offsets into data, without surrounding whitespace.
+    """
+    sections = [s for s in build_section_map(data).sections if s.level <= 2]
+    bounds = [(None, 0)] + [(s, s.start) for s in sections]
+    chunks = []
+    for i, (section, start) in enumerate(bounds):
+        end = bounds[i + 1][1] if i + 1 < len(bounds) else len(data)
+        start, end = _strip_span(data, start, end)
+        if start == end:
+            continue
+        heading = section.title if section else ""
+        if count_tokens(data[start:end].decode("utf-8", errors="replace")) > MAX_CHUNK_TOKENS:
+            chunks.extend((heading, s, e) for s, e in _split_long(data, start, end) if s < e)
+        else:
+            chunks.append((heading, start, end))
+    return chunks
+
+
+def summarize_source(path: Path) -> dict:
+    """Chunk a source file (cached by the pack index)."""
+    data = path.read_bytes()
+    text = data.decode("utf-8", errors="replace")
+    priority = PRIORITY_RE.search(text)
+    chunks = []
+    for heading, start, end in chunk_markdown(data):
+        body = data[start:end].decode("utf-8", errors="replace")
+        chunks.append({"id": chunk_id(body), "heading": heading, "tokens": count_tokens(body), "start": start, "end": end})
+    return {
+        "version": PACK_VERSION,
+        "priority": int(priority.group(1)) if priority else None,
+        "refs": sorted({int(n) for n in OUTCOME_REF_RE.findall(text)}),
+        "chunks": chunks,
+    }
+
+
+def _lookup(index: EngagementIndex, path: Path, stat: Optional[os.stat_result] = None) -> dict:
+    summary = index.lookup(path, summarize_source, stat)
+    if summary.get("version") != PACK_VERSION:
+        # Cached by an older pack (chunk text inline, no spans): re-chunk
+        index.forget(path)
+        summary = index.lookup(path, summarize_source, stat)
+    return summary
+
+
+@dataclass
+class Chunk:
+    id: str
+    source: str
+    kind: str
+    heading: str
+    tokens: int
+    priority: int
+    text: str
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "source": self.source,
+            "kind": self.kind,
+            "heading": self.heading,
+            "priority": self.priority,
+            "tokens": self.tokens,
+            "text": self.text,
+        }
+
+
+@dataclass
+class PackStats:
+    sources: int = 0
+    regenerated: int = 0
+    chunks: int = 0
+    tokens: int = 0
+    duplicates: int = 0
+    over_budget: list = field(default_factory=list)
+    # Sources that changed after they were chunked; none of their chunks were emitted
+    stale: list = field(default_factory=list)
+
+
+def _sources(project_path: Path, index: EngagementIndex, include_outcomes: bool) -> list:
+    """Return (kind, path, summary, rank) for every pack source, cached through index."""
+    sources = []
+    constitution = project_path / ".context" / "memory" / "constitution.md"
+    if constitution.is_file():
+        sources.append(("constitution", constitution, _lookup(index, constitution), 0))
+
+    outcome_ranks = {}
+    outcomes_dir = project_path / OUTCOMES_DIR
+    index.track(OUTCOMES_DIR)
+    try:
+        with os.scandir(outcomes_dir) as it:
+            outcome_dirs = sorted(e.name for e in it if e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        outcome_dirs = []
+    for name in outcome_dirs:
+        path = outcomes_dir / name / "outcome.md"
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        summary = _lookup(index, path, stat)
+        number = re.match(r"\d+", name)
+        rank = summary["priority"] or UNPRIORITIZED
+        if number:
+            outcome_ranks[int(number.group(0))] = rank
+        if include_outcomes:
+            sources.append(("outcome", path, summary, rank))
+
+    index.track(ARTIFACTS_DIR)
+    for entry in walk_files(project_path / ARTIFACTS_DIR):
+        path = Path(entry.path)
+        summary = _lookup(index, path, entry.stat())
+        rank = min((outcome_ranks.get(n, UNPRIORITIZED) for n in summary["refs"]), default=UNPRIORITIZED)
+        sources.append(("artifact", path, summary, rank))
+    return sources
+
+
+def _category_order(path: Path, project_path: Path) -> int:
+    parts = path.relative_to(project_path / ARTIFACTS_DIR).parts
+    category = parts[0] if len(parts) > 1 else ""
+    return ARTIFACT_CATEGORIES.index(category) if category in ARTIFACT_CATEGORIES else len(ARTIFACT_CATEGORIES)
+
+
+def iter_pack(
+    project_path: Path,
+    budget: Optional[int] = None,
+    include_outcomes: bool = True,
+    stats: Optional[PackStats] = None,
+) -> Iterator[Chunk]:
+    """
+    Yield the deduplicated chunks of an engagement in priority order, up to
+    the first chunk that would exceed the token budget; that chunk and all
+    later ones are listed in stats.over_budget. A source that changed while
+    packing is skipped and listed in stats.stale. Fills stats (if given) as
+    it goes.
+    """
+    stats = stats if stats is not None else PackStats()
+
+    with EngagementIndex(project_path, name=PACK_CACHE) as index:
+        sources = _sources(project_path, index, include_outcomes)
+        stats.regenerated = index.stats["misses"]
+
+    def order(source):
+        # Constitution first, then by priority; within a priority outcomes before artifacts
+        kind, path, _summary, rank = source
+        category = _category_order(path, project_path) if kind == "artifact" else 0
+        return (kind != "constitution", rank, kind == "artifact", category, path.as_posix())
+
+    seen = set()
+    over = set()
+    full = False
+    stats.sources = len(sources)
+    for kind, path, summary, rank in sorted(sources, key=order):
+        rel = path.relative_to(project_path).as_posix()
+        record = index.entries.get(rel)
+        f = None
+        try:
+            for entry in summary["chunks"]:
+                if entry["id"] in seen or entry["id"] in over:
+                    stats.duplicates += 1
+                    continue
+                if full or (budget is not None and stats.tokens + entry["tokens"] > budget):
+                    full = True
+                    over.add(entry["id"])
+                    stats.over_budget.append(entry["id"])
+                    continue
+                if f is None:
+                    f = open(path, "rb")
+                    st = os.fstat(f.fileno())
+                    if record is None or (st.st_mtime_ns, st.st_size) != (record["mtime_ns"], record["size"]):
+                        # The source changed since it was chunked: its spans are stale
+                        stats.stale.append(rel)
+                        break
+                f.seek(entry["start"])
+                text = f.read(entry["end"] - entry["start"]).decode("utf-8", errors="replace")
+                seen.add(entry["id"])
+                stats.chunks += 1
+                stats.tokens += entry["tokens"]
+                yield Chunk(
+                    id=entry["id"],
+                    source=rel,
+                    kind=kind,
+                    heading=entry["heading"],
+                    tokens=entry["tokens"],
+                    priority=rank,
+                    text=text,
+                )
+        finally:
+            if f is not None:
+                f.close()
+
+
+def format_chunk_markdown(chunk: Chunk) -> str:
+    return f"<!-- chunk {chunk.id} source={chunk.source} tokens={chunk.tokens} -->\n{chunk.text}\n"
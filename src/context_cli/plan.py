@@ -0,0 +1,179 @@
+"""
+Task scheduling from tasks.md markers.
+
+Turns the tasks of an outcome into a dependency DAG using the markers
+defined in `tasks-template.md`:
+
+- tasks without `[P]` run in the order they are listed within their phase,
+  so each depends on the previous unmarked task of the phase,
+- `[P]` tasks have no dependencies inside their phase,
+- `[B]` tasks must complete before the next phase starts; a phase without
+  any `[B]` task blocks the next phase as a whole.
+
+Completed tasks count as satisfied dependencies. Open tasks are grouped into
+waves (every task in a wave only depends on earlier waves) and the longest
+dependency chain is reported as the critical path. The first wave is the
+batch that can be handed to agents right now.
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .index import OUTCOMES_DIR
+from .tasks import Task, parse_tasks
+
+PLAN_VERSION = 1
+
+
+class PlanError(Exception):
+    """Raised when an outcome or its tasks cannot be found."""
+
+
+@dataclass
+class Plan:
+    """The schedule of the open tasks of one outcome."""
+
+    outcome: str
+    tasks: dict = field(default_factory=dict)
+    deps: dict = field(default_factory=dict)
+    waves: list = field(default_factory=list)
+    critical_path: list = field(default_factory=list)
+
+    @property
+    def next_batch(self) -> list:
+        return self.waves[0] if self.waves else []
+
+    def task_dict(self, key: str) -> dict:
+        task = self.tasks[key]
+        return {
+            "id": key,
+            "text": task_title(task),
+            "phase": task.phase,
+            "parallel": task.parallel,
+            "blocking": task.blocking,
+            "outcome_refs": task.outcome_refs,
+            "line": task.line,
+            "depends_on": sorted(self.deps[key]),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "version": PLAN_VERSION,
+            "outcome": self.outcome,
+            "open_tasks": sum(len(w) for w in self.waves),
+            "waves": [[self.task_dict(key) for key in wave] for wave in self.waves],
+            "critical_path": self.critical_path,
+            "next_batch": [self.task_dict(key) for key in self.next_batch],
+        }
+
+
+def resolve_outcome(project_path: Path, ref: str) -> Path:
+    """Find an outcome directory by number (`1`, `001`, `KO-001`), full name or short name."""
+    outcomes_dir = project_path / OUTCOMES_DIR
+    try:
+        dirs = sorted(p for p in outcomes_dir.iterdir() if p.is_dir())
+    except FileNotFoundError:
+        raise PlanError("No outcomes directory found")
+
+    number = re.fullmatch(r"(?:KO-)?(\d+)", ref, re.IGNORECASE)
+    for path in dirs:
+        prefix, _, short_name = path.name.partition("-")
+        if number and prefix.isdigit() and int(prefix) == int(number.group(1)):
+            return path
+        if ref in (path.name, short_name):
+            return path
+    raise PlanError(f"Outcome not found: {ref}")
+
+
+def task_title(task: Task) -> str:
+    """Return the task text without its leading ID."""
+    if task.id and task.text.startswith(task.id):
+        return task.text[len(task.id):].strip()
+    return task.text
+
+
+def _key(task: Task) -> str:
+    return task.id or f"L{task.line}"
+
+
+def build_plan(tasks: list, outcome: str = "") -> Plan:
+    """Build the dependency DAG of tasks and schedule the open ones."""
+    plan = Plan(outcome=outcome)
+    phases = {}
+    for task in tasks:
+        phases.setdefault(task.phase or 0, []).append(task)
+
+    gate = []
+    task_keys = {}
+    for number in sorted(phases):
+        previous_serial = None
+        phase_tasks = phases[number]
+        for task in phase_tasks:
+            key = _key(task)
+            if key in plan.tasks:
+                # Duplicate task ID: keep both, told apart by line
+                key = f"{key}@L{task.line}"
+            task_keys[id(task)] = key
+            plan.tasks[key] = task
+            deps = set(gate)
+            if not task.parallel:
+                if previous_serial is not None:
+                    deps.add(previous_serial)
+                previous_serial = key
+            plan.deps[key] = deps
+        blocking = [task_keys[id(t)] for t in phase_tasks if t.blocking]
+        # Later phases reach earlier gates transitively through this one
+        gate = blocking or [task_keys[id(t)] for t in phase_tasks]
+
+    # Kahn's algorithm over open tasks; done tasks are satisfied dependencies
+    open_keys = [key for key, task in plan.tasks.items() if not task.done]
+    pending = {key: {d for d in plan.deps[key] if not plan.tasks[d].done} for key in open_keys}
+    dependents = {key: [] for key in open_keys}
+    for key, deps in pending.items():
+        for dep in deps:
+            dependents[dep].append(key)
+
+    level = {}
+    longest = {}
+    via = {}
+    remaining = {key: len(deps) for key, deps in pending.items()}
+    queue = deque(key for key in open_keys if not remaining[key])
+    for key in queue:
+        level[key] = 0
+        longest[key] = 1
+    while queue:
+        key = queue.popleft()
+        for child in dependents[key]:
+            if level.get(child, -1) < level[key] + 1:
+                level[child] = level[key] + 1
+            if longest.get(child, 0) < longest[key] + 1:
+                longest[child] = longest[key] + 1
+                via[child] = key
+            remaining[child] -= 1
+            if not remaining[child]:
+                queue.append(child)
+
+    waves = {}
+    for key in open_keys:
+        waves.setdefault(level[key], []).append(key)
+    plan.waves = [waves[i] for i in sorted(waves)]
+
+    if longest:
+        # Longest chain; ties go to the task listed first
+        end = max(open_keys, key=lambda k: longest[k])
+        path = [end]
+        while path[-1] in via:
+            path.append(via[path[-1]])
+        plan.critical_path = list(reversed(path))
+    return plan
+
+
+def plan_outcome(project_path: Path, ref: str) -> Plan:
+    """Load an outcome's tasks.md and schedule it."""
+    outcome_dir = resolve_outcome(project_path, ref)
+    tasks_path = outcome_dir / "tasks.md"
+    if not tasks_path.is_file():
+        raise PlanError(f"{outcome_dir.name} has no tasks.md. Run /context.tasks first.")
+    return build_plan(parse_tasks(tasks_path).tasks, outcome_dir.name)
@@ -0,0 +1,240 @@
+"""
+Pruned project scanners used by project discovery and `companyspec scan`.
+
+Walks the project once with `os.scandir`, collecting documentation files from
+the project root, `docs/` (recursively), `.claude/` and `.github/`. Vendored
+and generated directories are pruned, and the walk stops at a maximum depth
+and file count so `init` stays fast in large monorepos. File reads that
+follow the walk are fanned out over a thread pool and are bounded:
+`read_lines` streams a file line by line up to a byte cap and skips binary
+files, so a huge generated document costs no more memory than a small one.
+`find_engagements` uses the same pruning to locate every engagement under a
+monorepo root.
+"""
+
+import fnmatch
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from .trace import traced
+
+# Directory names that are never descended into
+DEFAULT_EXCLUDES = [
+    ".git", ".hg", ".svn", "node_modules", ".venv", "venv", "__pycache__",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+    "build", "dist", "target", "_build", "site", ".next", ".cache",
+]
+
+DEFAULT_MAX_DEPTH = 8
+DEFAULT_MAX_FILES = 5000
+DEFAULT_READ_WORKERS = 8
+
+# Bytes read from any single file during discovery
+DEFAULT_MAX_READ_BYTES = 1 << 20
+# Lines longer than this are cut off (the rest is skipped, not kept)
+MAX_LINE_BYTES = 1 << 16
+# A NUL byte in the first block marks a file as binary
+SNIFF_BYTES = 8192
+
+DOC_EXTENSIONS = (".md", ".txt", ".rst")
+
+# Directories scanned (non-recursively) in addition to the project root
+SHALLOW_DOC_DIRS = [".claude", ".github"]
+
+
+@dataclass
+class ScanResult:
+    """Documentation files found by a project scan."""
+
+    docs: list = field(default_factory=list)
+    root_entries: set = field(default_factory=set)
+    truncated: bool = False
+
+
+def _list_dir(path: str) -> list:
+    try:
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return []
+
+
+def _is_excluded(name: str, rel_path: str, excludes: Iterable[str]) -> bool:
+    for pattern in excludes:
+        if fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(rel_path, pattern):
+            return True
+    return False
+
+
+@traced()
+def scan_project_docs(
+    project_path: Path,
+    excludes: Optional[Iterable[str]] = None,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    max_files: int = DEFAULT_MAX_FILES,
+) -> ScanResult:
+    """
+    Collect documentation files in the same order as the original glob-based
+    discovery: root files by extension, then `docs/**/*.md`, then the
+    remaining extensions in `docs/`, `.claude/` and `.github/`.
+    """
+    excludes = list(DEFAULT_EXCLUDES) + list(excludes or [])
+    result = ScanResult()
+    seen = set()
+
+    def add(rel_path: str) -> bool:
+        if rel_path in seen:
+            return True
+        if len(result.docs) >= max_files:
+            result.truncated = True
+            return False
+        seen.add(rel_path)
+        result.docs.append(rel_path)
+        return True
+
+    def add_by_extension(entries: list, rel_dir: str) -> bool:
+        files = [e for e in entries if e.is_file()]
+        for ext in DOC_EXTENSIONS:
+            for entry in files:
+                if entry.name.endswith(ext) and not add(os.path.join(rel_dir, entry.name)):
+                    return False
+        return True
+
+    def walk_markdown(path: str, rel_dir: str, depth: int) -> bool:
+        entries = _list_dir(path)
+        for entry in entries:
+            if entry.name.endswith(".md") and entry.is_file():
+                if not add(os.path.join(rel_dir, entry.name)):
+                    return False
+        if depth >= max_depth:
+            return True
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                rel_path = os.path.join(rel_dir, entry.name)
+                if _is_excluded(entry.name, rel_path, excludes):
+                    continue
+                if not walk_markdown(entry.path, rel_path, depth + 1):
+                    return False
+        return True
+
+    root_entries = _list_dir(str(project_path))
+    result.root_entries = {e.name for e in root_entries}
+
+    if not add_by_extension(root_entries, ""):
+        return result
+
+    if "docs" in result.root_entries and not _is_excluded("docs", "docs", excludes):
+        docs_path = os.path.join(project_path, "docs")
+        if not walk_markdown(docs_path, "docs", 1):
+            return result
+        if not add_by_extension(_list_dir(docs_path), "docs"):
+            return result
+
+    for name in SHALLOW_DOC_DIRS:
+        if name in result.root_entries and not _is_excluded(name, name, excludes):
+            if not add_by_extension(_list_dir(os.path.join(project_path, name)), name):
+                return result
+
+    return result
+
+
+@traced()
+def read_many(paths: list, reader: Callable[[Path], object], max_workers: int = DEFAULT_READ_WORKERS) -> list:
+    """
+    Apply reader to each path concurrently, preserving order. Exceptions
+    raised by the reader are returned in place of its result.
+    """
+    def safe_read(path):
+        try:
+            return reader(path)
+        except Exception as e:
+            return e
+
+    if len(paths) <= 1:
+        return [safe_read(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return list(pool.map(safe_read, paths))
+
+
+def looks_binary(head: bytes) -> bool:
+    """Sniff a file's first block: text files do not contain NUL bytes."""
+    return b"\0" in head
+
+
+def read_lines(path: Path, max_bytes: int = DEFAULT_MAX_READ_BYTES, max_line: int = MAX_LINE_BYTES) -> Iterator[bytes]:
+    """
+    Yield the lines of a text file (with line endings), reading at most
+    max_bytes in total. Binary files yield nothing; lines longer than
+    max_line are cut off. Memory use is bounded by max_line, not by the
+    size of the file.
+    """
+    with open(path, "rb") as f:
+        if looks_binary(f.read(SNIFF_BYTES)):
+            return
+        f.seek(0)
+        remaining = max_bytes
+        while remaining > 0:
+            line = f.readline(min(max_line, remaining))
+            if not line:
+                return
+            remaining -= len(line)
+            if not line.endswith(b"\n"):
+                # Over-long line: skip to its end without keeping it
+                while remaining > 0:
+                    rest = f.readline(min(max_line, remaining))
+                    remaining -= len(rest)
+                    if not rest or rest.endswith(b"\n"):
+                        break
+            yield line
+
+
+def read_text_head(path: Path, max_bytes: int = DEFAULT_MAX_READ_BYTES) -> str:
+    """Return the first max_bytes of a file as text ("" for binary files)."""
+    with open(path, "rb") as f:
+        data = f.read(max_bytes)
+    if looks_binary(data[:SNIFF_BYTES]):
+        return ""
+    return data.decode("utf-8", errors="replace")
+
+
+def find_engagements(
+    root: Path,
+    excludes: Optional[Iterable[str]] = None,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> list:
+    """
+    Return every directory under root (including root) that contains a
+    Company Spec `.context/` directory, found in a single pruned walk.
+    Hidden directories, excluded directories and the engagement's own
+    `.context/` and `context-artifacts/` trees are not descended into.
+    """
+    excludes = list(DEFAULT_EXCLUDES) + list(excludes or [])
+    found = []
+
+    def walk(path: str, rel_dir: str, depth: int):
+        entries = _list_dir(path)
+        names = {e.name for e in entries}
+        if ".context" in names and _is_engagement(os.path.join(path, ".context")):
+            found.append(Path(path))
+        if depth >= max_depth:
+            return
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name == "context-artifacts":
+                continue
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+            if _is_excluded(entry.name, rel_path, excludes):
+                continue
+            walk(entry.path, rel_path, depth + 1)
+
+    walk(str(root), "", 0)
+    return found
+
+
+def _is_engagement(context_path: str) -> bool:
+    """A .context directory belongs to Company Spec if it has its layout."""
+    return any(os.path.isdir(os.path.join(context_path, d)) for d in ("memory", "outcomes", "templates"))
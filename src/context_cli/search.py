@@ -0,0 +1,281 @@
+"""
+Full-text search over context artifacts.
+
+Keeps a persistent inverted index of every markdown file under
+`context-artifacts/` in `.context/cache/search.db` (SQLite, so a query only
+reads the postings of its own terms) and ranks matches with BM25. Heading
+terms count double. The index is brought up to date before each query with
+a stat pass: files whose mtime and size are unchanged are skipped, and
+files whose content hash is unchanged are not re-tokenized.
+
+Usage:
+    with SearchIndex(project_path) as index:
+        index.update()
+        for result in index.search("refund approval"):
+            print(result.path, result.score, result.snippet)
+"""
+
+import hashlib
+import heapq
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from .index import ARTIFACTS_DIR, cache_dir, walk_files
+from .markdown import HEADING_RE, build_section_map
+from .trace import traced
+
+SEARCH_VERSION = 1
+SEARCH_DB = "search.db"
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Term frequency weight of words that appear in a heading
+HEADING_WEIGHT = 2
+
+SNIPPET_CHARS = 160
+
+TOKEN_RE = re.compile(r"\w+")
+TABLE_RULE_RE = re.compile(r"^\s*\|?[\s:|-]+\|?\s*$")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or that the this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> list:
+    """Split text into lowercase search terms, dropping stopwords and single characters."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def document_terms(data: bytes) -> Counter:
+    """Return weighted term frequencies of a markdown document."""
+    terms = Counter()
+    for line in data.splitlines():
+        heading = HEADING_RE.match(line)
+        text = (heading.group(2) if heading else line).decode("utf-8", errors="replace")
+        weight = HEADING_WEIGHT if heading else 1
+        for term in tokenize(text):
+            terms[term] += weight
+    return terms
+
+
+@dataclass
+class SearchResult:
+    """A ranked match, with the heading and text around the best hit."""
+
+    path: Path
+    title: str
+    score: float
+    heading: str = ""
+    snippet: str = ""
+
+    def to_dict(self, project_path: Path) -> dict:
+        return {
+            "path": self.path.relative_to(project_path).as_posix(),
+            "title": self.title,
+            "score": round(self.score, 4),
+            "heading": self.heading,
+            "snippet": self.snippet,
+        }
+
+
+class SearchIndex:
+    """BM25 inverted index of the artifacts of one engagement."""
+
+    def __init__(self, project_path: Path):
+        import sqlite3
+
+        self.project_path = project_path
+        self.artifacts_dir = project_path / ARTIFACTS_DIR
+        self.path = cache_dir(project_path) / SEARCH_DB
+        self.db = sqlite3.connect(self.path)
+        self._init_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def _init_schema(self):
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SEARCH_VERSION:
+            self.db.executescript("""
+                DROP TABLE IF EXISTS docs;
+                DROP TABLE IF EXISTS postings;
+            """)
+        self.db.executescript(f"""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                length INTEGER NOT NULL,
+                title TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                doc_id INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, doc_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+            PRAGMA user_version = {SEARCH_VERSION};
+        """)
+
+    @traced("search index update")
+    def update(self) -> dict:
+        """Re-index added and changed artifacts and drop deleted ones."""
+        known = {
+            path: (doc_id, mtime_ns, size, sha256)
+            for doc_id, path, mtime_ns, size, sha256 in self.db.execute(
+                "SELECT id, path, mtime_ns, size, sha256 FROM docs"
+            )
+        }
+        stats = {"added": 0, "updated": 0, "touched": 0, "removed": 0, "unchanged": 0}
+        seen = set()
+        prefix_len = len(str(self.project_path)) + 1
+
+        with self.db:
+            for entry in walk_files(self.artifacts_dir):
+                rel = entry.path[prefix_len:].replace(os.sep, "/")
+                seen.add(rel)
+                stat = entry.stat()
+                record = known.get(rel)
+                if record and record[1] == stat.st_mtime_ns and record[2] == stat.st_size:
+                    stats["unchanged"] += 1
+                    continue
+
+                try:
+                    data = Path(entry.path).read_bytes()
+                except OSError:
+                    continue
+                sha256 = hashlib.sha256(data).hexdigest()
+                if record and record[3] == sha256:
+                    # Touched but not edited: refresh the stat, keep the postings
+                    self.db.execute(
+                        "UPDATE docs SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (stat.st_mtime_ns, stat.st_size, record[0]),
+                    )
+                    stats["touched"] += 1
+                    continue
+
+                terms = document_terms(data)
+                title = next((s.title for s in build_section_map(data).sections), "")
+                row = (stat.st_mtime_ns, stat.st_size, sha256, sum(terms.values()), title)
+                if record:
+                    doc_id = record[0]
+                    self.db.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+                    self.db.execute(
+                        "UPDATE docs SET mtime_ns = ?, size = ?, sha256 = ?, length = ?, title = ? WHERE id = ?",
+                        (*row, doc_id),
+                    )
+                    stats["updated"] += 1
+                else:
+                    doc_id = self.db.execute(
+                        "INSERT INTO docs (path, mtime_ns, size, sha256, length, title) VALUES (?, ?, ?, ?, ?, ?)",
+                        (rel, *row),
+                    ).lastrowid
+                    stats["added"] += 1
+                self.db.executemany(
+                    "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                    ((term, doc_id, tf) for term, tf in terms.items()),
+                )
+
+            for rel in known.keys() - seen:
+                doc_id = known[rel][0]
+                self.db.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+                self.db.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+                stats["removed"] += 1
+
+        return stats
+
+    @traced("search query")
+    def search(self, query: str, limit: int = 10) -> list:
+        """Return the best `limit` matches for query, ranked by BM25."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        total_docs, total_length = self.db.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs").fetchone()
+        if not total_docs:
+            return []
+        avg_length = total_length / total_docs
+
+        scores = {}
+        for term in terms:
+            rows = self.db.execute(
+                "SELECT p.doc_id, p.tf, d.length FROM postings p JOIN docs d ON d.id = p.doc_id WHERE p.term = ?",
+                (term,),
+            ).fetchall()
+            if not rows:
+                continue
+            idf = math.log(1 + (total_docs - len(rows) + 0.5) / (len(rows) + 0.5))
+            for doc_id, tf, length in rows:
+                norm = tf + K1 * (1 - B + B * length / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / norm
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        results = []
+        for doc_id, score in best:
+            rel, title = self.db.execute("SELECT path, title FROM docs WHERE id = ?", (doc_id,)).fetchone()
+            result = SearchResult(path=self.project_path / rel, title=title, score=score)
+            result.heading, result.snippet = snippet(result.path, terms)
+            results.append(result)
+        return results
+
+
+def snippet(path: Path, terms: list) -> tuple:
+    """Return (heading path, text excerpt) for the section of path that best matches terms."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return "", ""
+    sections = build_section_map(data)
+    wanted = set(terms)
+
+    # Candidate spans: the preamble before the first heading, then each section body
+    spans = [("", 0, sections.sections[0].start if sections.sections else len(data))]
+    trail = []
+    for i, section in enumerate(sections.sections):
+        trail = [s for s in trail if s.level < section.level] + [section]
+        # Stop at the next heading so a parent does not also cover its subsections
+        end = sections.sections[i + 1].start if i + 1 < len(sections.sections) else len(data)
+        spans.append((" > ".join(s.title for s in trail), section.start, end))
+
+    best_heading, best_text, best_hits = "", "", -1
+    for heading, start, end in spans:
+        text = data[start:end].decode("utf-8", errors="replace")
+        hits = sum(1 for t in tokenize(text) if t in wanted)
+        if hits > best_hits:
+            best_heading, best_text, best_hits = heading, text, hits
+
+    return best_heading, _excerpt(best_text, wanted)
+
+
+def _excerpt(text: str, terms: set) -> str:
+    lines = [
+        line for line in text.splitlines()
+        if line.strip() and not HEADING_RE.match(line.encode("utf-8")) and not TABLE_RULE_RE.match(line)
+    ]
+    flat = " ".join(line.strip() for line in lines)
+    first = None
+    for match in TOKEN_RE.finditer(flat):
+        if match.group(0).lower() in terms:
+            first = match.start()
+            break
+    if first is None:
+        return flat[:SNIPPET_CHARS]
+    start = max(0, first - SNIPPET_CHARS // 3)
+    excerpt = flat[start:start + SNIPPET_CHARS]
+    return ("..." if start else "") + excerpt + ("..." if start + SNIPPET_CHARS < len(flat) else "")
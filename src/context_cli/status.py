@@ -0,0 +1,171 @@
+"""
+Machine-readable engagement status.
+
+Collects the state of an engagement (constitution, templates, scripts,
+outcomes with task progress, artifact counts per category) as plain data,
+reading through the engagement index so repeated polling only stats files.
+Nothing here imports Rich.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+from .index import ARTIFACT_CATEGORIES, EngagementIndex, outcome_status
+from .scanner import DEFAULT_MAX_DEPTH, find_engagements
+from .trace import traced
+
+STATUS_VERSION = 1
+
+DEFAULT_SCAN_WORKERS = 8
+
+
+def _count_files(path: Path, suffix: str) -> int:
+    try:
+        with os.scandir(path) as it:
+            return sum(1 for e in it if e.name.endswith(suffix) and e.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def split_outcome_name(name: str) -> tuple:
+    """Split an outcome directory name like `001-brand-voice` into (id, name)."""
+    if "-" in name:
+        number, short_name = name.split("-", 1)
+        return f"KO-{number}", short_name
+    return f"KO-{name}", name
+
+
+@traced()
+def collect_status(project_path: Path, index: EngagementIndex = None) -> dict:
+    """Return the engagement state of project_path as a JSON-serializable dict."""
+    context_dir = project_path / ".context"
+    status = {
+        "version": STATUS_VERSION,
+        "path": str(project_path),
+        "initialized": context_dir.is_dir(),
+        "constitution": False,
+        "templates": 0,
+        "scripts": 0,
+        "outcomes": [],
+        "tasks": {"total": 0, "done": 0},
+        "artifacts": {"total": 0, "categories": {}},
+    }
+    if not status["initialized"]:
+        return status
+
+    own_index = index is None
+    if own_index:
+        index = EngagementIndex(project_path)
+
+    status["constitution"] = (context_dir / "memory" / "constitution.md").is_file()
+    status["templates"] = _count_files(context_dir / "templates", ".md")
+    status["scripts"] = _count_files(context_dir / "scripts" / "bash", ".sh")
+
+    for record in index.outcomes():
+        outcome_id, name = split_outcome_name(record["name"])
+        tasks = record["tasks"]
+        outcome = {
+            "id": outcome_id,
+            "name": name,
+            "dir": record["name"],
+            "status": outcome_status(record),
+            "has_outcome": record["has_outcome"],
+            "has_strategy": record["has_strategy"],
+            "has_tasks": record["has_tasks"],
+            "tasks": None,
+        }
+        if tasks is not None:
+            outcome["tasks"] = {
+                "total": tasks["total"],
+                "done": tasks["done"],
+                "current_phase": tasks["current_phase"],
+                "phases": tasks["phases"],
+            }
+            status["tasks"]["total"] += tasks["total"]
+            status["tasks"]["done"] += tasks["done"]
+        status["outcomes"].append(outcome)
+
+    categories = {name: 0 for name in ARTIFACT_CATEGORIES}
+    if (project_path / "context-artifacts").is_dir():
+        for artifact in index.artifacts():
+            category = artifact["category"] or "uncategorized"
+            categories[category] = categories.get(category, 0) + 1
+    status["artifacts"] = {"total": sum(categories.values()), "categories": categories}
+
+    if own_index:
+        index.save()
+    return status
+
+
+def iter_ndjson_records(status: dict) -> Iterator[dict]:
+    """Flatten a status dict into one engagement record plus one per outcome."""
+    engagement = {k: v for k, v in status.items() if k != "outcomes"}
+    engagement["type"] = "engagement"
+    engagement["outcome_count"] = len(status["outcomes"])
+    yield engagement
+    for outcome in status["outcomes"]:
+        yield {"type": "outcome", "path": status["path"], **outcome}
+
+
+def format_status(status: dict, fmt: str) -> str:
+    """Serialize status as `json`, `ndjson` or `text`."""
+    if fmt == "json":
+        return json.dumps(status, indent=2)
+    if fmt == "ndjson":
+        return "\n".join(json.dumps(r, separators=(",", ":")) for r in iter_ndjson_records(status))
+
+    lines = [
+        f"path: {status['path']}",
+        f"initialized: {'yes' if status['initialized'] else 'no'}",
+    ]
+    if status["initialized"]:
+        lines.append(f"constitution: {'found' if status['constitution'] else 'missing'}")
+        lines.append(f"templates: {status['templates']}")
+        lines.append(f"scripts: {status['scripts']}")
+        lines.append(f"outcomes: {len(status['outcomes'])}")
+        lines.append(f"tasks: {status['tasks']['done']}/{status['tasks']['total']}")
+        categories = ", ".join(f"{k} {v}" for k, v in status["artifacts"]["categories"].items())
+        lines.append(f"artifacts: {status['artifacts']['total']} ({categories})")
+        for outcome in status["outcomes"]:
+            tasks = outcome["tasks"]
+            task_info = f"{tasks['done']}/{tasks['total']}" if tasks else "-"
+            lines.append(f"  {outcome['id']}\t{outcome['name']}\t{outcome['status']}\t{task_info}")
+    return "\n".join(lines)
+
+
+@traced()
+def scan_engagements(root: Path, excludes=None, max_depth: int = DEFAULT_MAX_DEPTH, workers: int = DEFAULT_SCAN_WORKERS) -> dict:
+    """
+    Discover every engagement under root and collect their status
+    concurrently. Returns the per-engagement statuses plus totals.
+    """
+    paths = find_engagements(root, excludes=excludes, max_depth=max_depth)
+
+    def collect(path: Path) -> dict:
+        try:
+            engagement = collect_status(path)
+        except Exception as e:
+            engagement = {"path": str(path), "initialized": False, "error": str(e)}
+        engagement["relative_path"] = path.relative_to(root).as_posix() or "."
+        return engagement
+
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            engagements = list(pool.map(collect, paths))
+    else:
+        engagements = [collect(p) for p in paths]
+
+    totals = {"engagements": len(engagements), "outcomes": 0, "outcomes_complete": 0, "tasks_total": 0, "tasks_done": 0, "artifacts": 0}
+    for engagement in engagements:
+        if "error" in engagement:
+            continue
+        totals["outcomes"] += len(engagement["outcomes"])
+        totals["outcomes_complete"] += sum(1 for o in engagement["outcomes"] if o["status"] == "complete")
+        totals["tasks_total"] += engagement["tasks"]["total"]
+        totals["tasks_done"] += engagement["tasks"]["done"]
+        totals["artifacts"] += engagement["artifacts"]["total"]
+
+    return {"version": STATUS_VERSION, "root": str(root), "engagements": engagements, "totals": totals}
@@ -0,0 +1,227 @@
+"""
+Streaming parser for outcome tasks.md files.
+
+Reads a tasks file once, line by line, and builds a structured model of the
+tasks defined by `tasks-template.md`:
+
+    ## Phase 1: Source Gathering
+    - [ ] T001 [B] Verify access to all identified document sources
+    - [x] T002 [P] [KO-001] Download/export documents from Confluence
+      - Duration: 30 minutes
+    **Phase 1 Checkpoint**:
+    - [ ] All documents collected in working directory
+
+Top-level checkboxes are tasks, indented bullets under a task are its
+sub-items, and checkboxes after a "Checkpoint" marker are checkpoint items
+that are tracked separately from the task counts.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+CHECKBOX_RE = re.compile(r"^(\s*)[-*+]\s+\[([ xX])\]\s+(.*?)\s*$")
+BULLET_RE = re.compile(r"^(\s+)[-*+]\s+(.*?)\s*$")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+PHASE_RE = re.compile(r"^phase\s+(\d+)\s*[:.\-–—]?\s*(.*)$", re.IGNORECASE)
+CHECKPOINT_RE = re.compile(r"^\*\*[^*]*checkpoint[^*]*\*\*\s*:?\s*$", re.IGNORECASE)
+TASK_ID_RE = re.compile(r"^(T\d+)\b")
+MARKER_RE = re.compile(r"\[(P|B|KO-\d+)\]")
+
+
+@dataclass
+class CheckItem:
+    """A checkbox item that is not a task (checkpoint or nested sub-item)."""
+
+    text: str
+    done: bool
+    line: int
+
+
+@dataclass
+class Task:
+    """A top-level task checkbox, e.g. `- [ ] T001 [P] [KO-001] ...`."""
+
+    id: Optional[str]
+    text: str
+    done: bool
+    line: int
+    phase: Optional[int] = None
+    parallel: bool = False
+    blocking: bool = False
+    outcome_refs: list = field(default_factory=list)
+    subtasks: list = field(default_factory=list)
+    notes: list = field(default_factory=list)
+
+
+@dataclass
+class Phase:
+    """A `## Phase N: Title` section with its tasks and checkpoint items."""
+
+    number: int
+    title: str
+    tasks: list = field(default_factory=list)
+    checkpoints: list = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def done(self) -> int:
+        return sum(1 for t in self.tasks if t.done)
+
+    @property
+    def complete(self) -> bool:
+        return self.total > 0 and self.done == self.total
+
+    @property
+    def label(self) -> str:
+        return f"Phase {self.number}: {self.title}" if self.title else f"Phase {self.number}"
+
+
+@dataclass
+class TaskFile:
+    """Structured contents of a tasks.md file."""
+
+    tasks: list = field(default_factory=list)
+    phases: list = field(default_factory=list)
+    checkpoints: list = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def done(self) -> int:
+        return sum(1 for t in self.tasks if t.done)
+
+    @property
+    def complete(self) -> bool:
+        return self.total > 0 and self.done == self.total
+
+    @property
+    def current_phase(self) -> Optional[Phase]:
+        """The first phase with open tasks, or None when all phases are done."""
+        for phase in self.phases:
+            if phase.total and not phase.complete:
+                return phase
+        return None
+
+    def task(self, task_id: str) -> Optional[Task]:
+        for t in self.tasks:
+            if t.id == task_id:
+                return t
+        return None
+
+    def summary(self) -> dict:
+        """Counts suitable for status output and the engagement index."""
+        phases = [
+            {"number": p.number, "label": p.label, "total": p.total, "done": p.done}
+            for p in self.phases
+        ]
+        current = self.current_phase
+        return {
+            "total": self.total,
+            "done": self.done,
+            "complete": self.complete,
+            "checkpoints_total": len(self.checkpoints),
+            "checkpoints_done": sum(1 for c in self.checkpoints if c.done),
+            "phases": phases,
+            "current_phase": phases[self.phases.index(current)] if current else None,
+        }
+
+
+def parse_tasks_lines(lines: Iterable[str]) -> TaskFile:
+    """Parse tasks.md content from an iterable of lines in a single pass."""
+    result = TaskFile()
+    phase = None
+    in_checkpoint = False
+    in_fence = False
+    current_task = None
+
+    for lineno, raw in enumerate(lines, start=1):
+        line = raw.rstrip("\r\n")
+        stripped = line.strip()
+
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            title = heading.group(2).strip()
+            level = len(heading.group(1))
+            current_task = None
+            in_checkpoint = "checkpoint" in title.lower()
+            phase_match = PHASE_RE.match(title)
+            if phase_match and not in_checkpoint:
+                phase = Phase(number=int(phase_match.group(1)), title=phase_match.group(2).strip())
+                result.phases.append(phase)
+            elif level <= 2 and not in_checkpoint:
+                # A non-phase section (Task Legend, Summary, ...) ends the phase
+                phase = None
+            continue
+
+        if CHECKPOINT_RE.match(stripped):
+            in_checkpoint = True
+            current_task = None
+            continue
+
+        if stripped == "---":
+            in_checkpoint = False
+            current_task = None
+            continue
+
+        checkbox = CHECKBOX_RE.match(line)
+        if checkbox:
+            indent, mark, text = checkbox.groups()
+            done = mark in "xX"
+
+            if in_checkpoint:
+                item = CheckItem(text=text, done=done, line=lineno)
+                result.checkpoints.append(item)
+                if phase is not None:
+                    phase.checkpoints.append(item)
+                continue
+
+            if indent and current_task is not None:
+                current_task.subtasks.append(CheckItem(text=text, done=done, line=lineno))
+                continue
+
+            task_id = TASK_ID_RE.match(text)
+            markers = MARKER_RE.findall(text)
+            current_task = Task(
+                id=task_id.group(1) if task_id else None,
+                text=text,
+                done=done,
+                line=lineno,
+                phase=phase.number if phase is not None else None,
+                parallel="P" in markers,
+                blocking="B" in markers,
+                outcome_refs=[m for m in markers if m.startswith("KO-")],
+            )
+            result.tasks.append(current_task)
+            if phase is not None:
+                phase.tasks.append(current_task)
+            continue
+
+        bullet = BULLET_RE.match(line)
+        if bullet and current_task is not None:
+            current_task.notes.append(bullet.group(2))
+            continue
+
+        if stripped and not line[:1].isspace():
+            # Any other unindented content closes the current task
+            current_task = None
+
+    return result
+
+
+def parse_tasks(path: Path) -> TaskFile:
+    """Parse a tasks.md file, reading it exactly once."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return parse_tasks_lines(f)
@@ -0,0 +1,359 @@
+"""
+Template resolution and incremental installation.
+
+`get_template_provider()` resolves where the packaged templates live once
+per process (source tree, packed bundle, shared-data install, ...) and
+serves every template from that single source. Installs from a wheel or a
+zipapp read all templates from `templates.bundle.json`, a single resource
+written into the wheel at build time (see `hatch_build.py`).
+
+`sync_templates()` installs the packaged templates, command definitions and scripts into an
+engagement's `.context/` directory and records what was installed in
+`.context/manifest.json` (content hash, size and mtime of both the installed
+file and its packaged source). On later runs:
+
+- files whose source and installed stats still match the manifest are
+  skipped without being read,
+- files that changed upstream and were not edited locally are updated,
+- files that were edited locally are kept; if they also changed upstream
+  they are reported as conflicts and left alone unless `force` is set.
+
+Engagements created before the manifest existed have no record to compare
+against. Their files are checked against `templates.history.json`, the
+hashes of every version of each file that was ever packaged: a file that
+matches one of them was not edited and is upgraded like any other. When a
+packaged template or script changes, add the hash of its new version there.
+
+Copies use a copy-on-write reflink where the filesystem supports it.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+MANIFEST_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+BUNDLE_VERSION = 1
+BUNDLE_RESOURCE = "templates.bundle.json"
+
+HISTORY_VERSION = 1
+HISTORY_RESOURCE = "templates.history.json"
+
+# Linux FICLONE ioctl (copy-on-write clone on btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a template sync, as paths relative to `.context/`."""
+
+    added: list = field(default_factory=list)
+    updated: list = field(default_factory=list)
+    unchanged: list = field(default_factory=list)
+    conflicts: list = field(default_factory=list)
+    overwritten: list = field(default_factory=list)
+    modified: list = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.overwritten)
+
+
+def file_hash(path: Path) -> str:
+    """Return the sha256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fast_copy(src: Path, dest: Path) -> None:
+    """Copy src to dest, using a reflink clone when the filesystem allows."""
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except (ImportError, OSError):
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+@dataclass
+class TemplateSource:
+    """A packaged file, backed either by a path on disk or by bundle content."""
+
+    rel: str
+    path: Optional[Path] = None
+    data: Optional[bytes] = None
+    sha256: Optional[str] = None
+
+    def read_bytes(self) -> bytes:
+        if self.data is None:
+            self.data = self.path.read_bytes()
+        return self.data
+
+    def hash(self) -> str:
+        if self.sha256 is None:
+            self.sha256 = hashlib.sha256(self.read_bytes()).hexdigest() if self.data is not None else file_hash(self.path)
+        return self.sha256
+
+
+def packaged_files(templates_dir: Path) -> dict:
+    """Map destination paths (relative to `.context/`) to packaged sources."""
+    files = {}
+    sources = [
+        (templates_dir, "*.md", "templates"),
+        (templates_dir / "commands", "*.md", "templates/commands"),
+        (templates_dir.parent / "scripts" / "bash", "*.sh", "scripts/bash"),
+    ]
+    for directory, pattern, dest_prefix in sources:
+        if not directory.is_dir():
+            continue
+        for src in sorted(directory.glob(pattern)):
+            if src.is_file():
+                files[f"{dest_prefix}/{src.name}"] = src
+    return files
+
+
+class TemplateProvider:
+    """The resolved set of packaged templates and scripts."""
+
+    def __init__(self, sources: dict, origin: str, templates_dir: Optional[Path] = None):
+        self.sources = sources
+        self.origin = origin
+        self.templates_dir = templates_dir
+
+    @classmethod
+    def from_directory(cls, templates_dir: Path, origin: str = "directory") -> "TemplateProvider":
+        sources = {rel: TemplateSource(rel, path=path) for rel, path in packaged_files(templates_dir).items()}
+        return cls(sources, origin, templates_dir)
+
+    @classmethod
+    def from_bundle(cls, data: bytes, origin: str = "bundle") -> "TemplateProvider":
+        bundle = json.loads(data)
+        if bundle.get("version") != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported template bundle version: {bundle.get('version')}")
+        sources = {
+            rel: TemplateSource(rel, data=entry["content"].encode("utf-8"), sha256=entry["sha256"])
+            for rel, entry in bundle["files"].items()
+        }
+        return cls(sources, origin)
+
+    def preload(self) -> "TemplateProvider":
+        """Return a provider serving every file from memory, each read and hashed once.
+
+        Meant for creating many engagements in one process: workers share the
+        loaded bytes instead of each re-reading the packaged files.
+        """
+        sources = {rel: TemplateSource(rel, data=src.read_bytes(), sha256=src.hash()) for rel, src in self.sources.items()}
+        return TemplateProvider(sources, self.origin, self.templates_dir)
+
+    def has(self, rel: str) -> bool:
+        return rel in self.sources
+
+    def read_text(self, rel: str) -> str:
+        return self.sources[rel].read_bytes().decode("utf-8")
+
+
+def build_bundle(templates_dir: Path) -> dict:
+    """Pack every template, command and script under templates_dir into one dict."""
+    files = {}
+    for rel, path in packaged_files(templates_dir).items():
+        data = path.read_bytes()
+        files[rel] = {"sha256": hashlib.sha256(data).hexdigest(), "content": data.decode("utf-8")}
+    return {"version": BUNDLE_VERSION, "files": files}
+
+
+@functools.lru_cache(maxsize=None)
+def shipped_hashes() -> dict:
+    """Map each packaged file to the hashes of all versions ever shipped."""
+    import importlib.resources
+
+    try:
+        data = json.loads(importlib.resources.files("context_cli").joinpath(HISTORY_RESOURCE).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != HISTORY_VERSION:
+        return {}
+    return {rel: frozenset(hashes) for rel, hashes in data.get("files", {}).items()}
+
+
+def _load_bundle_resource() -> Optional[bytes]:
+    import importlib.resources
+
+    try:
+        resource = importlib.resources.files("context_cli").joinpath(BUNDLE_RESOURCE)
+        if resource.is_file():
+            return resource.read_bytes()
+    except Exception:
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_provider() -> Optional[TemplateProvider]:
+    """Resolve the packaged templates once per process."""
+    # Running from source (development)
+    source_templates = Path(__file__).parent.parent.parent / ".context" / "templates"
+    if source_templates.exists():
+        return TemplateProvider.from_directory(source_templates, "source")
+
+    # Packed bundle shipped inside the wheel or zipapp
+    bundle = _load_bundle_resource()
+    if bundle is not None:
+        try:
+            return TemplateProvider.from_bundle(bundle)
+        except (ValueError, KeyError):
+            pass
+
+    # Shared-data location (wheel install via uv tool or pip)
+    import sysconfig
+    shared_data = Path(sysconfig.get_path("data")) / "share" / "company-spec" / "templates"
+    if shared_data.exists():
+        return TemplateProvider.from_directory(shared_data, "shared-data")
+
+    # Templates directory inside the installed package
+    import importlib.resources
+    try:
+        with importlib.resources.as_file(importlib.resources.files("context_cli").joinpath("templates")) as p:
+            if p.exists():
+                return TemplateProvider.from_directory(Path(p), "package")
+    except Exception:
+        pass
+
+    # Fallback to the current directory's .context/templates
+    local_templates = Path.cwd() / ".context" / "templates"
+    if local_templates.exists():
+        return TemplateProvider.from_directory(local_templates, "local")
+
+    return None
+
+
+def load_manifest(context_dir: Path) -> dict:
+    try:
+        with open(context_dir / MANIFEST_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_manifest(context_dir: Path, files: dict) -> None:
+    path = context_dir / MANIFEST_FILE
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": files}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def _stat_matches(stat: os.stat_result, record: Optional[dict], prefix: str = "") -> bool:
+    return (
+        record is not None
+        and record.get(f"{prefix}size") == stat.st_size
+        and record.get(f"{prefix}mtime_ns") == stat.st_mtime_ns
+    )
+
+
+def _write_bytes(dest: Path, data: bytes) -> None:
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, dest)
+
+
+def sync_templates(provider: TemplateProvider, context_dir: Path, force: bool = False, dry_run: bool = False) -> SyncResult:
+    """
+    Bring the templates and scripts in context_dir up to date with the
+    provider, copying only files whose content changed.
+    """
+    result = SyncResult()
+    manifest = load_manifest(context_dir)
+    new_manifest = dict(manifest)
+
+    for rel, src in provider.sources.items():
+        dest = context_dir / rel
+        record = manifest.get(rel)
+
+        # Bundle sources carry their hash; file sources are identified by stat
+        if src.path is not None:
+            src_stat = src.path.stat()
+            src_size, src_mtime_ns = src_stat.st_size, src_stat.st_mtime_ns
+            src_unchanged = _stat_matches(src_stat, record, "source_")
+        else:
+            src_size, src_mtime_ns = len(src.data), None
+            src_unchanged = record is not None and record.get("source_hash") == src.sha256
+
+        try:
+            dest_stat = dest.stat()
+        except FileNotFoundError:
+            dest_stat = None
+
+        # Stat-only fast path: neither side changed since the last sync
+        if dest_stat is not None and src_unchanged and _stat_matches(dest_stat, record):
+            result.unchanged.append(rel)
+            continue
+
+        src_hash = record["source_hash"] if src_unchanged else src.hash()
+
+        if dest_stat is None:
+            action = "added"
+        else:
+            dest_hash = record["hash"] if _stat_matches(dest_stat, record) else file_hash(dest)
+            if record is None:
+                # No manifest yet: untouched if it matches any shipped version
+                locally_modified = dest_hash not in shipped_hashes().get(rel, ())
+            else:
+                locally_modified = dest_hash != record["hash"]
+            if dest_hash == src_hash:
+                action = "unchanged"
+            elif not locally_modified:
+                action = "updated"
+            elif record is not None and src_hash == record["source_hash"] and not force:
+                # Edited locally, nothing new upstream: keep the local version
+                result.modified.append(rel)
+                continue
+            elif force:
+                action = "overwritten"
+            else:
+                result.conflicts.append(rel)
+                continue
+
+        getattr(result, action).append(rel)
+        if dry_run:
+            continue
+
+        if action != "unchanged":
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if src.path is not None:
+                fast_copy(src.path, dest)
+            else:
+                _write_bytes(dest, src.data)
+            if rel.endswith(".sh") and os.name != "nt":
+                os.chmod(dest, 0o755)
+            dest_stat = dest.stat()
+
+        new_manifest[rel] = {
+            "hash": src_hash,
+            "size": dest_stat.st_size,
+            "mtime_ns": dest_stat.st_mtime_ns,
+            "source_hash": src_hash,
+            "source_size": src_size,
+            "source_mtime_ns": src_mtime_ns,
+        }
+
+    if not dry_run and new_manifest != manifest:
+        save_manifest(context_dir, new_manifest)
+
+    return result
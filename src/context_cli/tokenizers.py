@@ -0,0 +1,71 @@
+"""
+Token counters.
+
+A tokenizer is any callable taking text and returning its token count.
+Built-in names:
+
+- `approx`: words and punctuation marks; fast, no dependencies, and close
+  enough to BPE tokenizers on English prose for budgeting,
+- `chars`: one token per four characters,
+- `tiktoken`: OpenAI's cl100k_base encoding (needs the `tiktoken` package,
+  `pip install company-spec[tiktoken]`).
+
+Anything else is loaded as `module:function`, so a project can plug in the
+tokenizer of the model it deploys to.
+"""
+
+import importlib
+import re
+from typing import Callable
+
+DEFAULT_TOKENIZER = "approx"
+
+TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+class TokenizerError(Exception):
+    """Raised when a tokenizer cannot be loaded."""
+
+
+def count_tokens(text: str) -> int:
+    """Approximate the token count of text (words and punctuation marks)."""
+    return len(TOKEN_RE.findall(text))
+
+
+def count_chars(text: str) -> int:
+    """Estimate tokens as one per four characters."""
+    return (len(text) + 3) // 4
+
+
+def _tiktoken() -> Callable[[str], int]:
+    try:
+        import tiktoken
+    except ImportError:
+        raise TokenizerError("The tiktoken tokenizer needs the tiktoken package (pip install tiktoken)")
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+BUILTIN_TOKENIZERS = {
+    "approx": lambda: count_tokens,
+    "chars": lambda: count_chars,
+    "tiktoken": _tiktoken,
+}
+
+
+def get_tokenizer(name: str = DEFAULT_TOKENIZER) -> Callable[[str], int]:
+    """Return the tokenizer called name: a built-in or a `module:function` path."""
+    if name in BUILTIN_TOKENIZERS:
+        return BUILTIN_TOKENIZERS[name]()
+    module_name, _, attr = name.partition(":")
+    if not module_name or not attr:
+        raise TokenizerError(
+            f"Unknown tokenizer '{name}'. Choose from: {', '.join(BUILTIN_TOKENIZERS)}, or module:function"
+        )
+    try:
+        fn = getattr(importlib.import_module(module_name), attr)
+    except (ImportError, AttributeError) as e:
+        raise TokenizerError(f"Cannot load tokenizer '{name}': {e}")
+    if not callable(fn):
+        raise TokenizerError(f"Tokenizer '{name}' is not callable")
+    return fn
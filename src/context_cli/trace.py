@@ -0,0 +1,127 @@
+"""
+Lightweight tracing of CLI internals.
+
+Spans are recorded by the module-level `tracer`, which is disabled unless
+`--trace <file>` or `COMPANYSPEC_TRACE=<file>` is given. When enabled, the
+spans are written as Chrome trace-event JSON (open in chrome://tracing or
+https://ui.perfetto.dev) and summarized per span name at the end of the run.
+
+Usage:
+    @traced("copy_templates")
+    def copy_templates(...): ...
+
+    with tracer.span("git commit", cat="git"):
+        subprocess.run(...)
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+class Tracer:
+    """Collects complete ("X") and instant ("i") trace events."""
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self._open = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def _record(self, event: dict):
+        event.setdefault("pid", os.getpid())
+        event.setdefault("tid", threading.get_ident())
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, cat: str = "cli", **args):
+        """Record the duration of the enclosed block (no-op when disabled)."""
+        if not self.enabled:
+            yield
+            return
+        start = _now_us()
+        try:
+            yield
+        finally:
+            self._record({"name": name, "cat": cat, "ph": "X", "ts": start, "dur": _now_us() - start, "args": args})
+
+    def begin(self, key, name: str, cat: str = "cli"):
+        """Open a span that is closed later by `end(key)` (e.g. a tracker step)."""
+        if self.enabled:
+            self._open[key] = (name, cat, _now_us(), threading.get_ident())
+
+    def end(self, key, name: str = None, cat: str = "cli", **args):
+        """Close the span opened with key; record an instant event if none is open."""
+        if not self.enabled:
+            return
+        opened = self._open.pop(key, None)
+        if opened is None:
+            self._record({"name": name or str(key), "cat": cat, "ph": "i", "s": "t", "ts": _now_us(), "args": args})
+            return
+        name, cat, start, tid = opened
+        self._record({"name": name, "cat": cat, "ph": "X", "ts": start, "dur": _now_us() - start, "tid": tid, "args": args})
+
+    def to_chrome(self) -> dict:
+        """Return the recorded events as a Chrome trace-event document."""
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome(), f)
+
+    def summary(self) -> list:
+        """Return (name, calls, total_ms, max_ms) per span name, slowest first."""
+        totals = {}
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            if event["ph"] != "X":
+                continue
+            calls, total, longest = totals.get(event["name"], (0, 0.0, 0.0))
+            totals[event["name"]] = (calls + 1, total + event["dur"], max(longest, event["dur"]))
+        rows = [(name, calls, total / 1000, longest / 1000) for name, (calls, total, longest) in totals.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def format_summary(self) -> str:
+        rows = self.summary()
+        width = max([len("span")] + [len(row[0]) for row in rows])
+        lines = [f"{'span':<{width}}  {'calls':>5}  {'total ms':>10}  {'max ms':>10}"]
+        for name, calls, total_ms, max_ms in rows:
+            lines.append(f"{name:<{width}}  {calls:>5}  {total_ms:>10.1f}  {max_ms:>10.1f}")
+        return "\n".join(lines)
+
+
+tracer = Tracer()
+
+
+def traced(name: Optional[str] = None, cat: str = "cli"):
+    """Decorator that records each call of the function as a span."""
+
+    def decorator(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with tracer.span(span_name, cat):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
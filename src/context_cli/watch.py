@@ -0,0 +1,290 @@
+"""
+Incremental engagement watching.
+
+`EngagementWatch` keeps the outcome and artifact records of an engagement in
+memory and, given a set of changed paths, re-reads only the affected outcome
+directory or artifact file (through the engagement index). Changes come
+from an inotify watcher on Linux, or from a polling watcher that compares
+mtimes and sizes everywhere else. `EngagementWatcher` re-registers the
+watched roots when `.context/outcomes/` or `context-artifacts/` appears or
+disappears while watching.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from .index import ARTIFACTS_DIR, OUTCOMES_DIR, EngagementIndex
+
+# inotify constants (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+# Events arriving within this window are coalesced into one update
+DEBOUNCE_SECONDS = 0.1
+
+# Returned by a watcher when it lost track of events and a full rescan is needed
+RESCAN = None
+
+
+class PollingWatcher:
+    """Detect changes by comparing (mtime, size) snapshots of the watched trees."""
+
+    def __init__(self, roots: list, interval: float = 1.0):
+        self.roots = roots
+        self.interval = interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> dict:
+        snapshot = {}
+        stack = [str(r) for r in self.roots]
+        while stack:
+            path = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            snapshot[entry.path] = None
+                            stack.append(entry.path)
+                        else:
+                            stat = entry.stat()
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
+        return snapshot
+
+    def wait(self, timeout: float) -> Optional[set]:
+        time.sleep(timeout)
+        current = self._snapshot()
+        previous, self.snapshot = self.snapshot, current
+        changed = {p for p in current.keys() | previous.keys() if current.get(p, 0) != previous.get(p, 0)}
+        return {Path(p) for p in changed}
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher covering every directory under the watched roots."""
+
+    def __init__(self, roots: list):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}
+        for root in roots:
+            self._watch_tree(Path(root))
+
+    def _watch_tree(self, root: Path):
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            if not path.is_dir():
+                continue
+            wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+            self.watches[wd] = path
+            try:
+                with os.scandir(path) as it:
+                    stack.extend(Path(e.path) for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith("."))
+            except (FileNotFoundError, PermissionError):
+                pass
+
+    def _read_events(self) -> Optional[set]:
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0")
+                offset += EVENT_HEADER.size + length
+                if mask & IN_Q_OVERFLOW:
+                    return RESCAN
+                base = self.watches.get(wd)
+                if base is None:
+                    continue
+                if mask & IN_DELETE_SELF:
+                    del self.watches[wd]
+                    changed.add(base)
+                    continue
+                path = base / os.fsdecode(name) if name else base
+                if name.startswith(b"."):
+                    continue
+                changed.add(path)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path)
+
+    def wait(self, timeout: float) -> Optional[set]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        # Coalesce bursts of events (editors write, rename and chmod in quick succession)
+        while ready:
+            events = self._read_events()
+            if events is RESCAN:
+                return RESCAN
+            changed |= events
+            ready, _, _ = select.select([self.fd], [], [], DEBOUNCE_SECONDS)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def make_watcher(roots: list, poll: bool = False, interval: float = 1.0):
+    """Return an inotify watcher on Linux, or a polling watcher otherwise."""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots, interval)
+
+
+class EngagementWatcher:
+    """Watch the roots of an engagement, following roots created or removed later."""
+
+    def __init__(self, state: "EngagementWatch", poll: bool = False, interval: float = 1.0):
+        self.state = state
+        self.poll = poll
+        self.interval = interval
+        self.roots = state.roots
+        self.watcher = make_watcher(self.roots, poll=poll, interval=interval)
+
+    @property
+    def kind(self) -> str:
+        return type(self.watcher).__name__
+
+    def wait(self) -> Optional[set]:
+        """Wait up to one interval for changes; RESCAN when the set of roots changed."""
+        changed = self.watcher.wait(self.interval)
+        roots = self.state.roots
+        if roots != self.roots:
+            # A root appeared or vanished: nothing under a new root was watched
+            self.watcher.close()
+            self.roots = roots
+            self.watcher = make_watcher(roots, poll=self.poll, interval=self.interval)
+            return RESCAN
+        return changed
+
+    def close(self):
+        self.watcher.close()
+
+
+class EngagementWatch:
+    """In-memory engagement state that is updated one changed path at a time."""
+
+    def __init__(self, project_path: Path):
+        self.project_path = project_path
+        self.outcomes_dir = project_path / OUTCOMES_DIR
+        self.artifacts_dir = project_path / ARTIFACTS_DIR
+        self.index = EngagementIndex(project_path)
+        self.outcomes = {}
+        self.artifacts = {}
+        self.reparsed = 0
+        self._handled = set()
+        self.refresh_all()
+
+    @property
+    def roots(self) -> list:
+        return [p for p in (self.outcomes_dir, self.artifacts_dir) if p.is_dir()]
+
+    def refresh_all(self):
+        """Rebuild all records (startup, or after the watcher lost events)."""
+        self.outcomes = {r["name"]: r for r in self.index.outcomes()}
+        self.artifacts = {}
+        if self.artifacts_dir.is_dir():
+            self.artifacts = {r["path"]: r for r in self.index.artifacts()}
+        self.index.save()
+
+    def apply(self, changed: Optional[set]) -> list:
+        """Update the records affected by changed paths; return what changed."""
+        if changed is RESCAN:
+            self.refresh_all()
+            return ["full rescan"]
+
+        touched_outcomes = set()
+        self._handled = set()
+        messages = []
+        for path in sorted(changed):
+            if path.is_relative_to(self.outcomes_dir) and path != self.outcomes_dir:
+                touched_outcomes.add(path.relative_to(self.outcomes_dir).parts[0])
+            elif path.is_relative_to(self.artifacts_dir):
+                messages.extend(self._apply_artifact(path))
+
+        for name in sorted(touched_outcomes):
+            outcome_dir = self.outcomes_dir / name
+            if outcome_dir.is_dir():
+                self.outcomes[name] = self.index.outcome(outcome_dir)
+                messages.append(f"updated outcome {name}")
+            elif self.outcomes.pop(name, None) is not None:
+                self.index.forget(outcome_dir)
+                messages.append(f"removed outcome {name}")
+            self.reparsed += 1
+
+        if messages:
+            self.index.save()
+        return messages
+
+    def _apply_artifact(self, path: Path) -> list:
+        if path.is_dir():
+            # New or moved-in directory: pick up the files inside it
+            messages = []
+            for file_path in sorted(path.rglob("*.md")):
+                if file_path not in self.artifacts:
+                    self._handled.add(file_path)
+                    self.artifacts[file_path] = self.index.artifact(file_path)
+                    self.reparsed += 1
+                    messages.append(f"added artifact {file_path.relative_to(self.artifacts_dir)}")
+            return messages
+        if path in self._handled:
+            return []
+        if path.suffix == ".md" and path.is_file():
+            verb = "updated" if path in self.artifacts else "added"
+            self.artifacts[path] = self.index.artifact(path)
+            self.reparsed += 1
+            return [f"{verb} artifact {path.relative_to(self.artifacts_dir)}"]
+        if not path.exists():
+            removed = [p for p in self.artifacts if p == path or p.is_relative_to(path)]
+            for p in removed:
+                del self.artifacts[p]
+            if removed:
+                self.index.forget(path)
+                return [f"removed artifact {path.relative_to(self.artifacts_dir)}"]
+        return []
+
+    def artifact_counts(self) -> dict:
+        counts = {}
+        for record in self.artifacts.values():
+            category = record["category"] or "uncategorized"
+            counts[category] = counts.get(category, 0) + 1
+        return counts
@@ -0,0 +1,36 @@
+import os
+from pathlib import Path
+
+import pytest
+
+import context_cli
+
+
+def write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def touch_later(path: Path) -> None:
+    """Move path's mtime forward so mtime-keyed caches see a change."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings(monkeypatch):
+    # Global CLI options are stored in module state; keep them from leaking between tests
+    monkeypatch.setattr(context_cli, "settings", dict(context_cli.settings))
+
+
+@pytest.fixture
+def engagement(tmp_path: Path) -> Path:
+    """An empty engagement: a project with a constitution and outcome template."""
+    write(tmp_path / ".context" / "memory" / "constitution.md", "# Constitution\n")
+    write(
+        tmp_path / ".context" / "templates" / "outcome-template.md",
+        "# Outcome: [OUTCOME_NAME]\n\n**ID**: KO-[###]\n**Branch**: [###-outcome-name]\n**Created**: [DATE]\n",
+    )
+    (tmp_path / ".context" / "outcomes").mkdir()
+    return tmp_path
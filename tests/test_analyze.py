@@ -0,0 +1,64 @@
+from context_cli.analyze import analyze_engagement, find_cycles
+
+from conftest import write
+
+
+def test_find_cycles_acyclic():
+    assert find_cycles({1: [2], 2: [3], 3: []}) == []
+
+
+def test_find_cycles_reports_each_component_sorted():
+    graph = {1: [2], 2: [3], 3: [1], 4: [5], 5: [4], 6: [1]}
+    assert find_cycles(graph) == [[1, 2, 3], [4, 5]]
+
+
+def test_find_cycles_self_loop():
+    assert find_cycles({1: [1], 2: [1]}) == [[1]]
+
+
+def test_find_cycles_successor_without_entry():
+    assert find_cycles({1: [2]}) == []
+
+
+def test_find_cycles_deep_chain_does_not_recurse():
+    n = 5000
+    graph = {i: [i + 1] for i in range(n)}
+    graph[n] = [0]
+    assert find_cycles(graph) == [list(range(n + 1))]
+
+
+def outcome(engagement, number, depends_on=(), blocks=()):
+    lines = [f"# Outcome {number}", "", f"**ID**: KO-{number:03d}", "**Priority**: P1", "", "## Depends On", ""]
+    lines += [f"- KO-{n:03d}" for n in depends_on]
+    lines += ["", "## Blocks", ""]
+    lines += [f"- KO-{n:03d}" for n in blocks]
+    lines += ["", "## Acceptance Criteria", "", "### AC-1: Done", ""]
+    return write(engagement / ".context" / "outcomes" / f"{number:03d}-o{number}" / "outcome.md", "\n".join(lines))
+
+
+def test_analyze_detects_cycle_through_blocks(engagement):
+    outcome(engagement, 1, depends_on=[2], blocks=[3])
+    outcome(engagement, 2, depends_on=[3])
+    outcome(engagement, 3)
+    outcome(engagement, 4, depends_on=[1])
+
+    analysis = analyze_engagement(engagement)
+
+    assert analysis.cycles == [[1, 2, 3]]
+    assert [i.check for i in analysis.issues if i.severity == "critical"] == ["cycle"]
+
+
+def test_analyze_flags_unknown_reference(engagement):
+    outcome(engagement, 1, depends_on=[9])
+
+    analysis = analyze_engagement(engagement)
+
+    assert analysis.cycles == []
+    assert any(i.check == "reference" and "KO-009" in i.message for i in analysis.issues)
+
+
+def test_analyze_reuses_cache(engagement):
+    outcome(engagement, 1)
+    outcome(engagement, 2, depends_on=[1])
+    assert analyze_engagement(engagement).reanalyzed == 2
+    assert analyze_engagement(engagement).reanalyzed == 0
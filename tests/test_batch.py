@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from context_cli.batch import BatchError, BatchResult, load_batch_manifest, run_batch
+
+from conftest import write
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_load_csv_manifest(tmp_path):
+    manifest = write(tmp_path / "teams.csv", "Org,Target,Scope,Goal\nAcme, acme-sales ,department,Quotes\nBeta,beta,,\n")
+
+    entries = load_batch_manifest(manifest, scopes=["team", "department"], base=tmp_path)
+
+    assert [(e.org, e.target, e.scope, e.goal, e.row) for e in entries] == [
+        ("Acme", tmp_path / "acme-sales", "department", "Quotes", 1),
+        ("Beta", tmp_path / "beta", "team", "", 2),
+    ]
+
+
+def test_load_json_manifest_with_dir_alias(tmp_path):
+    manifest = write(tmp_path / "teams.json", json.dumps({"engagements": [{"org": "Acme", "dir": "acme"}]}))
+    (entry,) = load_batch_manifest(manifest, base=tmp_path)
+    assert entry.target == tmp_path / "acme"
+
+
+def test_manifest_problems_are_reported_together(tmp_path):
+    manifest = write(tmp_path / "teams.csv", "org,target,scope\n,a,team\nB,a,galaxy\nC,,team\n")
+
+    with pytest.raises(BatchError) as error:
+        load_batch_manifest(manifest, scopes=["team"], base=tmp_path)
+
+    message = str(error.value)
+    for problem in ("row 1: missing org", "row 2: invalid scope 'galaxy'", "row 2: target 'a' is also used by row 1", "row 3: missing target"):
+        assert problem in message
+
+
+@pytest.mark.parametrize("name,text,message", [
+    ("teams.yaml", "", "Unsupported manifest format"),
+    ("teams.json", "{", "Invalid JSON"),
+    ("teams.json", "[1]", "must contain a list"),
+    ("teams.json", "[]", "lists no engagements"),
+])
+def test_unreadable_manifests(tmp_path, name, text, message):
+    with pytest.raises(BatchError, match=message):
+        load_batch_manifest(write(tmp_path / name, text), base=tmp_path)
+
+
+def test_run_batch_keeps_manifest_order_and_isolates_failures(tmp_path):
+    manifest = write(tmp_path / "teams.csv", "org,target\nA,a\nB,b\nC,c\n")
+    entries = load_batch_manifest(manifest, base=tmp_path)
+    finished = []
+
+    def worker(entry):
+        if entry.org == "B":
+            raise RuntimeError("boom")
+        return BatchResult(entry, "created")
+
+    results = run_batch(entries, worker, jobs=3, on_result=lambda r: finished.append(r.entry.org))
+
+    assert [(r.entry.org, r.status, r.detail) for r in results] == [("A", "created", ""), ("B", "failed", "boom"), ("C", "created", "")]
+    assert sorted(finished) == ["A", "B", "C"]
+    assert not results[1].ok
+
+
+def test_plain_batch_init_creates_engagements_without_rich(tmp_path):
+    write(tmp_path / "teams.csv", "org,target\nAcme,acme\nBeta,beta\n")
+    script = (
+        "import sys, context_cli\n"
+        "sys.argv = ['companyspec', '--plain', 'init', '--batch', 'teams.csv', '--no-git']\n"
+        "try:\n"
+        "    context_cli.main()\n"
+        "finally:\n"
+        "    print('rich loaded:', 'rich' in sys.modules)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+
+    result = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, env=env, capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert "rich loaded: False" in result.stdout
+    assert (tmp_path / "acme" / ".context" / "memory" / "constitution.md").is_file()
+    assert (tmp_path / "beta" / ".context" / "templates").is_dir()
+    assert "2 created, 0 skipped, 0 failed" in result.stderr
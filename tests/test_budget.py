@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from context_cli import app
+from context_cli.budget import UNCATEGORIZED, measure_engagement
+from context_cli.tokenizers import TokenizerError, count_chars, count_tokens, get_tokenizer
+
+from conftest import touch_later, write
+
+
+def contents(engagement):
+    write(engagement / ".context" / "outcomes" / "001-onboarding" / "outcome.md", "# Onboarding\n\nNew hires, day one.\n")
+    write(engagement / ".context" / "outcomes" / "001-onboarding" / "tasks.md", "- [ ] T001 Write it\n")
+    write(engagement / "context-artifacts" / "processes" / "refunds.md", "Refunds need approval.\n")
+    write(engagement / "context-artifacts" / "README.md", "Artifacts\n")
+
+
+def test_builtin_tokenizers():
+    assert count_tokens("Hello, world!") == 4
+    assert count_chars("") == 0 and count_chars("abcde") == 2
+    assert get_tokenizer("approx") is count_tokens
+    assert get_tokenizer("chars") is count_chars
+
+
+def test_tokenizer_from_module_path():
+    assert get_tokenizer("builtins:len")("abc") == 3
+
+
+@pytest.mark.parametrize("name", ["nope", "no_such_module:count", "json:no_such_fn", "string:ascii_letters"])
+def test_bad_tokenizers(name):
+    with pytest.raises(TokenizerError):
+        get_tokenizer(name)
+
+
+def test_tiktoken_tokenizer():
+    pytest.importorskip("tiktoken")
+    assert get_tokenizer("tiktoken")("hello world") == 2
+
+
+def test_measure_engagement_rolls_up(engagement):
+    contents(engagement)
+
+    report = measure_engagement(engagement)
+
+    assert sorted(f.kind for f in report.files) == ["artifact", "artifact", "constitution", "outcome", "outcome"]
+    assert report.outcomes["001-onboarding"].files == 2
+    assert set(report.categories) == {"processes", UNCATEGORIZED}
+    assert report.categories["processes"].tokens == count_tokens("Refunds need approval.\n")
+    assert report.total.tokens == sum(f.tokens for f in report.files)
+    assert report.total.bytes == sum(f.bytes for f in report.files)
+    assert report.retokenized == 5
+
+
+def test_counts_are_cached_by_content(engagement):
+    contents(engagement)
+    measure_engagement(engagement)
+
+    assert measure_engagement(engagement).retokenized == 0
+
+    # Touched but unchanged, and a copy of a counted file: nothing to re-tokenize
+    touch_later(engagement / "context-artifacts" / "README.md")
+    write(engagement / "context-artifacts" / "processes" / "copy.md", "Refunds need approval.\n")
+    assert measure_engagement(engagement).retokenized == 0
+
+    write(engagement / "context-artifacts" / "README.md", "Artifacts, changed\n")
+    touch_later(engagement / "context-artifacts" / "README.md")
+    assert measure_engagement(engagement).retokenized == 1
+
+    # Another tokenizer counts each distinct content once, then both are cached
+    assert measure_engagement(engagement, tokenizer="chars").retokenized == 5
+    assert measure_engagement(engagement).retokenized == 0
+
+
+def test_failing_tokenizer(engagement):
+    with pytest.raises(TokenizerError, match="constitution.md"):
+        measure_engagement(engagement, tokenizer="math:sqrt")
+
+
+def test_budget_cli(engagement, monkeypatch):
+    contents(engagement)
+    monkeypatch.chdir(engagement)
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["--plain", "budget"])
+    assert result.exit_code == 0, result.output
+    names = [line.split("\t")[0] for line in result.output.splitlines()]
+    assert names[-3:] == ["(outcomes)", "(constitution)", "total"]
+    assert set(names[:-3]) == {"processes", UNCATEGORIZED}
+
+    result = runner.invoke(app, ["budget", "--json", "--tokenizer", "chars"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["total"]["files"] == 5
+
+    result = runner.invoke(app, ["budget", "--by", "size"])
+    assert result.exit_code == 1 and "Invalid grouping" in result.output
+
+    result = runner.invoke(app, ["budget", "--tokenizer", "nope"])
+    assert result.exit_code == 1 and "Unknown tokenizer" in result.output
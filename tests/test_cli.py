@@ -0,0 +1,55 @@
+import json
+
+from typer.testing import CliRunner
+
+from context_cli import app
+
+from conftest import write
+
+runner = CliRunner()
+
+
+def invoke(*args):
+    return runner.invoke(app, ["--plain", "--no-banner", *args])
+
+
+def test_outcome_new_analyze_and_plan(engagement, monkeypatch):
+    monkeypatch.chdir(engagement)
+
+    result = invoke("outcome", "new", "brand-voice", "--json")
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["outcome_id"] == "KO-001"
+
+    outcome_dir = engagement / ".context" / "outcomes" / "001-brand-voice"
+    write(outcome_dir / "tasks.md", "# Tasks\n\n**ID**: KO-001\n\n## Phase 1: Go\n- [ ] T001 [P] One\n- [ ] T002 [P] Two\n- [ ] T003 Three\n")
+
+    result = invoke("plan", "1", "--next", "--limit", "2")
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["open_tasks"] == 3
+    assert [t["id"] for t in data["batch"]] == ["T001", "T002"]
+
+    result = invoke("analyze", "--json")
+    data = json.loads(result.output)
+    assert data["summary"]["outcomes"] == 1
+    assert data["cycles"] == []
+    assert result.exit_code == 0
+
+
+def test_outcome_new_outside_engagement(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = invoke("outcome", "new", "brand-voice")
+    assert result.exit_code == 1
+
+
+def test_plan_unknown_outcome(engagement, monkeypatch):
+    monkeypatch.chdir(engagement)
+    result = invoke("plan", "42")
+    assert result.exit_code == 1
+
+
+def test_help_lists_commands():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for command in ("init", "analyze", "plan", "dedupe", "glossary", "outcome"):
+        assert command in result.output
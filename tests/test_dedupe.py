@@ -0,0 +1,92 @@
+import pytest
+
+from context_cli.dedupe import SLOTS, find_duplicates, lsh_rows, minhash, shingles, similarity
+
+from conftest import touch_later, write
+
+BASE = " ".join(f"word{i}" for i in range(400))
+
+
+def signature(text: str) -> list:
+    return minhash(shingles(text))
+
+
+def test_short_text_has_no_signature():
+    assert shingles("too short to shingle") == set()
+    assert minhash(set()) is None
+
+
+def test_minhash_is_deterministic_and_full():
+    sig = signature(BASE)
+    assert len(sig) == SLOTS
+    assert sig == signature(BASE)
+    # Densification fills every slot, even for a few shingles
+    assert len(signature("one two three four five six")) == SLOTS
+
+
+def test_similarity_estimates_jaccard():
+    a = shingles(BASE)
+    other = " ".join(f"word{i}" for i in range(100, 500))
+    b = shingles(other)
+    jaccard = len(a & b) / len(a | b)
+
+    assert similarity(signature(BASE), signature(BASE)) == 1.0
+    assert similarity(signature(BASE), signature(other)) == pytest.approx(jaccard, abs=0.15)
+    unrelated = " ".join(f"other{i}" for i in range(400))
+    assert similarity(signature(BASE), signature(unrelated)) < 0.1
+
+
+def test_lsh_rows_widen_with_threshold():
+    assert lsh_rows(0.5) <= lsh_rows(0.8) <= lsh_rows(0.95)
+    assert SLOTS % lsh_rows(0.8) == 0
+
+
+def artifact(engagement, category, name, text):
+    return write(engagement / "context-artifacts" / category / name, text)
+
+
+def test_find_duplicates_clusters_near_copies(engagement):
+    artifact(engagement, "processes", "a.md", BASE)
+    artifact(engagement, "processes", "b.md", BASE + " trailing note")
+    artifact(engagement, "decisions", "c.md", BASE.replace("word200", "changed"))
+    artifact(engagement, "processes", "d.md", " ".join(f"other{i}" for i in range(400)))
+    artifact(engagement, "processes", "e.md", "too short")
+
+    report = find_duplicates(engagement)
+
+    assert report.scanned == 5 and report.skipped == 1
+    assert len(report.clusters) == 1
+    members = [path for path, _ in report.clusters[0].members]
+    assert members[0] == "context-artifacts/decisions/c.md"
+    assert sorted(members[1:]) == ["context-artifacts/processes/a.md", "context-artifacts/processes/b.md"]
+    assert report.duplicates == 2
+
+
+def test_find_duplicates_joins_chain_through_bucket_members(engagement):
+    # b is close to both a and c, which are further apart from each other
+    words = [f"word{i}" for i in range(400)]
+    artifact(engagement, "processes", "a.md", " ".join(words))
+    artifact(engagement, "processes", "b.md", " ".join(words[:380] + ["x"] * 20))
+    artifact(engagement, "processes", "c.md", " ".join(words[:360] + ["x"] * 40))
+
+    report = find_duplicates(engagement, threshold=0.8)
+
+    assert [len(c.members) for c in report.clusters] == [3]
+
+
+def test_find_duplicates_reuses_signatures(engagement):
+    path = artifact(engagement, "processes", "a.md", BASE)
+    artifact(engagement, "processes", "b.md", BASE)
+    assert find_duplicates(engagement).rehashed == 2
+    assert find_duplicates(engagement).rehashed == 0
+
+    write(path, " ".join(f"other{i}" for i in range(400)))
+    touch_later(path)
+    report = find_duplicates(engagement)
+    assert report.rehashed == 1
+    assert report.clusters == []
+
+
+def test_find_duplicates_rejects_unknown_category(engagement):
+    with pytest.raises(ValueError):
+        find_duplicates(engagement, category="nope")
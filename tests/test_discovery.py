@@ -0,0 +1,47 @@
+import context_cli
+from context_cli import discover_existing_context
+from context_cli.scanner import read_lines
+
+from conftest import write
+
+
+def test_discovery_extracts_project_context(tmp_path):
+    write(tmp_path / "README.md", "# Shop\n\n## Overview\n\nAn online shop.\n\n## Intent\n\nSell tea.\n\n## Non-goals\n\nNo coffee.\n")
+    write(tmp_path / "package.json", '{"name": "shop", "description": "Tea shop"}')
+    (tmp_path / ".specify").mkdir()
+
+    result = discover_existing_context(tmp_path)
+
+    extracted = result["extracted_context"]
+    assert extracted["intent"] == "Sell tea."
+    assert extracted["intent_source"] == "README.md"
+    assert extracted["has_constraints"] is True
+    assert (extracted["project_name"], extracted["project_description"]) == ("shop", "Tea shop")
+    assert (".specify", "Spec Kit") in result["frameworks_found"]
+    assert result["docs_found"] == ["README.md", "package.json"]
+
+
+def test_discovery_stops_reading_once_settled(tmp_path, monkeypatch):
+    readme = write(
+        tmp_path / "README.md",
+        "# Shop\n\n## Intent\n\nSell tea.\n\n## Constraints\n\nNo coffee.\n" + "\nfiller\n" * 10000,
+    )
+    read = []
+
+    def counting(path, *args, **kwargs):
+        for line in read_lines(path, *args, **kwargs):
+            read.append(line)
+            yield line
+
+    monkeypatch.setattr(context_cli, "read_lines", counting)
+    extracted = discover_existing_context(tmp_path)["extracted_context"]
+
+    assert extracted["intent"] == "Sell tea." and extracted["has_constraints"]
+    assert len(read) < 20 < len(readme.read_text().splitlines())
+
+
+def test_discovery_bounds_reads(tmp_path):
+    write(tmp_path / "README.md", "# Shop\n\n" + "padding\n" * 100 + "## Intent\n\nSell tea.\n")
+
+    assert "intent" not in discover_existing_context(tmp_path, max_read_bytes=200)["extracted_context"]
+    assert discover_existing_context(tmp_path)["extracted_context"]["intent"] == "Sell tea."
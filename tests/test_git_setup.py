@@ -0,0 +1,70 @@
+import shutil
+import subprocess
+
+import pytest
+
+from context_cli import GitSetup, created_paths, init_engagement, is_git_repo
+from context_cli.batch import BatchEntry
+from context_cli.templates import get_template_provider
+
+from conftest import write
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch):
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "Test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+
+
+def committed(path):
+    out = subprocess.run(["git", "ls-files"], cwd=path, check=True, capture_output=True, text=True).stdout
+    return out.splitlines()
+
+
+def test_setup_commits_everything(tmp_path):
+    setup = GitSetup(tmp_path)
+    write(tmp_path / "a.md", "a\n")
+    write(tmp_path / "docs" / "b.md", "b\n")
+
+    assert setup.finish() == (True, None)
+    assert is_git_repo(tmp_path)
+    assert committed(tmp_path) == ["a.md", "docs/b.md"]
+
+
+def test_setup_stages_only_given_paths(tmp_path):
+    setup = GitSetup(tmp_path)
+    write(tmp_path / "a.md", "a\n")
+    write(tmp_path / "notes.txt", "mine\n")
+
+    assert setup.finish(["a.md"]) == (True, None)
+    assert committed(tmp_path) == ["a.md"]
+
+
+def test_setup_reports_failures(tmp_path):
+    # Nothing to commit
+    success, error = GitSetup(tmp_path).finish()
+    assert not success and "git commit" in error
+
+
+def test_wait_is_idempotent(tmp_path):
+    setup = GitSetup(tmp_path)
+    assert setup.wait()[0] == 0
+    assert setup.wait() is setup.wait()
+
+
+def test_init_engagement_stages_created_files(tmp_path):
+    target = tmp_path / "sales"
+    write(target / "draft.md", "not from init\n")
+    entry = BatchEntry(org="Acme", scope="Sales", goal="Grow", target=target)
+
+    result = init_engagement(entry, get_template_provider(), force=True, stage="created")
+
+    assert (result.status, result.detail) == ("created", "git initialized")
+    files = committed(target)
+    assert "draft.md" not in files
+    assert set(files) <= set(created_paths(get_template_provider()))
+    assert ".context/memory/constitution.md" in files
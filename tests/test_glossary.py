@@ -0,0 +1,61 @@
+from context_cli.glossary import TermMatcher, candidate_phrases, extract_terms, term_key
+
+from conftest import write
+
+
+def words(text: str) -> list:
+    return term_key(text).split()
+
+
+def test_term_key_normalizes_words():
+    assert term_key("Refund  Policy!") == term_key("refund policy")
+
+
+def test_matcher_counts_overlapping_terms():
+    matcher = TermMatcher([term_key("refund"), term_key("refund policy"), term_key("policy")])
+
+    counts = matcher.count(words("The refund policy covers a refund for the policy holder"))
+
+    assert counts == {term_key("refund"): 2, term_key("refund policy"): 1, term_key("policy"): 2}
+
+
+def test_matcher_follows_failure_links():
+    matcher = TermMatcher([term_key("a b c"), term_key("b c d")])
+    assert matcher.count(words("a b c d")) == {term_key("a b c"): 1, term_key("b c d"): 1}
+    assert matcher.count(words("a b a b c")) == {term_key("a b c"): 1}
+
+
+def test_matcher_without_patterns():
+    assert TermMatcher([]).count(words("anything at all")) == {}
+
+
+def test_extract_terms_from_tables_and_lists(tmp_path):
+    path = write(
+        tmp_path / "glossary.md",
+        "# Glossary\n"
+        "\n"
+        "| Definition | Term |\n"
+        "|------------|------|\n"
+        "| Money back | **Refund** |\n"
+        "| Net revenue retention | Net Revenue Retention (NRR) |\n"
+        "\n"
+        "- **SLA**: Service level agreement\n"
+        "\n"
+        "```\n"
+        "- **Ignored**: inside a fence\n"
+        "```\n",
+    )
+
+    terms = extract_terms(path)["terms"]
+
+    assert [(t[0], t[1], t[2]) for t in terms] == [
+        ("Refund", [], 5),
+        ("Net Revenue Retention", ["NRR"], 6),
+        ("SLA", [], 8),
+    ]
+    assert terms[0][3] == "Money back"
+
+
+def test_candidate_phrases_skip_framework_acronyms():
+    phrases = candidate_phrases("The **renewal desk** owns ARR. See KO-001 and **Status**: done.\n```\nCRM\n```\n")
+    assert phrases == {"renewal desk": 1, "ARR": 1}
@@ -0,0 +1,109 @@
+import json
+from pathlib import Path
+
+from context_cli.index import INDEX_VERSION, EngagementIndex
+
+from conftest import touch_later, write
+
+
+class Counter:
+    """A summarize function that records the paths it parsed."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, path):
+        self.calls.append(path.name)
+        return {"text": path.read_text()}
+
+
+def test_lookup_hits_until_file_changes(engagement):
+    path = write(engagement / "notes" / "a.md", "one")
+    summarize = Counter()
+
+    with EngagementIndex(engagement) as index:
+        assert index.lookup(path, summarize) == {"text": "one"}
+        assert index.lookup(path, summarize) == {"text": "one"}
+        assert index.stats == {"hits": 1, "misses": 1}
+
+    write(path, "two!")
+    with EngagementIndex(engagement) as index:
+        assert index.lookup(path, summarize) == {"text": "two!"}
+
+    # Same size, later mtime
+    write(path, "six!")
+    touch_later(path)
+    with EngagementIndex(engagement) as index:
+        assert index.lookup(path, summarize) == {"text": "six!"}
+    assert summarize.calls == ["a.md", "a.md", "a.md"]
+
+
+def test_index_persists_between_runs(engagement):
+    path = write(engagement / "a.md", "one")
+    with EngagementIndex(engagement) as index:
+        index.lookup(path, Counter())
+
+    data = json.loads((engagement / ".context" / "cache" / "index.json").read_text())
+    assert data["version"] == INDEX_VERSION
+    assert data["entries"]["a.md"]["summary"] == {"text": "one"}
+
+    summarize = Counter()
+    with EngagementIndex(engagement) as index:
+        index.lookup(path, summarize)
+    assert summarize.calls == []
+
+
+def test_index_ignores_other_versions(engagement):
+    path = write(engagement / "a.md", "one")
+    write(engagement / ".context" / "cache" / "index.json", json.dumps({"version": INDEX_VERSION + 1, "entries": {"a.md": {}}}))
+
+    with EngagementIndex(engagement) as index:
+        assert index.entries == {}
+        index.lookup(path, Counter())
+        assert index.stats["misses"] == 1
+
+
+def test_forget_drops_file_and_directory(engagement):
+    a = write(engagement / "docs" / "a.md", "a")
+    b = write(engagement / "docs" / "sub" / "b.md", "b")
+    c = write(engagement / "docs-other.md", "c")
+    with EngagementIndex(engagement) as index:
+        for path in (a, b, c):
+            index.lookup(path, Counter())
+        index.forget(engagement / "docs")
+        assert sorted(index.entries) == ["docs-other.md"]
+
+
+def test_track_prunes_entries_not_looked_up(engagement):
+    a = write(engagement / "docs" / "a.md", "a")
+    b = write(engagement / "docs" / "b.md", "b")
+    other = write(engagement / "other.md", "o")
+    with EngagementIndex(engagement) as index:
+        for path in (a, b, other):
+            index.lookup(path, Counter())
+
+    b.unlink()
+    with EngagementIndex(engagement) as index:
+        index.track(Path("docs"))
+        index.lookup(a, Counter())
+
+    with EngagementIndex(engagement) as index:
+        assert sorted(index.entries) == ["docs/a.md", "other.md"]
+
+
+def test_outcomes_records_task_progress(engagement):
+    outcome_dir = engagement / ".context" / "outcomes" / "001-a"
+    write(outcome_dir / "outcome.md", "# A\n")
+    write(outcome_dir / "tasks.md", "## Phase 1: Go\n- [x] T001 One\n- [ ] T002 Two\n")
+
+    with EngagementIndex(engagement) as index:
+        (record,) = index.outcomes()
+    assert record["name"] == "001-a"
+    assert (record["tasks"]["total"], record["tasks"]["done"]) == (2, 1)
+
+
+def test_read_only_index_does_not_write(engagement):
+    path = write(engagement / "a.md", "one")
+    with EngagementIndex(engagement, persist=False) as index:
+        index.lookup(path, Counter())
+    assert not (engagement / ".context" / "cache" / "index.json").exists()
@@ -0,0 +1,95 @@
+import json
+
+from context_cli.manifests import EXTRACTORS, extract_manifests
+
+from conftest import write
+
+
+def extract(tmp_path, name, text, max_bytes=1 << 20):
+    return EXTRACTORS[name](write(tmp_path / name, text), max_bytes)
+
+
+def test_package_json_workspaces(tmp_path):
+    info = extract(tmp_path, "package.json", json.dumps({
+        "name": "shop", "description": " Storefront ", "workspaces": {"packages": ["apps/*", "", 3]},
+    }))
+    assert (info.ecosystem, info.name, info.description, info.members) == ("npm", "shop", "Storefront", ["apps/*"])
+
+
+def test_package_json_not_an_object(tmp_path):
+    assert extract(tmp_path, "package.json", "[]") is None
+
+
+def test_pyproject_project_and_poetry(tmp_path):
+    info = extract(tmp_path, "pyproject.toml", '[project]\nname = "svc"\ndescription = "API"\n\n[tool.uv.workspace]\nmembers = ["libs/*"]\n')
+    assert (info.name, info.description, info.members) == ("svc", "API", ["libs/*"])
+
+    info = extract(tmp_path, "pyproject.toml", '[tool.poetry]\nname = "legacy"\n')
+    assert info.name == "legacy"
+
+
+def test_cargo_inherits_workspace_description(tmp_path):
+    info = extract(
+        tmp_path,
+        "Cargo.toml",
+        '[package]\nname = "core"\ndescription.workspace = true\n\n'
+        '[workspace]\nmembers = ["crates/a", "crates/b"]\n\n[workspace.package]\ndescription = "Engine"\n',
+    )
+    assert (info.name, info.description, info.members) == ("core", "Engine", ["crates/a", "crates/b"])
+
+
+def test_go_mod_and_go_work(tmp_path):
+    assert extract(tmp_path, "go.mod", "// comment\nmodule example.com/app\n\ngo 1.22\n").name == "example.com/app"
+    assert extract(tmp_path, "go.mod", "go 1.22\n") is None
+
+    info = extract(tmp_path, "go.work", "go 1.22\n\nuse ./tools\nuse (\n\t./api // service\n\t./web\n)\n")
+    assert info.members == ["./tools", "./api", "./web"]
+
+
+def test_composer_path_repositories(tmp_path):
+    info = extract(tmp_path, "composer.json", json.dumps({
+        "name": "acme/app",
+        "repositories": [{"type": "path", "url": "packages/*"}, {"type": "vcs", "url": "https://example.com"}],
+    }))
+    assert (info.name, info.members) == ("acme/app", ["packages/*"])
+
+
+def test_pom_reads_top_level_fields_only(tmp_path):
+    info = extract(
+        tmp_path,
+        "pom.xml",
+        '<?xml version="1.0"?>\n<project xmlns="http://maven.apache.org/POM/4.0.0">\n'
+        "  <parent><artifactId>parent</artifactId></parent>\n"
+        "  <artifactId>billing</artifactId>\n"
+        "  <description>\n    Billing\n    service\n  </description>\n"
+        "  <modules>\n    <module>api</module>\n    <module>core</module>\n  </modules>\n"
+        "</project>\n",
+    )
+    assert (info.name, info.description, info.members) == ("billing", "Billing service", ["api", "core"])
+
+
+def test_pom_keeps_fields_before_malformed_part(tmp_path):
+    info = extract(tmp_path, "pom.xml", "<project>\n  <name>Kept</name>\n  <broken>\n</project>\n")
+    assert info.name == "Kept"
+    assert extract(tmp_path, "pom.xml", "not xml") is None
+
+
+def test_gradle_settings(tmp_path):
+    info = extract(tmp_path, "settings.gradle.kts", 'rootProject.name = "shop"\ninclude(":app", ":lib:core")\ninclude \'web\'\n')
+    assert (info.name, info.members) == ("shop", ["app", "lib/core", "web"])
+
+
+def test_extract_manifests_skips_missing_and_broken(tmp_path):
+    write(tmp_path / "package.json", json.dumps({"name": "web"}))
+    write(tmp_path / "pyproject.toml", "[project\nbroken")
+    write(tmp_path / "go.mod", "module example.com/app\n")
+
+    infos = extract_manifests(tmp_path)
+
+    assert [(i.manifest, i.name) for i in infos] == [("package.json", "web"), ("go.mod", "example.com/app")]
+    assert [i.manifest for i in extract_manifests(tmp_path, names=["go.mod"])] == ["go.mod"]
+
+
+def test_extract_manifests_respects_read_cap(tmp_path):
+    write(tmp_path / "package.json", json.dumps({"name": "web", "description": "x" * 1000}))
+    assert extract_manifests(tmp_path, max_bytes=100) == []
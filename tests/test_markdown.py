@@ -0,0 +1,71 @@
+import io
+
+from context_cli.markdown import build_section_map, normalize_title, stream_section_map
+
+DOC = """\
+# 🚀 Project Title
+
+Intro paragraph
+continues here.
+
+## Intent
+
+Ship the thing.
+
+```
+## Not a heading
+```
+
+### Details:
+
+## Constraints
+
+- None
+"""
+
+
+def test_normalize_title_strips_case_space_and_emoji():
+    assert normalize_title("  🚀 Project   Title: ") == "project title"
+    assert normalize_title("Setup (optional)") == "setup (optional)"
+
+
+def test_build_section_map_offsets_and_paragraphs():
+    sections = build_section_map(DOC)
+
+    assert [s.key for s in sections.sections] == ["project title", "intent", "details", "constraints"]
+    title = sections.find("project title")
+    assert title.first_paragraph == "Intro paragraph continues here."
+    intent = sections.find("Intent", level=2)
+    assert sections.data[intent.body_start:intent.end].decode().strip().startswith("Ship the thing.")
+    assert sections.find("intent", level=3) is None
+    # A heading without its own body text is only closed, not given a paragraph
+    assert sections.find("details").first_paragraph == ""
+    assert title.end == len(DOC.encode())
+
+
+def test_find_prefix_respects_min_level():
+    sections = build_section_map(DOC)
+    assert sections.find_prefix(["proj"]).key == "project title"
+    assert sections.find_prefix(["proj"], min_level=2) is None
+    assert sections.find_prefix(["const", "det"], min_level=2).key == "details"
+
+
+def test_stream_section_map_stops_early():
+    seen = []
+
+    def lines():
+        for line in io.BytesIO(DOC.encode()):
+            seen.append(line)
+            yield line
+
+    sections = stream_section_map(lines(), stop=lambda m: m.find("intent") is not None and bool(m.find("intent").first_paragraph))
+
+    assert sections.data == b""
+    assert sections.find("intent").first_paragraph == "Ship the thing."
+    assert sections.find("constraints") is None
+    assert len(seen) < len(DOC.splitlines())
+
+
+def test_stream_section_map_caps_paragraph():
+    sections = stream_section_map(io.BytesIO(b"# A\n" + b"word\n" * 100), max_paragraph=20)
+    assert len(sections.find("a").first_paragraph) < 40
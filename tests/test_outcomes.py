@@ -0,0 +1,67 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from context_cli.outcomes import COUNTER_FILE, OutcomeError, create_outcome, find_repo_root
+
+
+def test_find_repo_root_walks_up(engagement):
+    nested = engagement / "docs" / "deep"
+    nested.mkdir(parents=True)
+    assert find_repo_root(nested) == engagement
+    assert find_repo_root(engagement.parent) is None
+
+
+def test_create_outcome_renders_template(engagement):
+    created = create_outcome(engagement, "authority-map")
+
+    assert created["outcome_id"] == "KO-001"
+    outcome_dir = engagement / ".context" / "outcomes" / "001-authority-map"
+    assert (outcome_dir / "checklists").is_dir()
+    text = (outcome_dir / "outcome.md").read_text()
+    assert "# Outcome: authority-map" in text
+    assert "**ID**: KO-001" in text
+    assert "[DATE]" not in text
+
+
+def test_create_outcome_numbers_increase(engagement):
+    assert create_outcome(engagement, "a")["outcome_id"] == "KO-001"
+    assert create_outcome(engagement, "b", number="005")["outcome_id"] == "KO-005"
+    assert create_outcome(engagement, "c")["outcome_id"] == "KO-006"
+
+
+def test_create_outcome_rescans_after_outside_change(engagement):
+    create_outcome(engagement, "a")
+    (engagement / ".context" / "outcomes" / "010-manual").mkdir()
+
+    assert create_outcome(engagement, "b")["outcome_id"] == "KO-011"
+    counter = json.loads((engagement / ".context" / "cache" / COUNTER_FILE).read_text())
+    assert counter["last"] == 11
+
+
+@pytest.mark.parametrize("name", ["Bad Name", "1abc", "under_score"])
+def test_create_outcome_rejects_invalid_names(engagement, name):
+    with pytest.raises(OutcomeError, match="Invalid short name"):
+        create_outcome(engagement, name)
+
+
+def test_create_outcome_requires_constitution(engagement):
+    (engagement / ".context" / "memory" / "constitution.md").unlink()
+    with pytest.raises(OutcomeError, match="Constitution not found"):
+        create_outcome(engagement, "a")
+
+
+def test_create_outcome_rejects_existing_directory(engagement):
+    create_outcome(engagement, "a", number="002")
+    with pytest.raises(OutcomeError, match="already exists"):
+        create_outcome(engagement, "a", number="002")
+
+
+def test_parallel_creation_never_reuses_a_number(engagement):
+    names = [f"outcome-{i}" for i in range(16)]
+    with ProcessPoolExecutor(max_workers=8) as pool:
+        created = list(pool.map(create_outcome, [engagement] * len(names), names))
+
+    ids = sorted(c["outcome_id"] for c in created)
+    assert ids == [f"KO-{i:03d}" for i in range(1, len(names) + 1)]
@@ -0,0 +1,123 @@
+import json
+
+from typer.testing import CliRunner
+
+from context_cli import app
+from context_cli.pack import MAX_CHUNK_TOKENS, PackStats, chunk_id, chunk_markdown, iter_pack
+from context_cli.tokenizers import count_tokens
+
+from conftest import write
+
+SHARED = "## Shared\n\nEvery refund above 500 EUR needs finance approval.\n"
+
+
+def pack_engagement(engagement):
+    write(engagement / ".context" / "memory" / "constitution.md", "# Constitution\n\nCapture what is true.\n")
+    write(engagement / ".context" / "outcomes" / "001-low" / "outcome.md", "# Low\n\n**Priority**: P3\n\nLow priority outcome.\n")
+    write(engagement / ".context" / "outcomes" / "002-high" / "outcome.md", "# High\n\n**Priority**: P1\n\nHigh priority outcome.\n")
+    write(engagement / "context-artifacts" / "processes" / "refunds.md", "# Refunds\n\nFor KO-002.\n\n" + SHARED)
+    write(engagement / "context-artifacts" / "decisions" / "pricing.md", "# Pricing\n\nUnlinked.\n\n" + SHARED)
+    return engagement
+
+
+def sources(chunks) -> list:
+    return list(dict.fromkeys(c.source for c in chunks))
+
+
+def test_chunk_id_ignores_whitespace():
+    assert chunk_id("a  b\n c") == chunk_id(" a b c ")
+    assert chunk_id("a b") != chunk_id("a c")
+
+
+def test_chunk_markdown_splits_at_top_level_headings():
+    data = b"Preamble\n\n# One\n\nBody one.\n\n### Detail\n\nStill one.\n\n## Two\n\nBody two.\n"
+    chunks = chunk_markdown(data)
+
+    assert [h for h, _, _ in chunks] == ["", "One", "Two"]
+    assert [data[s:e] for _, s, e in chunks][1] == b"# One\n\nBody one.\n\n### Detail\n\nStill one."
+
+
+def test_chunk_markdown_splits_long_sections_at_paragraphs():
+    paragraph = " ".join(["word"] * 200)
+    data = ("# Long\n\n" + "\n\n".join([paragraph] * 6)).encode()
+    chunks = chunk_markdown(data)
+
+    assert len(chunks) > 1
+    assert all(count_tokens(data[s:e].decode()) <= MAX_CHUNK_TOKENS for _, s, e in chunks)
+
+
+def test_pack_orders_by_priority_and_drops_duplicates(engagement):
+    pack_engagement(engagement)
+    stats = PackStats()
+
+    chunks = list(iter_pack(engagement, stats=stats))
+
+    assert sources(chunks) == [
+        ".context/memory/constitution.md",
+        ".context/outcomes/002-high/outcome.md",
+        "context-artifacts/processes/refunds.md",
+        ".context/outcomes/001-low/outcome.md",
+        "context-artifacts/decisions/pricing.md",
+    ]
+    assert [c.text for c in chunks].count(SHARED.strip()) == 1
+    assert stats.duplicates == 1
+    assert stats.tokens == sum(c.tokens for c in chunks)
+
+
+def test_pack_stops_at_first_chunk_over_budget(engagement):
+    pack_engagement(engagement)
+    everything = list(iter_pack(engagement))
+    budget = sum(c.tokens for c in everything[:2]) + everything[2].tokens - 1
+    stats = PackStats()
+
+    chunks = list(iter_pack(engagement, budget=budget, stats=stats))
+
+    assert chunks == everything[:2]
+    assert stats.over_budget == [c.id for c in everything[2:]]
+
+
+def test_pack_rechunks_only_changed_sources(engagement):
+    pack_engagement(engagement)
+    list(iter_pack(engagement))
+    stats = PackStats()
+    list(iter_pack(engagement, stats=stats))
+    assert stats.regenerated == 0
+
+    write(engagement / "context-artifacts" / "decisions" / "pricing.md", "# Pricing\n\nNow linked to KO-001.\n")
+    stats = PackStats()
+    chunks = list(iter_pack(engagement, stats=stats))
+    assert stats.regenerated == 1
+    assert "Now linked to KO-001." in chunks[-1].text
+
+
+def test_source_changed_while_packing_is_reported(engagement):
+    pack_engagement(engagement)
+    stats = PackStats()
+    chunks = iter_pack(engagement, stats=stats)
+    first = next(chunks)
+
+    write(engagement / "context-artifacts" / "processes" / "refunds.md", "# Refunds\n\nRewritten while packing.\n\n" + SHARED)
+    rest = list(chunks)
+
+    assert first.source == ".context/memory/constitution.md"
+    assert stats.stale == ["context-artifacts/processes/refunds.md"]
+    assert "context-artifacts/processes/refunds.md" not in sources(rest)
+    # The identical chunk from a later source is not mistaken for a duplicate
+    assert [c.source for c in rest if c.text == SHARED.strip()] == ["context-artifacts/decisions/pricing.md"]
+    assert stats.duplicates == 0
+
+
+def test_pack_cli_writes_jsonl_and_reports_bad_output(engagement, monkeypatch):
+    pack_engagement(engagement)
+    monkeypatch.chdir(engagement)
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["--plain", "pack", "--format", "jsonl", "--output", "pack.jsonl"])
+    assert result.exit_code == 0, result.output
+    lines = (engagement / "pack.jsonl").read_text().splitlines()
+    assert json.loads(lines[0])["source"] == ".context/memory/constitution.md"
+
+    result = runner.invoke(app, ["--plain", "pack", "--output", str(engagement / "missing" / "pack.md")])
+    assert result.exit_code == 1
+    assert "Error: Cannot write" in result.output
+    assert result.exception is None or isinstance(result.exception, SystemExit)
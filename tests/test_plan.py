@@ -0,0 +1,86 @@
+import pytest
+
+from context_cli.plan import PlanError, build_plan, plan_outcome, resolve_outcome
+from context_cli.tasks import parse_tasks_lines
+
+from conftest import write
+
+
+def plan_for(text: str):
+    return build_plan(parse_tasks_lines(text.splitlines()).tasks, "001-test")
+
+
+def test_waves_follow_serial_parallel_and_phase_order():
+    plan = plan_for(
+        "## Phase 1: Setup\n"
+        "- [x] T001 Create files\n"
+        "- [ ] T002 [P] Draft glossary\n"
+        "- [ ] T003 [P] Draft processes\n"
+        "## Phase 2: Core\n"
+        "- [ ] T004 Interview\n"
+        "- [ ] T005 Synthesize\n"
+        "## Phase 3: Review\n"
+        "- [ ] T006 [P] Review\n"
+    )
+
+    assert plan.waves == [["T002", "T003"], ["T004"], ["T005"], ["T006"]]
+    assert plan.next_batch == ["T002", "T003"]
+    assert plan.deps["T005"] == {"T001", "T002", "T003", "T004"}
+    assert plan.critical_path == ["T002", "T004", "T005", "T006"]
+
+
+def test_blocking_tasks_gate_next_phase():
+    plan = plan_for(
+        "## Phase 1: Setup\n"
+        "- [x] T001 [B] Agree scope\n"
+        "- [ ] T002 Nice to have\n"
+        "## Phase 2: Core\n"
+        "- [ ] T003 [P] Capture\n"
+    )
+
+    assert plan.deps["T003"] == {"T001"}
+    assert plan.waves == [["T002", "T003"]]
+
+
+def test_critical_path_is_longest_chain():
+    plan = plan_for(
+        "## Phase 1: A\n"
+        "- [ ] T001 [P] Short\n"
+        "- [ ] T002 One\n"
+        "- [ ] T003 Two\n"
+        "- [ ] T004 Three\n"
+    )
+
+    assert plan.waves == [["T001", "T002"], ["T003"], ["T004"]]
+    assert plan.critical_path == ["T002", "T003", "T004"]
+
+
+def test_all_done_has_empty_schedule():
+    plan = plan_for("## Phase 1: A\n- [x] T001 Done\n")
+    assert plan.waves == [] and plan.critical_path == [] and plan.next_batch == []
+
+
+def test_duplicate_ids_are_kept_apart():
+    plan = plan_for("- [ ] T001 First\n- [ ] T001 Again\n")
+    assert list(plan.tasks) == ["T001", "T001@L2"]
+    assert plan.waves == [["T001"], ["T001@L2"]]
+
+
+def test_resolve_outcome_by_number_and_name(engagement):
+    outcome_dir = engagement / ".context" / "outcomes" / "007-brand-voice"
+    outcome_dir.mkdir()
+
+    for ref in ("7", "007", "KO-007", "ko-7", "brand-voice", "007-brand-voice"):
+        assert resolve_outcome(engagement, ref) == outcome_dir
+    with pytest.raises(PlanError):
+        resolve_outcome(engagement, "8")
+
+
+def test_plan_outcome_requires_tasks(engagement):
+    outcome_dir = engagement / ".context" / "outcomes" / "001-a"
+    outcome_dir.mkdir()
+    with pytest.raises(PlanError, match="no tasks.md"):
+        plan_outcome(engagement, "1")
+
+    write(outcome_dir / "tasks.md", "- [ ] T001 Go\n")
+    assert plan_outcome(engagement, "1").waves == [["T001"]]
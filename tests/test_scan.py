@@ -0,0 +1,58 @@
+import json
+
+from typer.testing import CliRunner
+
+from context_cli import app
+from context_cli.scanner import find_engagements
+from context_cli.status import scan_engagements
+
+from conftest import write
+
+
+def engagement_at(root, rel, tasks=None):
+    path = root / rel if rel else root
+    (path / ".context" / "memory").mkdir(parents=True)
+    if tasks:
+        write(path / ".context" / "outcomes" / "001-a" / "tasks.md", tasks)
+    return path
+
+
+def monorepo(root):
+    engagement_at(root, "")
+    engagement_at(root, "teams/sales", tasks="- [x] T001 One\n- [ ] T002 Two\n")
+    engagement_at(root, "teams/support", tasks="- [x] T001 One\n")
+    engagement_at(root, "node_modules/pkg")
+    engagement_at(root, "a/b/c/d")
+    # Not an engagement: .context/ without the framework layout
+    (root / "other" / ".context").mkdir(parents=True)
+    return root
+
+
+def test_find_engagements_prunes(tmp_path):
+    found = find_engagements(monorepo(tmp_path))
+    assert found == [tmp_path, tmp_path / "a" / "b" / "c" / "d", tmp_path / "teams" / "sales", tmp_path / "teams" / "support"]
+
+    found = find_engagements(tmp_path, excludes=["teams/sales"], max_depth=2)
+    assert found == [tmp_path, tmp_path / "teams" / "support"]
+
+
+def test_scan_engagements_totals(tmp_path):
+    report = scan_engagements(monorepo(tmp_path), workers=4)
+
+    assert [e["relative_path"] for e in report["engagements"]] == [".", "a/b/c/d", "teams/sales", "teams/support"]
+    totals = report["totals"]
+    assert (totals["engagements"], totals["outcomes"], totals["outcomes_complete"]) == (4, 2, 0)
+    assert (totals["tasks_total"], totals["tasks_done"]) == (3, 2)
+
+
+def test_scan_cli(tmp_path):
+    monorepo(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["scan", str(tmp_path), "--json"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["totals"]["engagements"] == 4
+
+    result = runner.invoke(app, ["--plain", "scan", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[-1] == "4 engagements, 0/2 outcomes complete, 2/3 tasks done, 0 artifacts"
@@ -0,0 +1,74 @@
+from context_cli.scanner import SNIFF_BYTES, read_lines, read_many, read_text_head, scan_project_docs
+
+from conftest import write
+
+
+def docs_tree(root):
+    for rel in (
+        "README.md", "NOTES.txt", "setup.py",
+        "docs/guide.md", "docs/notes.txt", "docs/api/index.md", "docs/a/b/c/deep.md",
+        "docs/node_modules/pkg/README.md", "docs/drafts/old.md",
+        ".github/CONTRIBUTING.md", ".claude/CLAUDE.md", "src/ignored.md",
+    ):
+        write(root / rel, "# Doc\n")
+    return root
+
+
+def test_scan_collects_docs_in_discovery_order(tmp_path):
+    scan = scan_project_docs(docs_tree(tmp_path))
+
+    assert scan.docs == [
+        "README.md", "NOTES.txt",
+        "docs/guide.md", "docs/a/b/c/deep.md", "docs/api/index.md", "docs/drafts/old.md", "docs/notes.txt",
+        ".claude/CLAUDE.md", ".github/CONTRIBUTING.md",
+    ]
+    assert {"README.md", "docs", "src", ".github"} <= scan.root_entries
+    assert not scan.truncated
+
+
+def test_scan_prunes_excludes_and_depth(tmp_path):
+    scan = scan_project_docs(docs_tree(tmp_path), excludes=["drafts", ".claude"], max_depth=2)
+
+    assert "docs/drafts/old.md" not in scan.docs
+    assert ".claude/CLAUDE.md" not in scan.docs
+    assert "docs/api/index.md" in scan.docs
+    assert "docs/a/b/c/deep.md" not in scan.docs
+
+
+def test_scan_stops_at_max_files(tmp_path):
+    scan = scan_project_docs(docs_tree(tmp_path), max_files=3)
+    assert scan.docs == ["README.md", "NOTES.txt", "docs/guide.md"]
+    assert scan.truncated
+
+
+def test_read_many_preserves_order_and_returns_errors(tmp_path):
+    paths = [write(tmp_path / f"{i}.md", str(i)) for i in range(10)] + [tmp_path / "missing.md"]
+
+    results = read_many(paths, lambda p: p.read_text(), max_workers=4)
+
+    assert results[:10] == [str(i) for i in range(10)]
+    assert isinstance(results[10], FileNotFoundError)
+
+
+def test_read_lines_stops_at_byte_cap(tmp_path):
+    path = write(tmp_path / "big.md", "line\n" * 1000)
+
+    assert list(read_lines(path, max_bytes=12)) == [b"line\n", b"line\n", b"li"]
+    assert len(list(read_lines(path))) == 1000
+
+
+def test_read_lines_cuts_off_long_lines(tmp_path):
+    path = write(tmp_path / "long.md", "# Title\n" + "x" * 100 + "\nafter\n")
+
+    assert list(read_lines(path, max_line=10)) == [b"# Title\n", b"x" * 10, b"after\n"]
+
+
+def test_binary_files_are_skipped(tmp_path):
+    path = tmp_path / "image.md"
+    path.write_bytes(b"# Not text\n\0\1\2")
+    late = tmp_path / "late.md"
+    late.write_bytes(b"a\n" * SNIFF_BYTES + b"\0")
+
+    assert list(read_lines(path)) == []
+    assert read_text_head(path) == ""
+    assert read_text_head(late, max_bytes=4) == "a\na\n"
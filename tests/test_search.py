@@ -0,0 +1,82 @@
+import json
+import os
+
+from typer.testing import CliRunner
+
+from context_cli import app
+from context_cli.search import SearchIndex, document_terms, snippet, tokenize
+
+from conftest import touch_later, write
+
+
+def artifacts(engagement):
+    root = engagement / "context-artifacts"
+    write(root / "processes" / "refunds.md", "# Refund Process\n\nIntro.\n\n## Approval\n\nRefund approval needs finance sign-off above 500 EUR.\n")
+    write(root / "decisions" / "pricing.md", "# Pricing\n\nWe decided list prices; a refund is rare.\n")
+    write(root / "systems" / "crm.md", "# CRM\n\nCustomer records live in the CRM.\n")
+    return root
+
+
+def test_tokenize_drops_stopwords_and_single_chars():
+    assert tokenize("The Refund is a 2-step process") == ["refund", "step", "process"]
+
+
+def test_heading_terms_count_double():
+    terms = document_terms(b"# Refund policy\n\nA refund.\n")
+    assert terms["refund"] == 3 and terms["policy"] == 2
+
+
+def test_search_ranks_with_bm25(engagement):
+    artifacts(engagement)
+    with SearchIndex(engagement) as index:
+        assert index.update()["added"] == 3
+        results = index.search("refund approval")
+
+    assert [r.path.name for r in results] == ["refunds.md", "pricing.md"]
+    assert results[0].title == "Refund Process"
+    assert results[0].heading == "Refund Process > Approval"
+    assert results[0].snippet.startswith("Refund approval needs finance")
+    assert results[0].score > results[1].score
+
+
+def test_search_without_matches(engagement):
+    artifacts(engagement)
+    with SearchIndex(engagement) as index:
+        index.update()
+        assert index.search("the of") == []
+        assert index.search("kubernetes") == []
+
+
+def test_update_only_reindexes_changes(engagement):
+    root = artifacts(engagement)
+    with SearchIndex(engagement) as index:
+        index.update()
+
+    crm = root / "systems" / "crm.md"
+    touch_later(crm)
+    write(root / "decisions" / "pricing.md", "# Pricing\n\nDiscounts need approval.\n")
+    touch_later(root / "decisions" / "pricing.md")
+    os.remove(root / "processes" / "refunds.md")
+    write(root / "glossaries" / "terms.md", "# Terms\n")
+
+    with SearchIndex(engagement) as index:
+        stats = index.update()
+        assert stats == {"added": 1, "updated": 1, "touched": 1, "removed": 1, "unchanged": 0}
+        assert [r.path.name for r in index.search("approval")] == ["pricing.md"]
+        assert index.search("refund") == []
+
+
+def test_snippet_of_missing_file(tmp_path):
+    assert snippet(tmp_path / "gone.md", ["refund"]) == ("", "")
+
+
+def test_search_cli(engagement, monkeypatch):
+    artifacts(engagement)
+    monkeypatch.chdir(engagement)
+
+    result = CliRunner().invoke(app, ["search", "crm", "--json"])
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["query"] == "crm"
+    assert [r["path"] for r in data["results"]] == ["context-artifacts/systems/crm.md"]
@@ -0,0 +1,72 @@
+import json
+
+from typer.testing import CliRunner
+
+from context_cli import app
+from context_cli.status import collect_status, format_status, iter_ndjson_records, split_outcome_name
+
+from conftest import write
+
+runner = CliRunner()
+
+
+def populate(engagement):
+    outcomes = engagement / ".context" / "outcomes"
+    write(outcomes / "001-brand-voice" / "outcome.md", "# Brand voice\n")
+    write(outcomes / "001-brand-voice" / "strategy.md", "# Strategy\n")
+    write(outcomes / "001-brand-voice" / "tasks.md", "## Phase 1: Go\n- [x] T001 One\n- [x] T002 Two\n")
+    write(outcomes / "002-refunds" / "outcome.md", "# Refunds\n")
+    write(engagement / ".context" / "scripts" / "bash" / "common.sh", "")
+    write(engagement / "context-artifacts" / "processes" / "refund.md", "# Refund\n")
+    write(engagement / "context-artifacts" / "notes.md", "# Loose\n")
+    return engagement
+
+
+def test_split_outcome_name():
+    assert split_outcome_name("001-brand-voice") == ("KO-001", "brand-voice")
+    assert split_outcome_name("007") == ("KO-007", "007")
+
+
+def test_collect_status(engagement):
+    status = collect_status(populate(engagement))
+
+    assert status["initialized"] and status["constitution"]
+    assert (status["templates"], status["scripts"]) == (1, 1)
+    assert [(o["id"], o["status"]) for o in status["outcomes"]] == [("KO-001", "complete"), ("KO-002", "needs strategy")]
+    assert status["tasks"] == {"total": 2, "done": 2}
+    assert status["artifacts"]["total"] == 2
+    assert status["artifacts"]["categories"]["processes"] == 1
+    assert status["artifacts"]["categories"]["uncategorized"] == 1
+
+
+def test_collect_status_outside_engagement(tmp_path):
+    status = collect_status(tmp_path)
+    assert not status["initialized"] and status["outcomes"] == []
+
+
+def test_ndjson_has_one_record_per_outcome(engagement):
+    status = collect_status(populate(engagement))
+
+    records = [json.loads(line) for line in format_status(status, "ndjson").splitlines()]
+
+    assert records == list(iter_ndjson_records(status))
+    assert [r["type"] for r in records] == ["engagement", "outcome", "outcome"]
+    assert records[0]["outcome_count"] == 2
+
+
+def test_text_format(engagement):
+    text = format_status(collect_status(populate(engagement)), "text")
+    assert "tasks: 2/2" in text
+    assert "  KO-002\trefunds\tneeds strategy\t-" in text
+
+
+def test_status_cli(engagement, tmp_path_factory):
+    result = runner.invoke(app, ["status", str(populate(engagement)), "--json"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["tasks"]["done"] == 2
+
+    result = runner.invoke(app, ["status", str(tmp_path_factory.mktemp("empty"))])
+    assert result.exit_code == 1
+    assert "initialized: no" in result.output
+
+    assert runner.invoke(app, ["status", "--format", "yaml"]).exit_code == 1
@@ -0,0 +1,64 @@
+from context_cli import StepTracker
+
+
+def tracker_with_files(count, threshold=3):
+    tracker = StepTracker("Copy", collapse_threshold=threshold)
+    tracker.add("setup", "Set up")
+    tracker.add_group("files", "Copy files")
+    for i in range(count):
+        tracker.add(f"f{i}", f"file{i}.md", group="files")
+    return tracker
+
+
+def test_small_groups_are_listed_step_by_step():
+    tracker = tracker_with_files(3)
+    tracker.complete("f0", "copied")
+
+    assert tracker.render_plain().splitlines() == [
+        "Copy",
+        "  ○ Set up",
+        "  ● file0.md (copied)",
+        "  ○ file1.md",
+        "  ○ file2.md",
+    ]
+
+
+def test_large_groups_collapse_into_a_counter():
+    tracker = tracker_with_files(50)
+    for i in range(10):
+        tracker.complete(f"f{i}")
+    tracker.error("f10", "denied")
+    tracker.skip("f11")
+    tracker.start("f12")
+
+    assert tracker.render_plain().splitlines() == [
+        "Copy",
+        "  ○ Set up",
+        "  ○ Copy files (12/50, 1 failed, 1 skipped, file12.md)",
+    ]
+
+    for i in range(12, 50):
+        tracker.complete(f"f{i}")
+    assert tracker.render_plain().splitlines()[-1] == "  ✗ Copy files (50/50, 1 failed, 1 skipped)"
+
+
+def test_collapsed_group_renders_progress_bar():
+    tracker = tracker_with_files(20)
+    for i in range(10):
+        tracker.complete(f"f{i}")
+
+    lines = [str(node.label) for node in tracker.render().children]
+
+    assert len(lines) == 2
+    assert "Copy files" in lines[1] and "━" * 10 in lines[1]
+
+
+def test_durations_and_unknown_keys():
+    tracker = StepTracker("Init")
+    tracker.add("git", "Git")
+    tracker.start("git")
+    tracker.complete("git")
+    tracker.complete("late", "added on update")
+
+    assert set(tracker.durations()) == {"git"}
+    assert tracker.render_plain().splitlines()[-1] == "  ● late (added on update)"
@@ -0,0 +1,64 @@
+from context_cli.tasks import parse_tasks, parse_tasks_lines
+
+from conftest import write
+
+TASKS = """\
+# Tasks: KO-001
+
+## Phase 1: Setup
+
+- [x] T001 Create the glossary file
+- [ ] T002 [P] [KO-002] Draft the refund terms
+  - [x] Collect sources
+  - Note from the interview
+- [ ] T003 [B] Review with finance
+
+**Checkpoint**:
+- [ ] Glossary reviewed
+
+---
+
+## Phase 2: Capture
+
+```markdown
+- [ ] T999 Example inside a fence
+```
+
+- [X] T004 Write the process
+
+## Task Legend
+
+- [ ] Legend entry
+"""
+
+
+def test_parse_tasks_phases_and_markers():
+    tasks = parse_tasks_lines(TASKS.splitlines())
+
+    assert [t.id for t in tasks.tasks] == ["T001", "T002", "T003", "T004", None]
+    assert [p.label for p in tasks.phases] == ["Phase 1: Setup", "Phase 2: Capture"]
+    t002 = tasks.task("T002")
+    assert t002.parallel and not t002.blocking
+    assert t002.outcome_refs == ["KO-002"]
+    assert [s.text for s in t002.subtasks] == ["Collect sources"]
+    assert t002.notes == ["Note from the interview"]
+    assert tasks.task("T003").blocking
+    assert tasks.task("T004").done and tasks.task("T004").phase == 2
+    # A non-phase section ends the phase; the fenced example is not a task
+    assert tasks.tasks[-1].phase is None
+    assert tasks.task("T999") is None
+
+
+def test_parse_tasks_checkpoints_and_summary():
+    tasks = parse_tasks_lines(TASKS.splitlines())
+
+    assert [c.text for c in tasks.checkpoints] == ["Glossary reviewed"]
+    summary = tasks.summary()
+    assert (summary["total"], summary["done"]) == (5, 2)
+    assert summary["checkpoints_total"] == 1
+    assert summary["current_phase"]["label"] == "Phase 1: Setup"
+
+
+def test_parse_tasks_file(tmp_path):
+    path = write(tmp_path / "tasks.md", TASKS)
+    assert parse_tasks(path).total == 5
@@ -0,0 +1,162 @@
+import hashlib
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from context_cli import templates
+from context_cli.templates import (
+    MANIFEST_FILE,
+    TemplateProvider,
+    build_bundle,
+    get_template_provider,
+    shipped_hashes,
+    sync_templates,
+)
+
+from conftest import touch_later, write
+
+
+def packaged(root):
+    tpl = root / "pkg" / ".context" / "templates"
+    write(tpl / "outcome-template.md", "# Outcome v1\n")
+    write(tpl / "commands" / "context.outcome.md", "Command v1\n")
+    write(tpl.parent / "scripts" / "bash" / "common.sh", "echo v1\n")
+    return tpl
+
+
+def sync(tpl, context_dir, **kwargs):
+    return sync_templates(TemplateProvider.from_directory(tpl), context_dir, **kwargs)
+
+
+def test_sync_installs_then_skips_unchanged(tmp_path):
+    tpl = packaged(tmp_path)
+    context_dir = tmp_path / "eng" / ".context"
+
+    result = sync(tpl, context_dir)
+    assert sorted(result.added) == ["scripts/bash/common.sh", "templates/commands/context.outcome.md", "templates/outcome-template.md"]
+    assert (context_dir / "templates" / "outcome-template.md").read_text() == "# Outcome v1\n"
+    assert (context_dir / MANIFEST_FILE).is_file()
+
+    result = sync(tpl, context_dir)
+    assert len(result.unchanged) == 3 and not result.changed
+
+
+def test_sync_updates_untouched_and_keeps_local_edits(tmp_path):
+    tpl = packaged(tmp_path)
+    context_dir = tmp_path / "eng" / ".context"
+    sync(tpl, context_dir)
+
+    edited = write(context_dir / "templates" / "outcome-template.md", "# My outcome\n")
+    result = sync(tpl, context_dir)
+    assert result.modified == ["templates/outcome-template.md"]
+
+    write(tpl / "outcome-template.md", "# Outcome v2\n")
+    write(tpl / "commands" / "context.outcome.md", "Command v2\n")
+    touch_later(tpl / "commands" / "context.outcome.md")
+
+    result = sync(tpl, context_dir, dry_run=True)
+    assert result.updated == ["templates/commands/context.outcome.md"]
+    assert result.conflicts == ["templates/outcome-template.md"]
+    assert (context_dir / "templates" / "commands" / "context.outcome.md").read_text() == "Command v1\n"
+
+    result = sync(tpl, context_dir)
+    assert (context_dir / "templates" / "commands" / "context.outcome.md").read_text() == "Command v2\n"
+    assert edited.read_text() == "# My outcome\n"
+
+    result = sync(tpl, context_dir, force=True)
+    assert result.overwritten == ["templates/outcome-template.md"]
+    assert edited.read_text() == "# Outcome v2\n"
+
+
+def test_sync_without_manifest_uses_shipped_history(tmp_path, monkeypatch):
+    tpl = packaged(tmp_path)
+    context_dir = tmp_path / "eng" / ".context"
+    # An engagement from before the manifest: one old shipped version, one local edit
+    write(context_dir / "templates" / "outcome-template.md", "# Outcome v0\n")
+    write(context_dir / "scripts" / "bash" / "common.sh", "echo mine\n")
+    old = hashlib.sha256(b"# Outcome v0\n").hexdigest()
+    monkeypatch.setattr(templates, "shipped_hashes", lambda: {"templates/outcome-template.md": frozenset([old])})
+
+    result = sync(tpl, context_dir)
+
+    assert result.updated == ["templates/outcome-template.md"]
+    assert result.conflicts == ["scripts/bash/common.sh"]
+    assert result.added == ["templates/commands/context.outcome.md"]
+
+
+def test_shipped_history_covers_current_templates():
+    provider = get_template_provider()
+    history = shipped_hashes()
+
+    missing = [rel for rel, src in provider.sources.items() if src.hash() not in history.get(rel, ())]
+
+    assert missing == [], "add the new hashes to src/context_cli/templates.history.json"
+
+
+def test_broken_manifest_is_ignored(tmp_path):
+    tpl = packaged(tmp_path)
+    context_dir = tmp_path / "eng" / ".context"
+    sync(tpl, context_dir)
+    write(context_dir / MANIFEST_FILE, "{not json")
+
+    result = sync(tpl, context_dir)
+
+    assert len(result.unchanged) == 3
+    assert json.loads((context_dir / MANIFEST_FILE).read_text())["files"]
+
+
+def test_bundle_round_trip(tmp_path):
+    tpl = packaged(tmp_path)
+    bundle = build_bundle(tpl)
+
+    provider = TemplateProvider.from_bundle(json.dumps(bundle).encode())
+
+    assert sorted(provider.sources) == sorted(TemplateProvider.from_directory(tpl).sources)
+    assert provider.read_text("templates/outcome-template.md") == "# Outcome v1\n"
+    src = provider.sources["scripts/bash/common.sh"]
+    assert src.hash() == hashlib.sha256(b"echo v1\n").hexdigest()
+
+    # Installing from the bundle gives the same files as from the directory
+    context_dir = tmp_path / "eng" / ".context"
+    assert len(sync_templates(provider, context_dir).added) == 3
+    assert (context_dir / "scripts" / "bash" / "common.sh").read_text() == "echo v1\n"
+
+
+def test_bundle_version_is_checked():
+    with pytest.raises(ValueError, match="bundle version"):
+        TemplateProvider.from_bundle(json.dumps({"version": 99, "files": {}}).encode())
+
+
+def test_preload_reads_each_file_once(tmp_path):
+    tpl = packaged(tmp_path)
+    provider = TemplateProvider.from_directory(tpl).preload()
+
+    (tpl / "outcome-template.md").unlink()
+
+    assert provider.read_text("templates/outcome-template.md") == "# Outcome v1\n"
+    assert provider.has("templates/commands/context.outcome.md")
+
+
+def test_provider_is_resolved_once():
+    assert get_template_provider() is get_template_provider()
+    assert get_template_provider().origin == "source"
+
+
+def test_hatch_hook_writes_bundle_into_wheel(tmp_path):
+    pytest.importorskip("hatchling")
+    root = Path(__file__).resolve().parents[1]
+    spec = importlib.util.spec_from_file_location("hatch_build", root / "hatch_build.py")
+    hatch_build = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(hatch_build)
+
+    hook = hatch_build.TemplateBundleHook(str(root), {}, None, None, str(tmp_path), "wheel")
+    build_data = {"force_include": {}}
+
+    hook.initialize("standard", build_data)
+
+    ((path, target),) = build_data["force_include"].items()
+    assert target == "context_cli/templates.bundle.json"
+    bundle = TemplateProvider.from_bundle(Path(path).read_bytes())
+    assert sorted(bundle.sources) == sorted(get_template_provider().sources)
@@ -0,0 +1,71 @@
+import importlib
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+import context_cli
+from context_cli import app
+from context_cli.trace import Tracer, traced
+
+trace = importlib.import_module("context_cli.trace")
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    fresh = Tracer()
+    monkeypatch.setattr(trace, "tracer", fresh)
+    monkeypatch.setattr(context_cli, "tracer", fresh)
+    return fresh
+
+
+def test_disabled_tracer_records_nothing(tracer):
+    with tracer.span("work"):
+        pass
+    tracer.begin("step", "step")
+    tracer.end("step")
+    assert tracer.events == []
+
+
+def test_spans_and_instants(tracer):
+    tracer.enable()
+    with tracer.span("outer", cat="io", files=3):
+        tracer.begin("step", "copy")
+        tracer.end("step", detail="ok")
+    tracer.end("never-opened", "marker")
+
+    events = {e["name"]: e for e in tracer.to_chrome()["traceEvents"]}
+    assert events["outer"]["ph"] == "X" and events["outer"]["cat"] == "io"
+    assert events["outer"]["args"] == {"files": 3}
+    assert events["copy"]["ph"] == "X" and events["copy"]["args"] == {"detail": "ok"}
+    assert events["marker"]["ph"] == "i"
+    assert events["outer"]["dur"] >= events["copy"]["dur"]
+
+
+def test_traced_decorator_and_summary(tracer):
+    @traced("parse")
+    def parse(x):
+        return x * 2
+
+    assert parse(2) == 4
+    assert tracer.events == []
+
+    tracer.enable()
+    for i in range(3):
+        parse(i)
+
+    ((name, calls, total_ms, max_ms),) = tracer.summary()
+    assert (name, calls) == ("parse", 3)
+    assert total_ms >= max_ms
+    assert tracer.format_summary().splitlines()[1].startswith("parse")
+
+
+def test_trace_option_writes_chrome_trace(tracer, engagement, tmp_path_factory, monkeypatch):
+    monkeypatch.chdir(engagement)
+    out = tmp_path_factory.mktemp("trace") / "trace.json"
+
+    result = CliRunner().invoke(app, ["--trace", str(out), "status", "--json"])
+
+    assert result.exit_code == 0, result.output
+    names = {e["name"] for e in json.loads(out.read_text())["traceEvents"]}
+    assert {"companyspec status", "collect_status"} <= names
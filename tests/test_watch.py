@@ -0,0 +1,71 @@
+from context_cli.watch import RESCAN, EngagementWatch, EngagementWatcher, PollingWatcher
+
+from conftest import touch_later, write
+
+
+def test_polling_waits_for_the_full_interval(tmp_path, monkeypatch):
+    slept = []
+    monkeypatch.setattr("time.sleep", slept.append)
+
+    watcher = PollingWatcher([tmp_path], interval=5.0)
+    path = write(tmp_path / "a.md", "a")
+
+    assert watcher.wait(5.0) == {path}
+    assert slept == [5.0]
+
+
+def test_polling_reports_changes_and_removals(tmp_path, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda _: None)
+    path = write(tmp_path / "a.md", "a")
+    watcher = PollingWatcher([tmp_path])
+
+    assert watcher.wait(0) == set()
+    write(path, "changed")
+    assert watcher.wait(0) == {path}
+    path.unlink()
+    assert watcher.wait(0) == {path}
+
+
+def test_engagement_watch_updates_one_outcome(engagement):
+    outcome_dir = engagement / ".context" / "outcomes" / "001-a"
+    tasks = write(outcome_dir / "tasks.md", "- [ ] T001 One\n")
+    state = EngagementWatch(engagement)
+    assert state.outcomes["001-a"]["tasks"]["done"] == 0
+
+    write(tasks, "- [x] T001 One\n")
+    touch_later(tasks)
+
+    assert state.apply({tasks}) == ["updated outcome 001-a"]
+    assert state.outcomes["001-a"]["tasks"]["done"] == 1
+    assert state.apply(RESCAN) == ["full rescan"]
+
+
+def test_engagement_watch_tracks_artifacts(engagement):
+    state = EngagementWatch(engagement)
+    path = write(engagement / "context-artifacts" / "processes" / "refunds.md", "# Refunds\n")
+
+    assert state.apply({path.parent}) == ["added artifact processes/refunds.md"]
+    assert state.artifact_counts() == {"processes": 1}
+
+    path.unlink()
+    assert state.apply({path}) == ["removed artifact processes/refunds.md"]
+    assert state.artifact_counts() == {}
+
+
+def test_watcher_picks_up_roots_created_later(engagement, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda _: None)
+    state = EngagementWatch(engagement)
+    watcher = EngagementWatcher(state, poll=True, interval=10.0)
+    assert watcher.roots == [engagement / ".context" / "outcomes"]
+
+    path = write(engagement / "context-artifacts" / "decisions" / "pricing.md", "# Pricing\n")
+    assert watcher.wait() is RESCAN
+    state.apply(RESCAN)
+    assert watcher.roots == [engagement / ".context" / "outcomes", engagement / "context-artifacts"]
+    assert path in state.artifacts
+
+    # Files under the new root are now watched
+    write(path, "# Pricing v2\n")
+    touch_later(path)
+    assert watcher.wait() == {path}
+    watcher.close()